@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Shared configuration and fixtures for the performance benchmarks
+
+Run the suite with ``pytest benchmarks``. Baselines are machine specific, so they are stored
+locally in ``benchmarks/baselines`` and not checked in. Record one from a clean checkout of the
+commit to compare against:
+
+    pytest benchmarks --benchmark-save=baseline
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+
+# Standard library modules
+from pathlib import Path
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data.mock import MessageGenerator
+from snews.models.messages import (CoincidenceTierMessage, HeartbeatMessage,
+                                   RetractionMessage, SignificanceTierMessage,
+                                   TimingTierMessage)
+
+BASELINE_STORAGE = Path(__file__).parent / "baselines"
+DEFAULT_STORAGE = "file://./.benchmarks"
+
+MESSAGE_TYPES = {
+    "Heartbeat": HeartbeatMessage,
+    "Retraction": RetractionMessage,
+    "TimingTier": TimingTierMessage,
+    "SignificanceTier": SignificanceTierMessage,
+    "CoincidenceTier": CoincidenceTierMessage,
+}
+
+
+# .................................................................................................
+def pytest_configure(config):
+    # Store and compare against the local baselines unless told otherwise
+    if config.getoption("benchmark_storage", default=None) == DEFAULT_STORAGE:
+        config.option.benchmark_storage = f"file://{BASELINE_STORAGE}"
+
+
+# .................................................................................................
+@pytest.fixture(scope="session")
+def generator():
+    return MessageGenerator(seed=2024, start="2024-01-01T00:00:00")
+
+
+@pytest.fixture(scope="session")
+def payloads(generator):
+    """One representative payload per message tier."""
+    messages = generator.stream(duration_sec=600, scale=10, hits_per_burst=100)
+
+    payloads = {}
+    for message in messages:
+        payloads.setdefault(message["tier"], message)
+
+    return payloads
+
+
+@pytest.fixture(scope="session")
+def message_models(payloads):
+    """A few thousand validated messages of mixed tiers."""
+    return [
+        MESSAGE_TYPES[tier](**payload)
+        for tier, payload in payloads.items()
+        for _ in range(500)
+    ]
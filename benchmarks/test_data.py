@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Standard library modules
+import importlib
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data import compression, detectors
+from snews.data.io import encode_record
+from snews.data.utilities import query
+from snews.models.messages import parse_message
+
+from .conftest import MESSAGE_TYPES
+
+
+# .................................................................................................
+def test_bench_detector_registry_import(benchmark):
+    module = benchmark(importlib.reload, detectors)
+    assert module.names
+
+
+# .................................................................................................
+def test_bench_query_detectors_by_value(benchmark):
+    benchmark(query, detectors.all, {"name": "Super-K"})
+
+
+# .................................................................................................
+def test_bench_query_detectors_by_key(benchmark):
+    benchmark(query, detectors.all, "name")
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def encoded_payloads(payloads):
+    """Serialized messages of every tier, as the models write them."""
+    return {
+        tier: encode_record(parse_message(payload).model_dump(mode="json"))
+        for tier, payload in payloads.items()
+    }
+
+
+# .................................................................................................
+@pytest.mark.parametrize("dictionary", [True, False], ids=["dictionary", "plain"])
+@pytest.mark.parametrize("tier", MESSAGE_TYPES)
+def test_bench_compress_message(benchmark, encoded_payloads, tier, dictionary):
+    zstandard = pytest.importorskip("zstandard")
+
+    payload = encoded_payloads[tier]
+    compress = compression.compress if dictionary else zstandard.ZstdCompressor(level=3).compress
+
+    frame = benchmark(compress, payload)
+    benchmark.extra_info["bytes"] = len(payload)
+    benchmark.extra_info["compressed_bytes"] = len(frame)
+    benchmark.extra_info["ratio"] = len(payload) / len(frame)
+
+
+# .................................................................................................
+@pytest.mark.parametrize("tier", MESSAGE_TYPES)
+def test_bench_decompress_message(benchmark, encoded_payloads, tier):
+    pytest.importorskip("zstandard")
+
+    frame = compression.compress(encoded_payloads[tier])
+
+    assert benchmark(compression.decompress, frame) == encoded_payloads[tier]
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Standard library modules
+import json
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data.utilities import query
+from snews.models.deltas import HeartbeatDeltaDecoder, HeartbeatDeltaEncoder
+from snews.models.headers import peek_header
+from snews.models.messages import (HeartbeatMessage, MessageBatch, TimingTierMessage,
+                                   compatible_message_types, create_messages, parse_message)
+from snews.pipeline import SharedMessageRing
+from snews.schema import SNEWSJsonSchema
+
+from .conftest import MESSAGE_TYPES
+
+coincidence_inputs = {
+    "detector_name": "Super-K",
+    "neutrino_time_utc": "2012-06-09T15:31:08.109876",
+    "machine_time_utc": "2012-06-09T15:30:00.009876",
+    "is_firedrill": False,
+    "is_test": True,
+}
+
+
+# .................................................................................................
+@pytest.mark.parametrize("tier", MESSAGE_TYPES)
+def test_bench_model_construction(benchmark, payloads, tier):
+    message_type = MESSAGE_TYPES[tier]
+    payload = payloads[tier]
+
+    benchmark(lambda: message_type(**payload))
+
+
+# .................................................................................................
+def test_bench_create_messages(benchmark):
+    messages = benchmark(create_messages, **coincidence_inputs)
+    assert len(messages) == 1
+
+
+# .................................................................................................
+def test_bench_compatible_message_types(benchmark):
+    message_types = benchmark(compatible_message_types, include_heartbeats=True,
+                              **coincidence_inputs)
+    assert len(message_types) == 2
+
+
+# .................................................................................................
+def test_bench_query_messages_by_value(benchmark, message_models):
+    benchmark(query, message_models, {"tier": "Heartbeat"})
+
+
+# .................................................................................................
+def test_bench_query_messages_by_key(benchmark, message_models):
+    benchmark(query, message_models, "detector_name")
+
+
+# .................................................................................................
+@pytest.mark.parametrize("tier", MESSAGE_TYPES)
+def test_bench_schema_generation(benchmark, tier):
+    benchmark(MESSAGE_TYPES[tier].model_json_schema, schema_generator=SNEWSJsonSchema)
+
+
+# .................................................................................................
+@pytest.mark.parametrize("tier", MESSAGE_TYPES)
+def test_bench_model_build(benchmark, tier):
+    benchmark(MESSAGE_TYPES[tier].model_rebuild, force=True)
+
+
+# .................................................................................................
+def test_bench_heartbeat_full_validation(benchmark, generator):
+    heartbeats = generator.heartbeats(duration_sec=600, interval_sec=5)
+
+    benchmark(lambda: [HeartbeatMessage(**m) for m in heartbeats])
+
+
+# .................................................................................................
+def test_bench_heartbeat_delta_decoding(benchmark, generator):
+    encoder = HeartbeatDeltaEncoder()
+    frames = [encoder.encode(m) for m in generator.heartbeats(duration_sec=600, interval_sec=5)]
+
+    def decode():
+        decoder = HeartbeatDeltaDecoder()
+        return [decoder.decode(frame) for frame in frames]
+
+    benchmark(decode)
+
+
+# .................................................................................................
+def test_bench_decode_individual_messages(benchmark, generator):
+    raws = [json.dumps(m) for m in generator.heartbeats(duration_sec=1000, interval_sec=5)]
+
+    benchmark(lambda: [parse_message(raw) for raw in raws])
+
+
+# .................................................................................................
+def test_bench_decode_message_batch(benchmark, generator):
+    messages = [parse_message(m) for m in generator.heartbeats(duration_sec=1000, interval_sec=5)]
+    raw = MessageBatch.from_messages(messages).model_dump_json()
+
+    benchmark(MessageBatch.model_validate_json, raw)
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def large_timing_message(generator):
+    payload = generator.timing_bursts([generator.start_ns], hits_per_burst=10_000)[0]
+    return json.dumps(payload).encode()
+
+
+# .................................................................................................
+def test_bench_route_full_validation(benchmark, large_timing_message):
+    benchmark(TimingTierMessage.model_validate_json, large_timing_message)
+
+
+# .................................................................................................
+def test_bench_route_peek_header(benchmark, large_timing_message):
+    benchmark(peek_header, large_timing_message)
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def heartbeat_with_large_meta(generator):
+    payload = generator.heartbeats(duration_sec=5, interval_sec=5)[0]
+    payload["meta"] = {"diagnostics": [[0.5 * i for i in range(100)] for _ in range(200)]}
+    return json.dumps(payload).encode()
+
+
+# .................................................................................................
+def test_bench_meta_eager_parsing(benchmark, heartbeat_with_large_meta):
+    benchmark(HeartbeatMessage.model_validate_json, heartbeat_with_large_meta)
+
+
+# .................................................................................................
+def test_bench_meta_lazy_parsing(benchmark, heartbeat_with_large_meta):
+    benchmark(HeartbeatMessage.from_json, heartbeat_with_large_meta)
+
+
+# .................................................................................................
+RESTAMP = {"sent_time_utc": "2024-01-01T00:00:01Z", "is_test": True, "meta": {"hop": 1}}
+
+
+# .................................................................................................
+def test_bench_restamp_sequential_assignment(benchmark, payloads):
+    message = HeartbeatMessage(**payloads["Heartbeat"])
+
+    def restamp():
+        for name, value in RESTAMP.items():
+            setattr(message, name, value)
+
+    benchmark(restamp)
+
+
+# .................................................................................................
+def test_bench_restamp_update(benchmark, payloads):
+    message = HeartbeatMessage(**payloads["Heartbeat"])
+
+    benchmark(lambda: message.update(**RESTAMP))
+
+
+# .................................................................................................
+@pytest.fixture
+def shared_ring(generator):
+    messages = [parse_message(m) for m in generator.heartbeats(duration_sec=1000, interval_sec=5)]
+    ring = SharedMessageRing.create(slots=len(messages), slot_size=1024)
+    for message in messages:
+        ring.publish(message)
+
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+# .................................................................................................
+def test_bench_consume_revalidated_messages(benchmark, shared_ring):
+    raws = [r.payload_bytes() for r in shared_ring.reader(start=0).poll()]
+
+    benchmark(lambda: [parse_message(raw) for raw in raws])
+
+
+# .................................................................................................
+def test_bench_consume_shared_ring(benchmark, shared_ring):
+    benchmark(lambda: [r.message() for r in shared_ring.reader(start=0).poll()])
+
+
+# .................................................................................................
+def test_bench_consume_shared_ring_headers(benchmark, shared_ring):
+    benchmark(lambda: [r.tier for r in shared_ring.reader(start=0).poll()])
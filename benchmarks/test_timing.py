@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.data.utilities import num_leap_seconds_between
+from snews.models.timing import PrecisionTimestamp, utc_to_gps
+
+timestamp_inputs = {
+    "str": "2016-12-31T23:59:59.123456789",
+    "numpy": np.datetime64("2016-12-31T23:59:59.123456789"),
+}
+
+
+# .................................................................................................
+@pytest.mark.parametrize("kind", timestamp_inputs)
+def test_bench_precision_timestamp_parse(benchmark, kind):
+    benchmark(PrecisionTimestamp, timestamp=timestamp_inputs[kind])
+
+
+# .................................................................................................
+def test_bench_precision_timestamp_to_string(benchmark):
+    t = PrecisionTimestamp(timestamp=timestamp_inputs["str"])
+    benchmark(t.to_string)
+
+
+# .................................................................................................
+def test_bench_precision_timestamp_subtract(benchmark):
+    t1 = PrecisionTimestamp(timestamp="2016-12-31T23:59:59Z")
+    t2 = PrecisionTimestamp(timestamp="2017-01-01T00:00:01Z")
+
+    assert benchmark(lambda: t2 - t1) == np.timedelta64(3, "s")
+
+
+# .................................................................................................
+def test_bench_num_leap_seconds_between(benchmark):
+    date1 = np.datetime64("1972-01-01T00:00:00")
+    date2 = np.datetime64("2020-01-01T00:00:00")
+
+    assert benchmark(num_leap_seconds_between, date1, date2) == 27
+
+
+# .................................................................................................
+def test_bench_utc_to_gps_array(benchmark):
+    utc = np.arange(10**6, dtype=np.int64) * 1_000_003_000 + 10**18
+    benchmark(utc_to_gps, utc)
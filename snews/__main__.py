@@ -1,17 +1,28 @@
 # -*- coding: utf-8 -*-
 
 # Standard modules
+import argparse
 import inspect
 import json
 import logging
+import sys
+from collections import Counter
 from pathlib import Path
+from typing import Iterable, List, Optional
 
+import numpy as np
 from pydantic import BaseModel
 
 # Local modules
 from snews import models
+from snews.data.detectors import build_bundle
+from snews.data.io import FORMATS, NO_TIME, read_records, time_key, write_records
+from snews.models.messages import parse_message
 from snews.schema import SNEWSJsonSchema
 
+# The benchmark, migration and pipeline modules are imported by the commands that use them, so
+# that the other commands start without loading them
+
 
 # .................................................................................................
 def setup_logging():
@@ -51,9 +62,211 @@ def generate_model_schemas(outdir: str = None, models_module: list = models, dry
 
 
 # .................................................................................................
-def main() -> None:
+def build_detector_bundle(output: str = None) -> None:
+    """Validate all detector data files and write the detector bundle"""
+
+    filepath = build_bundle(output)
+    logging.info(f"Wrote detector bundle to file {filepath}")
+
+    return
+
+
+# .................................................................................................
+def validate_file(filepath: str, workers: int = None, max_errors: int = 10) -> None:
+    """Validate every message in a JSON Lines or binary file and report error counts"""
+    from snews.pipeline import validate_archive
+
+    report = validate_archive(filepath, workers=workers)
+    print(f"{filepath}: {report.total} messages, {report.valid} valid, {report.invalid} invalid")
+
+    for index, reason in report.errors[:max_errors]:
+        print(f"  record {index}: {reason}")
+
+    if report.invalid > max_errors:
+        print(f"  ... and {report.invalid - max_errors} more")
+
+    if report.invalid:
+        sys.exit(1)
+
+    return
+
+
+# .................................................................................................
+def convert_file(
+    source: str,
+    destination: str,
+    source_format: str = None,
+    destination_format: str = None,
+    validate: bool = False,
+) -> None:
+    """Convert messages between file formats, optionally validating and normalizing them"""
+
+    records = read_records(source, source_format)
+    if validate:
+        records = (parse_message(r).model_dump(mode="json") for r in records)
+
+    count = write_records(destination, records, destination_format)
+    logging.info(f"Wrote {count} messages from {source} to {destination}")
+
+    return
+
+
+# .................................................................................................
+def migrate_file(
+    source: str,
+    destination: str,
+    target: str = None,
+    source_format: str = None,
+    destination_format: str = None,
+) -> None:
+    """Upgrade the messages in a file to another schema version"""
+    from snews.models.migrations import upgrade_file
+
+    count = upgrade_file(source, destination, target, source_format, destination_format)
+    logging.info(f"Migrated {count} messages from {source} to {destination}")
+
+    return
+
+
+# .................................................................................................
+def summarize_records(records: Iterable[dict]) -> dict:
+    """Count messages by tier and detector and find their time range, in a single pass"""
+
+    tiers, detectors = Counter(), Counter()
+    first = last = None
+
+    for record in records:
+        tiers[record.get("tier")] += 1
+        detectors[record.get("detector_name")] += 1
+
+        key = time_key(record)
+        if key == NO_TIME:
+            continue
+
+        first = key if first is None else min(first, key)
+        last = key if last is None else max(last, key)
+
+    def iso(ns):
+        return None if ns is None else str(np.datetime64(ns, "ns")) + "Z"
+
+    return {
+        "messages": sum(tiers.values()),
+        "tiers": dict(tiers.most_common()),
+        "detectors": dict(detectors.most_common()),
+        "first_time_utc": iso(first),
+        "last_time_utc": iso(last),
+    }
+
+
+# .................................................................................................
+def run_bench(n_messages: int = 1000, repeat: int = 3, memory: bool = False) -> None:
+    """Run the built-in throughput or memory benchmark and print the results per class"""
+
+    if memory:
+        from snews.memory import format_memory_results, run_memory_benchmarks
+
+        print(format_memory_results(run_memory_benchmarks()))
+    else:
+        from snews.bench import format_results, run_benchmarks
+
+        print(format_results(run_benchmarks(n_messages=n_messages, repeat=repeat)))
+
+    return
+
+
+# .................................................................................................
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="snews_data_formats",
+        description="SNEWS data formats tools. Without a command, regenerates the JSON schemas.",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+
+    schema = subparsers.add_parser("schema", help="Generate JSON schemas for all models")
+    schema.add_argument("--outdir", default=None, help="Output directory for schema files")
+    schema.add_argument("--dry-run", action="store_true", help="Write schemas to /tmp instead")
+    schema.set_defaults(
+        func=lambda args: generate_model_schemas(outdir=args.outdir, dry_run=args.dry_run)
+    )
+
+    detectors = subparsers.add_parser(
+        "build-detectors", help="Validate detector data files and write the detector bundle"
+    )
+    detectors.add_argument("--output", default=None, help="Output path for the bundle")
+    detectors.set_defaults(func=lambda args: build_detector_bundle(args.output))
+
+    formats = sorted(set(FORMATS.values()))
+
+    validate = subparsers.add_parser(
+        "validate", help="Validate a JSON Lines or binary message file"
+    )
+    validate.add_argument("file", help="JSON Lines or binary message file")
+    validate.add_argument("-j", "--workers", type=int, default=None,
+                          help="Number of worker processes (default: all available CPUs)")
+    validate.add_argument("--max-errors", type=int, default=10,
+                          help="Number of errors to print")
+    validate.set_defaults(func=lambda args: validate_file(args.file, args.workers,
+                                                          args.max_errors))
+
+    convert = subparsers.add_parser("convert", help="Convert messages between file formats")
+    convert.add_argument("source", help="Input file")
+    convert.add_argument("destination", help="Output file")
+    convert.add_argument("--from", dest="source_format", choices=formats, default=None,
+                         help="Input format (default: inferred)")
+    convert.add_argument("--to", dest="destination_format", choices=formats, default=None,
+                         help="Output format (default: inferred from the suffix)")
+    convert.add_argument("--validate", action="store_true",
+                         help="Validate and normalize messages while converting")
+    convert.set_defaults(func=lambda args: convert_file(
+        args.source, args.destination, args.source_format, args.destination_format,
+        args.validate
+    ))
+
+    migrate = subparsers.add_parser(
+        "migrate", help="Upgrade messages in a file to another schema version"
+    )
+    migrate.add_argument("source", help="Input file")
+    migrate.add_argument("destination", help="Output file")
+    migrate.add_argument("--target", default=None,
+                         help="Schema version to migrate to (default: current)")
+    migrate.add_argument("--from", dest="source_format", choices=formats, default=None,
+                         help="Input format (default: inferred)")
+    migrate.add_argument("--to", dest="destination_format", choices=formats, default=None,
+                         help="Output format (default: inferred from the suffix)")
+    migrate.set_defaults(func=lambda args: migrate_file(
+        args.source, args.destination, args.target, args.source_format, args.destination_format
+    ))
+
+    bench = subparsers.add_parser(
+        "bench", help="Measure message throughput or memory footprint per message class"
+    )
+    bench.add_argument("-n", "--messages", type=int, default=1000,
+                       help="Messages per class in each timed run")
+    bench.add_argument("-r", "--repeat", type=int, default=3, help="Number of timed runs")
+    bench.add_argument("--memory", action="store_true",
+                       help="Report memory footprint per message instead of throughput")
+    bench.set_defaults(func=lambda args: run_bench(args.messages, args.repeat, args.memory))
+
+    stats = subparsers.add_parser("stats", help="Summarize a message file by tier and detector")
+    stats.add_argument("file", help="Message file")
+    stats.add_argument("--format", choices=formats, default=None,
+                       help="Input format (default: inferred)")
+    stats.set_defaults(func=lambda args: print(json.dumps(
+        summarize_records(read_records(args.file, args.format)), indent=2
+    )))
+
+    return parser
+
+
+# .................................................................................................
+def main(argv: Optional[List[str]] = None) -> None:
     setup_logging()
-    generate_model_schemas()
+
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        generate_model_schemas()
+    else:
+        args.func(args)
 
     return
 
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from .lightcurve import LightCurve, build_light_curves, hit_times_ns
+from .significance import (
+    COMBINATION_METHODS,
+    SignificanceAggregator,
+    fisher_combine,
+    norm_isf,
+    norm_sf,
+    stouffer_combine,
+)
+
+__all__ = [
+    "COMBINATION_METHODS",
+    "LightCurve",
+    "SignificanceAggregator",
+    "build_light_curves",
+    "fisher_combine",
+    "hit_times_ns",
+    "norm_isf",
+    "norm_sf",
+    "stouffer_combine",
+]
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+Binned light curves from timing tier hit times
+
+Hit times are converted once to int64 nanoseconds and binned with `np.bincount` on a fixed grid.
+Besides the base bins, a light curve keeps a pyramid of coarser levels, each `factor` times wider
+than the one below, which are updated together with the base bins. Zooming out then reads a
+precomputed level instead of rebinning all hits.
+
+    curve = LightCurve(bin_width_sec=0.001, levels=6)
+    curve.append(timing_message)
+    times_ns, counts = curve.zoom(start_ns, stop_ns, max_bins=500)
+"""
+
+__all__ = [
+    "LightCurve",
+    "build_light_curves",
+    "hit_times_ns",
+]
+
+# Standard library modules
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Third-party modules
+import numpy as np
+
+# Local modules
+from ..models.timing import NS_PER_SEC, timestamp_to_ns, timestamps_to_ns
+
+
+# .................................................................................................
+def hit_times_ns(hits) -> np.ndarray:
+    """
+    Hit times of a timing tier message, payload or sequence of timestamps as int64 nanoseconds
+
+    Integer entries are taken to be nanoseconds since the Unix epoch already.
+    """
+    if isinstance(hits, dict):
+        hits = hits["timing_series"]
+    elif hasattr(hits, "timing_series"):
+        hits = hits.timing_series
+
+    if isinstance(hits, np.ndarray) and hits.dtype.kind in "iu":
+        return hits.astype(np.int64, copy=False)
+
+    hits = list(hits)
+    if all(isinstance(h, str) for h in hits):
+        return timestamps_to_ns(hits)
+
+    return np.array([timestamp_to_ns(h) for h in hits], dtype=np.int64)
+
+
+# .................................................................................................
+class LightCurve:
+    """
+    Hit counts in fixed-width time bins, with a multi-resolution pyramid for zooming
+
+    Bin `i` of level `k` covers `[origin + i w f^k, origin + (i + 1) w f^k)` for base width `w` and
+    factor `f`. The grid grows in either direction as hits arrive, always by whole bins of the
+    coarsest level so that every level stays aligned.
+
+    Parameters
+    ----------
+    bin_width_sec : float
+        Width of the base bins in seconds
+    origin : Union[str, int], optional
+        Start of base bin zero, as a timestamp or integer nanoseconds. Defaults to the earliest
+        hit of the first append.
+    levels : int
+        Number of coarser levels kept above the base bins
+    factor : int
+        Ratio of bin widths between consecutive levels
+    """
+
+    def __init__(
+        self,
+        bin_width_sec: float,
+        origin: Optional[Union[str, int]] = None,
+        levels: int = 0,
+        factor: int = 2,
+    ):
+        self.bin_width_ns = int(round(bin_width_sec * NS_PER_SEC))
+        if self.bin_width_ns <= 0:
+            raise ValueError("bin_width_sec must be positive")
+
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+
+        self.origin_ns: Optional[int] = None if origin is None else timestamp_to_ns(origin)
+        self.factor = factor
+        self.n_hits = 0
+
+        # Counts per level; the base length is kept a multiple of the coarsest bin
+        self._block = factor ** levels
+        self._counts: List[np.ndarray] = [np.zeros(0, dtype=np.int64) for _ in range(levels + 1)]
+        self._stop = 0
+
+    def __len__(self) -> int:
+        return self._stop
+
+    @property
+    def levels(self) -> int:
+        return len(self._counts) - 1
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Hit counts in the base bins."""
+        return self.level(0)[1]
+
+    @property
+    def times_ns(self) -> np.ndarray:
+        """Start times of the base bins in integer nanoseconds."""
+        return self.level(0)[0]
+
+    def rate(self, level: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Start times in ns and hit rates in Hz of the bins of a level
+        """
+        times_ns, counts = self.level(level)
+        return times_ns, counts * (NS_PER_SEC / (self.bin_width_ns * self.factor ** level))
+
+    def level(self, level: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Start times in ns and hit counts of the bins of a pyramid level, 0 being the base bins
+        """
+        scale = self.factor ** level
+        n_bins = -(-self._stop // scale)
+        origin = 0 if self.origin_ns is None else self.origin_ns
+
+        times_ns = origin + self.bin_width_ns * scale * np.arange(n_bins, dtype=np.int64)
+        return times_ns, self._counts[level][:n_bins].copy()
+
+    def _grow(self, before: int, stop: int) -> int:
+        """
+        Make room for `before` bins ahead of the grid and for bins up to index `stop`
+
+        Both are rounded up to whole coarsest-level bins, and capacity at the end is at least
+        doubled, so appends in time order are amortized. Returns the number of bins added at the
+        start.
+        """
+        before = -(-before // self._block) * self._block
+        if before:
+            self.origin_ns -= before * self.bin_width_ns
+            self._stop += before
+
+        size = len(self._counts[0])
+        capacity = size + before
+        if stop + before > capacity:
+            capacity = -(-max(stop + before, 2 * capacity) // self._block) * self._block
+
+        if capacity > size:
+            for level, counts in enumerate(self._counts):
+                scale = self.factor ** level
+                self._counts[level] = np.pad(
+                    counts, (before // scale, (capacity - size - before) // scale)
+                )
+
+        return before
+
+    def append(self, hits) -> int:
+        """
+        Add the hits of a timing tier message, payload, or sequence of timestamps
+
+        Returns
+        -------
+        count : int
+            Number of hits added
+        """
+
+        times_ns = hit_times_ns(hits)
+        if not len(times_ns):
+            return 0
+
+        if self.origin_ns is None:
+            self.origin_ns = int(times_ns.min())
+
+        indices = (times_ns - self.origin_ns) // self.bin_width_ns
+        lo, hi = int(indices.min()), int(indices.max()) + 1
+
+        before = self._grow(max(0, -lo), hi)
+        indices, lo, hi = indices + before, lo + before, hi + before
+
+        for level, counts in enumerate(self._counts):
+            scale = self.factor ** level
+            first = lo // scale
+            binned = np.bincount(indices // scale - first)
+            counts[first:first + len(binned)] += binned
+
+        self._stop = max(self._stop, hi)
+        self.n_hits += len(times_ns)
+
+        return len(times_ns)
+
+    def extend(self, messages: Iterable) -> int:
+        """
+        Add the hits of several timing tier messages or payloads
+        """
+        return sum(self.append(message) for message in messages)
+
+    def zoom(
+        self,
+        start: Union[str, int],
+        stop: Union[str, int],
+        max_bins: int = 1000,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts over a time range at the finest level with at most `max_bins` bins in the range
+
+        Falls back to the coarsest level if even that has more bins in the range.
+
+        Returns
+        -------
+        times_ns : np.ndarray
+            Start times of the bins overlapping the range
+        counts : np.ndarray
+            Hit counts of those bins
+        """
+
+        start_ns, stop_ns = timestamp_to_ns(start), timestamp_to_ns(stop)
+        span = max(0, stop_ns - start_ns)
+
+        level = 0
+        while level < self.levels and span > max_bins * self.bin_width_ns * self.factor ** level:
+            level += 1
+
+        times_ns, counts = self.level(level)
+        width_ns = self.bin_width_ns * self.factor ** level
+        selected = (times_ns + width_ns > start_ns) & (times_ns < stop_ns)
+
+        return times_ns[selected], counts[selected]
+
+
+# .................................................................................................
+def build_light_curves(
+    messages: Iterable,
+    bin_width_sec: float,
+    origin: Optional[Union[str, int]] = None,
+    levels: int = 0,
+    factor: int = 2,
+) -> Dict[str, LightCurve]:
+    """
+    Light curves per detector from timing tier messages or payloads, on a shared grid
+
+    Parameters
+    ----------
+    messages : Iterable
+        Timing tier messages or payloads
+    bin_width_sec : float
+        Width of the base bins in seconds
+    origin : Union[str, int], optional
+        Start of base bin zero. Defaults to the earliest hit of any message, so that the curves of
+        all detectors are aligned.
+    levels, factor : int
+        Pyramid levels and ratio of bin widths, see `LightCurve`
+
+    Returns
+    -------
+    curves : Dict[str, LightCurve]
+        Light curve per detector name
+    """
+
+    hits: Dict[str, List[np.ndarray]] = {}
+    for message in messages:
+        name = message["detector_name"] if isinstance(message, dict) else message.detector_name
+        hits.setdefault(name, []).append(hit_times_ns(message))
+
+    if origin is None:
+        origin = min((int(h.min()) for series in hits.values() for h in series if len(h)),
+                     default=None)
+
+    curves = {}
+    for name, series in hits.items():
+        curves[name] = LightCurve(bin_width_sec, origin=origin, levels=levels, factor=factor)
+        curves[name].append(np.concatenate(series))
+
+    return curves
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+"""
+Cross-detector combination of significance tier p-values
+
+Each `SignificanceTierMessage` reports a series of p-values in consecutive bins of
+`t_bin_width_sec`, starting at its `machine_time_utc`. The aggregator resamples every series onto
+a common time grid and keeps a detectors × bins matrix of p-values, from which the combined
+p-value of each bin is computed across detectors in a single vectorized pass.
+
+    aggregator = SignificanceAggregator(bin_width_sec=0.01)
+    aggregator.add_many(messages)
+    times_ns, p_combined, n_detectors = aggregator.combine("fisher")
+"""
+
+__all__ = [
+    "COMBINATION_METHODS",
+    "SignificanceAggregator",
+    "fisher_combine",
+    "norm_isf",
+    "norm_sf",
+    "stouffer_combine",
+]
+
+# Standard library modules
+import math
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+# Third-party modules
+import numpy as np
+
+# Local modules
+from ..models.timing import NS_PER_SEC, timestamp_to_ns
+
+CombinationMethod = Literal["fisher", "stouffer"]
+
+# Smallest and largest p-values used, so that reported p-values of zero or one do not give
+# infinite statistics. 1 - P_MIN rounds to 1, so the upper bound is the largest float below 1.
+P_MIN = np.finfo(float).tiny
+P_MAX = np.nextafter(1.0, 0.0)
+
+# Coefficients of the rational approximations to the inverse normal CDF (P. J. Acklam)
+_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+      1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+      6.680131188771972e+01, -1.328068155288572e+01)
+_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+      -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+      3.754408661907416e+00)
+_P_LOW = 0.02425
+
+# Chebyshev coefficients of erfc (Numerical Recipes, 3rd edition, section 6.2.2)
+_ERFC = (-1.3026537197817094, 6.4196979235649026e-1, 1.9476473204185836e-2,
+         -9.561514786808631e-3, -9.46595344482036e-4, 3.66839497852761e-4,
+         4.2523324806907e-5, -2.0278578112534e-5, -1.624290004647e-6,
+         1.303655835580e-6, 1.5626441722e-8, -8.5238095915e-8, 6.529054439e-9,
+         5.059343495e-9, -9.91364156e-10, -2.27365122e-10, 9.6467911e-11,
+         2.394038e-12, -6.886027e-12, 8.94487e-13, 3.13092e-13, -1.12708e-13,
+         3.81e-16, 7.106e-15, -1.523e-15, -9.4e-17, 1.21e-16, -2.8e-17)
+
+
+# .................................................................................................
+def _polyval(coefficients: tuple, x: np.ndarray) -> np.ndarray:
+    result = np.zeros_like(x)
+    for c in coefficients:
+        result = result * x + c
+
+    return result
+
+
+# .................................................................................................
+def _erfc(x: np.ndarray) -> np.ndarray:
+    """
+    Complementary error function of an array, with a relative error below 2e-13 wherever the
+    result is a normal float
+    """
+    z = np.abs(x)
+    t = 2.0 / (2.0 + z)
+    ty = 4.0 * t - 2.0
+
+    d = np.zeros_like(z)
+    dd = np.zeros_like(z)
+    for c in _ERFC[:0:-1]:
+        d, dd = ty * d - dd + c, d
+
+    result = t * np.exp(-z * z + 0.5 * (_ERFC[0] + ty * d) - dd)
+    return np.where(x >= 0, result, 2.0 - result)
+
+
+# .................................................................................................
+def norm_isf(p) -> np.ndarray:
+    """
+    Inverse survival function of the standard normal distribution, i.e. the significance in
+    standard deviations of a one-sided p-value
+
+    Uses Acklam's rational approximation, with a relative error below 1.2e-9. The lower tail is
+    evaluated directly from `p`, so small p-values keep full precision.
+    """
+    p = np.clip(np.asarray(p, dtype=float), P_MIN, P_MAX)
+    z = np.empty_like(p)
+
+    # Work with the smaller tail probability; the result is symmetric around p = 0.5
+    q = np.minimum(p, 1.0 - p)
+    sign = np.where(p < 0.5, 1.0, -1.0)
+
+    tail = q < _P_LOW
+    t = np.sqrt(-2.0 * np.log(q[tail]))
+    z[tail] = _polyval(_C, t) / (_polyval(_D, t) * t + 1.0)
+
+    central = ~tail
+    r = q[central] - 0.5
+    s = r * r
+    z[central] = _polyval(_A, s) * r / (_polyval(_B, s) * s + 1.0)
+
+    return -sign * z if z.ndim else float(-sign * z)
+
+
+# .................................................................................................
+def norm_sf(z) -> np.ndarray:
+    """
+    Survival function of the standard normal distribution
+
+    Evaluated for the whole array at once from a Chebyshev approximation of erfc, so that small
+    p-values far in the upper tail keep their relative precision.
+    """
+    z = np.asarray(z, dtype=float)
+    p = 0.5 * _erfc(z / math.sqrt(2.0))
+
+    return p if p.ndim else float(p)
+
+
+# .................................................................................................
+def fisher_combine(p_values: np.ndarray, axis: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fisher's combination of independent p-values, ignoring NaN entries
+
+    The statistic -2 Σ ln p follows a chi-squared distribution with 2k degrees of freedom. For
+    even degrees of freedom its survival function has the closed form
+    exp(-x/2) Σ_{j<k} (x/2)^j / j!, which is summed for all columns at once.
+
+    Parameters
+    ----------
+    p_values : np.ndarray
+        p-values, with NaN where a detector did not report
+    axis : int
+        Axis along which p-values are combined
+
+    Returns
+    -------
+    p_combined : np.ndarray
+        Combined p-values, NaN where no p-values were reported
+    n_combined : np.ndarray
+        Number of p-values combined
+    """
+
+    p_values = np.asarray(p_values, dtype=float)
+    reported = ~np.isnan(p_values)
+    n_combined = reported.sum(axis=axis)
+
+    p_values = np.clip(np.where(reported, p_values, 1.0), P_MIN, 1.0)
+    half_statistic = -np.log(p_values).sum(axis=axis)
+
+    term = np.exp(-half_statistic)
+    p_combined = np.zeros_like(term)
+    for j in range(int(n_combined.max(initial=0))):
+        if j:
+            term = term * half_statistic / j
+        p_combined += np.where(j < n_combined, term, 0.0)
+
+    p_combined = np.minimum(p_combined, 1.0)
+    p_combined[n_combined == 0] = np.nan
+
+    return p_combined, n_combined
+
+
+# .................................................................................................
+def stouffer_combine(
+    p_values: np.ndarray,
+    axis: int = 0,
+    weights: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stouffer's combination of independent one-sided p-values, ignoring NaN entries
+
+    Each p-value is converted to a normal score, and the weighted sum of the scores divided by
+    the root sum of squared weights is converted back to a p-value.
+
+    Parameters
+    ----------
+    p_values : np.ndarray
+        p-values, with NaN where a detector did not report
+    axis : int
+        Axis along which p-values are combined
+    weights : np.ndarray, optional
+        Weights broadcastable against `p_values`. Defaults to equal weights.
+
+    Returns
+    -------
+    p_combined : np.ndarray
+        Combined p-values, NaN where no p-values were reported
+    n_combined : np.ndarray
+        Number of p-values combined
+    """
+
+    p_values = np.asarray(p_values, dtype=float)
+    reported = ~np.isnan(p_values)
+    n_combined = reported.sum(axis=axis)
+
+    weights = 1.0 if weights is None else weights
+    weights = np.where(reported, np.broadcast_to(weights, p_values.shape), 0.0)
+
+    scores = np.where(reported, norm_isf(np.where(reported, p_values, 0.5)), 0.0)
+    norm = np.sqrt((weights ** 2).sum(axis=axis))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (weights * scores).sum(axis=axis) / norm
+
+    p_combined = norm_sf(z)
+    p_combined[n_combined == 0] = np.nan
+
+    return p_combined, n_combined
+
+
+COMBINATION_METHODS = {
+    "fisher": fisher_combine,
+    "stouffer": stouffer_combine,
+}
+
+
+# .................................................................................................
+def _significance_series(message) -> Tuple[str, int, int, np.ndarray]:
+    """Detector name, start time, bin width in ns and p-values of a message or payload."""
+    if isinstance(message, dict):
+        get = message.get
+    else:
+        def get(key):
+            return getattr(message, key, None)
+
+    machine_time = get("machine_time_utc")
+    if machine_time is None:
+        raise ValueError("Significance messages must have a machine_time_utc to be aligned")
+
+    width_ns = int(round(float(get("t_bin_width_sec")) * NS_PER_SEC))
+    if width_ns <= 0:
+        raise ValueError("Significance messages must have a positive t_bin_width_sec")
+
+    p_values = np.asarray(get("p_values"), dtype=float)
+
+    return get("detector_name"), timestamp_to_ns(machine_time), width_ns, p_values
+
+
+# .................................................................................................
+class SignificanceAggregator:
+    """
+    Detectors × bins matrix of p-values on a common time grid, with combined significance
+
+    Grid bins are `bin_width_sec` wide and start at `origin`, which defaults to the
+    `machine_time_utc` of the first message added. The grid grows in either direction as messages
+    arrive.
+
+    A detector bin contributes to every grid bin it overlaps. When several detector bins of one
+    message fall into the same grid bin, their minimum p-value is Šidák corrected for the number
+    of bins, 1 - (1 - p_min)^n, so finer detector binning does not inflate the significance. A
+    later message from the same detector replaces the values it covers.
+
+    Combined p-values are cached per method; only grid bins changed since the last call are
+    recomputed.
+
+    Parameters
+    ----------
+    bin_width_sec : float
+        Width of the common grid bins in seconds
+    origin : Union[str, int], optional
+        Start of the grid bin with index zero, as a timestamp or integer nanoseconds
+    detectors : Iterable[str], optional
+        Detector names, fixing the row order. Other detectors are appended as they report.
+    """
+
+    def __init__(
+        self,
+        bin_width_sec: float,
+        origin: Optional[Union[str, int]] = None,
+        detectors: Optional[Iterable[str]] = None,
+    ):
+        self.bin_width_ns = int(round(bin_width_sec * NS_PER_SEC))
+        if self.bin_width_ns <= 0:
+            raise ValueError("bin_width_sec must be positive")
+
+        self.origin_ns: Optional[int] = None if origin is None else timestamp_to_ns(origin)
+        self.detectors: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix = np.full((0, 0), np.nan)
+
+        # Combined p-values and detector counts per method, and the bins to recompute
+        self._combined: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._stale: Dict[str, np.ndarray] = {}
+
+        for name in detectors or ():
+            self._row(name)
+
+    def __len__(self) -> int:
+        return self._matrix.shape[1]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Read-only view of the detectors × bins p-values, NaN where nothing was reported."""
+        view = self._matrix.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def times_ns(self) -> np.ndarray:
+        """Start times of the grid bins in integer nanoseconds."""
+        origin = 0 if self.origin_ns is None else self.origin_ns
+        return origin + self.bin_width_ns * np.arange(len(self), dtype=np.int64)
+
+    def _row(self, name: str) -> int:
+        if name not in self._rows:
+            self._rows[name] = len(self.detectors)
+            self.detectors.append(name)
+            self._matrix = np.vstack([self._matrix, np.full((1, len(self)), np.nan)])
+
+        return self._rows[name]
+
+    def _resize(self, before: int, after: int) -> None:
+        """Add `before` bins at the start of the grid and `after` bins at its end."""
+        if not before and not after:
+            return
+
+        self._matrix = np.pad(self._matrix, ((0, 0), (before, after)), constant_values=np.nan)
+        self.origin_ns -= before * self.bin_width_ns
+
+        for method, (p_combined, n_combined) in self._combined.items():
+            self._combined[method] = (
+                np.pad(p_combined, (before, after), constant_values=np.nan),
+                np.pad(n_combined, (before, after)),
+            )
+            self._stale[method] = np.pad(
+                self._stale[method], (before, after), constant_values=True
+            )
+
+    def add(self, message) -> None:
+        """
+        Add the p-values of a significance tier message or payload
+
+        Raises
+        ------
+        ValueError
+            If the message has no machine time or a non-positive bin width
+        """
+
+        name, start_ns, width_ns, p_values = _significance_series(message)
+        if not len(p_values):
+            return
+
+        if self.origin_ns is None:
+            self.origin_ns = start_ns
+
+        # Grid bins overlapped by each detector bin, [first, last)
+        offsets = start_ns - self.origin_ns + width_ns * np.arange(len(p_values), dtype=np.int64)
+        first = offsets // self.bin_width_ns
+        last = -(-(offsets + width_ns) // self.bin_width_ns)
+
+        before = max(0, -int(first[0]))
+        self._resize(before, max(0, int(last[-1]) - len(self)))
+        first, last = first + before, last + before
+
+        # Expand each detector bin to the grid bins it covers
+        counts = last - first
+        columns = np.repeat(first, counts) + (
+            np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        )
+        lo, hi = int(first[0]), int(last[-1])
+
+        p_min = np.full(hi - lo, np.inf)
+        np.minimum.at(p_min, columns - lo, np.repeat(p_values, counts))
+        n_bins = np.bincount(columns - lo, minlength=hi - lo)
+
+        covered = n_bins > 0
+        resampled = -np.expm1(n_bins[covered] * np.log1p(-np.minimum(p_min[covered], P_MAX)))
+
+        row = self._row(name)
+        self._matrix[row, lo:hi][covered] = resampled
+        for stale in self._stale.values():
+            stale[lo:hi] |= covered
+
+    def add_many(self, messages: Iterable) -> None:
+        """
+        Add the p-values of several significance tier messages or payloads
+        """
+        for message in messages:
+            self.add(message)
+
+    def combine(
+        self, method: CombinationMethod = "fisher"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Combined p-value across detectors in every grid bin
+
+        Parameters
+        ----------
+        method : str
+            `fisher` or `stouffer`
+
+        Returns
+        -------
+        times_ns : np.ndarray
+            Start times of the grid bins in integer nanoseconds
+        p_combined : np.ndarray
+            Combined p-values, NaN where no detector reported
+        n_detectors : np.ndarray
+            Number of detectors combined in each bin
+        """
+
+        if method not in COMBINATION_METHODS:
+            raise ValueError(f"Unknown combination method '{method}'")
+
+        if method not in self._combined:
+            self._combined[method] = (np.full(len(self), np.nan), np.zeros(len(self), dtype=int))
+            self._stale[method] = np.ones(len(self), dtype=bool)
+
+        p_combined, n_combined = self._combined[method]
+        stale = self._stale[method]
+
+        if stale.any():
+            columns = np.flatnonzero(stale)
+            p_combined[columns], n_combined[columns] = COMBINATION_METHODS[method](
+                self._matrix[:, columns], axis=0
+            )
+            stale[:] = False
+
+        return self.times_ns, p_combined.copy(), n_combined.copy()
+
+    def drop_before(self, timestamp: Union[str, int]) -> None:
+        """
+        Discard grid bins that end at or before a time, bounding memory in long-running use
+        """
+        if self.origin_ns is None:
+            return
+
+        n_drop = (timestamp_to_ns(timestamp) - self.origin_ns) // self.bin_width_ns
+        n_drop = min(len(self), max(0, n_drop))
+        if not n_drop:
+            return
+
+        self._matrix = self._matrix[:, n_drop:].copy()
+        self.origin_ns += n_drop * self.bin_width_ns
+
+        for method, (p_combined, n_combined) in self._combined.items():
+            self._combined[method] = (p_combined[n_drop:].copy(), n_combined[n_drop:].copy())
+            self._stale[method] = self._stale[method][n_drop:].copy()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Built-in throughput benchmark for the message models
+
+Unlike the pytest-benchmark suite in `benchmarks/`, this runs from an installed package without
+any test dependencies, so it can be used to compare deployment hosts:
+
+    snews_data_formats bench --messages 2000
+"""
+
+__all__ = [
+    "format_results",
+    "run_benchmarks",
+]
+
+# Standard library imports
+import json
+import time
+from typing import Callable, List, Optional
+
+# Local imports
+from .data.mock import MessageGenerator
+from .models.messages import MESSAGE_TYPES, Tier, warm_up_message_models
+
+# Operations timed for every message class, each given the class and one payload
+OPERATIONS = {
+    "validate_python": lambda cls, payload, raw: cls.model_validate(dict(payload)),
+    "validate_json": lambda cls, payload, raw: cls.model_validate_json(raw),
+    "construct": lambda cls, payload, raw: cls.model_construct(**payload),
+}
+
+
+# .................................................................................................
+def _sample_payloads(n_messages: int, seed: int) -> dict:
+    """At least `n_messages` payloads of every tier from the synthetic message generator."""
+    generator = MessageGenerator(seed=seed, start="2024-01-01T00:00:00")
+
+    payloads = {tier: [] for tier in MESSAGE_TYPES}
+    scale = 1.0
+    while any(len(p) < n_messages for p in payloads.values()):
+        for message in generator.stream(duration_sec=3600, scale=scale, hits_per_burst=100):
+            payloads[Tier(message["tier"])].append(message)
+        scale *= 4
+
+    return {tier: p[:n_messages] for tier, p in payloads.items()}
+
+
+# .................................................................................................
+def _best_of(repeat: int, func: Callable) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+# .................................................................................................
+def run_benchmarks(
+    n_messages: int = 1000,
+    repeat: int = 3,
+    seed: int = 2024,
+    operations: Optional[List[str]] = None,
+) -> List[dict]:
+    """
+    Measure message throughput per message class and operation
+
+    Parameters
+    ----------
+    n_messages : int
+        Number of generated messages per class in each timed run
+    repeat : int
+        Number of timed runs; the fastest is reported
+    seed : int
+        Seed of the synthetic message generator
+    operations : List[str], optional
+        Operations to time, from `validate_python`, `validate_json` and `construct`.
+        Defaults to all.
+
+    Returns
+    -------
+    results : List[dict]
+        One entry per class and operation, with the keys `message_type`, `operation`,
+        `messages`, `seconds` and `messages_per_sec`
+    """
+
+    warm_up_message_models()
+    payloads = _sample_payloads(n_messages, seed)
+
+    results = []
+    for tier, message_type in MESSAGE_TYPES.items():
+        samples = [(p, json.dumps(p)) for p in payloads[tier]]
+
+        for name in operations or OPERATIONS:
+            operation = OPERATIONS[name]
+            seconds = _best_of(repeat, lambda: [
+                operation(message_type, payload, raw) for payload, raw in samples
+            ])
+
+            results.append({
+                "message_type": message_type.__name__,
+                "operation": name,
+                "messages": len(samples),
+                "seconds": seconds,
+                "messages_per_sec": len(samples) / seconds if seconds else float("inf"),
+            })
+
+    return results
+
+
+# .................................................................................................
+def format_results(results: List[dict]) -> str:
+    """
+    Render benchmark results as a plain-text table
+    """
+    header = f"{'message type':<26}{'operation':<18}{'messages/s':>14}{'µs/message':>14}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['message_type']:<26}{r['operation']:<18}{r['messages_per_sec']:>14,.0f}"
+            f"{1e6 * r['seconds'] / r['messages']:>14.2f}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Compression of single messages with a shared zstd dictionary
+
+A message is a few hundred bytes of JSON that is mostly field names, tier strings, detector names
+and timestamp prefixes. Compressed alone it barely shrinks, because the compressor has not seen
+any of it before; compressed with a dictionary trained on many messages it shrinks several times.
+The trained dictionary is shipped with the package as `messages-v<version>.zdict`, and every
+compressed frame records the id of the dictionary it was compressed with, so frames written with
+an older dictionary can still be read after a new one is shipped (requires zstandard):
+
+    frame = compress(encode_record(record))
+    record = json.loads(decompress(frame))
+
+`decode_payload` accepts compressed and plain JSON payloads alike, which lets readers of binary
+record streams, archives and wire frames handle both. Frames declaring more than `MAX_PAYLOAD`
+bytes are rejected before any memory is allocated for them. Rebuild the dictionary after schema
+changes and bump `DICTIONARY_VERSION`:
+
+    data = train_message_dictionary(version=DICTIONARY_VERSION + 1)
+    dictionary_path(DICTIONARY_VERSION + 1).write_bytes(data)
+"""
+
+__all__ = [
+    "DICTIONARY_VERSION",
+    "MAX_PAYLOAD",
+    "compress",
+    "decode_payload",
+    "decompress",
+    "dictionary_path",
+    "is_compressed",
+    "load_dictionary",
+    "train_message_dictionary",
+]
+
+# Standard library imports
+import threading
+from functools import lru_cache
+from importlib import resources
+from typing import List, Union
+
+# Third party imports
+import numpy as np
+
+# Version of the dictionary used to compress new messages
+DICTIONARY_VERSION = 1
+
+# zstd dictionary ids below 32768 are reserved, so versions are offset into the private range
+DICTIONARY_ID_BASE = 0x534E0000
+
+# Every zstd frame starts with these bytes, which never start a JSON document
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+DEFAULT_LEVEL = 3
+
+# Largest decompressed message accepted, far above any real message
+MAX_PAYLOAD = 1 << 20
+
+data_directory = resources.files("snews.data.compression")
+
+_local = threading.local()
+
+
+# .................................................................................................
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Compressing messages requires zstandard: pip install zstandard")
+
+    return zstandard
+
+
+# .................................................................................................
+def dictionary_path(version: int = DICTIONARY_VERSION):
+    """Path of the shipped dictionary with the given version."""
+    return data_directory / f"messages-v{version}.zdict"
+
+
+# .................................................................................................
+@lru_cache(maxsize=None)
+def load_dictionary(version: int = DICTIONARY_VERSION):
+    """
+    Load a shipped dictionary
+
+    Returns
+    -------
+    dictionary : zstandard.ZstdCompressionDict
+        Dictionary with the zstd id `DICTIONARY_ID_BASE + version`
+
+    Raises
+    ------
+    ValueError
+        If no dictionary with this version is shipped
+    """
+
+    zstandard = _import_zstandard()
+
+    path = dictionary_path(version)
+    if not path.is_file():
+        raise ValueError(f"Unknown message dictionary version {version}")
+
+    dictionary = zstandard.ZstdCompressionDict(path.read_bytes())
+    if dictionary.dict_id() != DICTIONARY_ID_BASE + version:
+        raise ValueError(f"Message dictionary {path.name} has the wrong id {dictionary.dict_id()}")
+
+    return dictionary
+
+
+# .................................................................................................
+def _compressor(level: int, version: int):
+    # Compression contexts cannot be shared between threads, so each thread keeps its own
+    compressors = _local.__dict__.setdefault("compressors", {})
+    if (level, version) not in compressors:
+        dictionary = load_dictionary(version)
+        dictionary.precompute_compress(level=level)
+        compressors[level, version] = _import_zstandard().ZstdCompressor(
+            dict_data=dictionary, level=level, write_checksum=False, write_content_size=True,
+            write_dict_id=True,
+        )
+
+    return compressors[level, version]
+
+
+# .................................................................................................
+def _decompressor(dict_id: int):
+    decompressors = _local.__dict__.setdefault("decompressors", {})
+    if dict_id not in decompressors:
+        zstandard = _import_zstandard()
+        if dict_id == 0:
+            decompressors[dict_id] = zstandard.ZstdDecompressor()
+        else:
+            dictionary = load_dictionary(dict_id - DICTIONARY_ID_BASE)
+            decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dictionary)
+
+    return decompressors[dict_id]
+
+
+# .................................................................................................
+def compress(
+    payload: Union[bytes, bytearray, memoryview],
+    level: int = DEFAULT_LEVEL,
+    version: int = DICTIONARY_VERSION,
+) -> bytes:
+    """
+    Compress one serialized message into a self-describing zstd frame
+
+    Parameters
+    ----------
+    payload : bytes
+        Serialized message, e.g. from `encode_record`
+    level : int
+        zstd compression level
+    version : int
+        Version of the dictionary to compress with
+
+    Returns
+    -------
+    frame : bytes
+        zstd frame holding the payload size and the dictionary id
+    """
+    return _compressor(level, version).compress(payload)
+
+
+# .................................................................................................
+def decompress(
+    frame: Union[bytes, bytearray, memoryview],
+    max_payload: int = MAX_PAYLOAD,
+) -> bytes:
+    """
+    Decompress a frame written by `compress`, with whichever dictionary it was written with
+
+    Parameters
+    ----------
+    frame : bytes
+        zstd frame
+    max_payload : int
+        Largest decompressed size accepted. The output buffer is sized from the frame header, so
+        this is checked before decompressing.
+
+    Raises
+    ------
+    ValueError
+        If the frame is not a valid zstd frame, needs an unknown dictionary, or does not declare
+        a size of at most `max_payload` bytes
+    """
+
+    zstandard = _import_zstandard()
+    try:
+        parameters = zstandard.get_frame_parameters(frame)
+        if parameters.content_size == zstandard.CONTENTSIZE_UNKNOWN:
+            raise ValueError("Invalid compressed message: the frame does not declare its size")
+        if parameters.content_size > max_payload:
+            raise ValueError(
+                f"Compressed message of {parameters.content_size} bytes exceeds the limit of "
+                f"{max_payload} bytes"
+            )
+        return _decompressor(parameters.dict_id).decompress(frame)
+    except zstandard.ZstdError as e:
+        raise ValueError(f"Invalid compressed message: {e}")
+
+
+# .................................................................................................
+def is_compressed(payload: Union[bytes, bytearray, memoryview]) -> bool:
+    """True if the payload is a zstd frame rather than plain JSON."""
+    return bytes(payload[:4]) == ZSTD_MAGIC
+
+
+# .................................................................................................
+def decode_payload(
+    payload: Union[bytes, bytearray, memoryview, str],
+    max_payload: int = MAX_PAYLOAD,
+) -> Union[bytes, str]:
+    """
+    Serialized message from a payload that may or may not be compressed
+
+    Text payloads are plain JSON and are returned unchanged. Compressed payloads larger than
+    `max_payload` bytes once decompressed raise a `ValueError`.
+    """
+    if isinstance(payload, str):
+        return payload
+    if is_compressed(payload):
+        return decompress(payload, max_payload)
+
+    return payload if isinstance(payload, bytes) else bytes(payload)
+
+
+# .................................................................................................
+def _training_samples(n_samples: int, seed: int) -> List[bytes]:
+    """Serialized synthetic messages, the same number of every class, as the models write them."""
+    # Imported here to avoid a circular import with the message models
+    from ...models.messages import parse_message
+    from ..io import encode_record
+    from ..mock import MessageGenerator
+
+    generator = MessageGenerator(seed=seed, start="2024-01-01T00:00:00")
+    n = n_samples // 5
+
+    def sent_ns(size):
+        offsets = np.sort(generator.rng.integers(0, 3600 * 10**9, size=size))
+        return generator.start_ns + offsets
+
+    # Short bursts of varying size keep the hit lists from crowding out the envelope fields
+    bursts = []
+    for hits_per_burst in generator.rng.integers(1, 50, size=n):
+        bursts += generator.timing_bursts(sent_ns(1), hits_per_burst=int(hits_per_burst))
+
+    payloads = (
+        generator.heartbeats(duration_sec=n, interval_sec=1)[:n]
+        + bursts
+        + generator.significance_series(sent_ns(n))
+        + generator.coincidences(sent_ns(n))
+        + generator.retractions(sent_ns(n), [p["uuid"] for p in bursts])
+    )
+    generator.rng.shuffle(payloads)
+
+    return [encode_record(parse_message(p).model_dump(mode="json")) for p in payloads]
+
+
+# .................................................................................................
+def train_message_dictionary(
+    version: int = DICTIONARY_VERSION,
+    n_samples: int = 20_000,
+    dict_size: int = 16_384,
+    seed: int = 2024,
+) -> bytes:
+    """
+    Train a dictionary on synthetic messages of all five classes
+
+    Parameters
+    ----------
+    version : int
+        Version to record in the dictionary id
+    n_samples : int
+        Number of training messages
+    dict_size : int
+        Maximum size of the dictionary in bytes
+    seed : int
+        Seed of the synthetic message generator
+
+    Returns
+    -------
+    data : bytes
+        Serialized dictionary, as loaded by `load_dictionary`
+    """
+
+    zstandard = _import_zstandard()
+    dictionary = zstandard.train_dictionary(
+        dict_size, _training_samples(n_samples, seed), dict_id=DICTIONARY_ID_BASE + version,
+        level=DEFAULT_LEVEL,
+    )
+
+    return dictionary.as_bytes()
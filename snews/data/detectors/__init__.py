@@ -1,22 +1,127 @@
 # -*- coding: utf-8 -*-
 
 # Standard library imports
+import hashlib
+import json
 from importlib import resources
+from pathlib import Path
+from typing import List, Optional, Union
+
+# Third party imports
+from pydantic import BaseModel, ValidationError
 
 # Local imports
+from ...__version__ import __version__
 from ...models.detectors import Detector
 from ..io import read_json_file
+from ..spatial import DetectorIndex
 
 # Module exports
 __all__ = [
     "all",
+    "build_bundle",
+    "index",
+    "load_detectors",
     "names",
 ]
 
 data_directory = resources.files("snews.data.detectors")
 
-# Load Detector Data
-detector_filepaths = list(data_directory.glob("*.json"))
+# All detector data in one file, written by `snews_data_formats build-detectors`
+BUNDLE_FILENAME = "_bundle.json"
+
+
+# .................................................................................................
+class _Bundle(BaseModel):
+    """
+    Contents of the bundle file
+
+    The bundle is parsed and validated in one pass, which costs less per detector than parsing
+    each data file, and even than building detectors from parsed records with `model_construct`.
+    """
+    source_hash: str
+    detectors: List[Detector]
+
+
+# .................................................................................................
+def _source_filepaths() -> list:
+    """Detector data files, excluding generated files such as the bundle."""
+    return sorted(
+        (f for f in data_directory.glob("*.json") if not f.name.startswith("_")),
+        key=lambda f: f.name
+    )
+
+
+# .................................................................................................
+def source_hash(filepaths: list) -> str:
+    """
+    Hash of the package version and the names and contents of detector data files
+
+    The version is included so that a bundle written by another release, whose `Detector` model
+    may differ, is not used in place of the data files.
+    """
+    digest = hashlib.blake2b(__version__.encode("utf-8") + b"\0", digest_size=16)
+    for f in filepaths:
+        digest.update(f.name.encode("utf-8") + b"\0" + f.read_bytes() + b"\0")
+
+    return digest.hexdigest()
+
+
+# .................................................................................................
+def build_bundle(filepath: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Validate all detector data files and write them to a single bundle
+
+    Parameters
+    ----------
+    filepath : Union[str, Path], optional
+        Output path. Defaults to the bundle file shipped with the package.
 
-all = [Detector(**read_json_file(f)) for f in detector_filepaths]
+    Returns
+    -------
+    filepath : Path
+        Path of the written bundle
+    """
+
+    filepaths = _source_filepaths()
+    bundle = {
+        "source_hash": source_hash(filepaths),
+        "detectors": [
+            Detector(**read_json_file(f)).model_dump(mode="json") for f in filepaths
+        ],
+    }
+
+    filepath = Path(str(data_directory / BUNDLE_FILENAME)) if filepath is None else Path(filepath)
+    filepath.write_text(json.dumps(bundle, separators=(",", ":")), encoding="utf-8")
+
+    return filepath
+
+
+# .................................................................................................
+def load_detectors() -> List[Detector]:
+    """
+    Load all detectors, from the bundle if it matches the data files and from the data files
+    otherwise
+    """
+
+    filepaths = _source_filepaths()
+    bundle_path = data_directory / BUNDLE_FILENAME
+
+    if bundle_path.is_file():
+        try:
+            bundle = _Bundle.model_validate_json(bundle_path.read_bytes())
+        except ValidationError:
+            bundle = None
+
+        if bundle is not None and bundle.source_hash == source_hash(filepaths):
+            return bundle.detectors
+
+    return [Detector(**read_json_file(f)) for f in filepaths]
+
+
+# Load Detector Data
+all = load_detectors()
 names = [d.name for d in all]
+
+# Spatial index for distance and attribute queries
+index = DetectorIndex(all)
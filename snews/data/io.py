@@ -1,6 +1,24 @@
 # Standard library imports
+import hashlib
 import json
-from pathlib import PosixPath
+import mmap
+import struct
+import uuid
+from pathlib import Path, PosixPath
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from .compression import compress as compress_payload
+from .compression import decode_payload
+
+# Binary record stream layout: an 8-byte magic string, followed by records, each of which is a
+# little-endian uint32 byte length followed by the UTF-8 encoded JSON payload, or that payload
+# compressed with the message dictionary of `snews.data.compression`.
+BINARY_MAGIC = b"SNEWSBIN"
+BINARY_LENGTH = struct.Struct("<I")
 
 
 # .................................................................................................
@@ -25,3 +43,779 @@ def read_json_file(filepath: PosixPath) -> dict:
     """
 
     return json.loads(filepath.read_text(encoding="utf-8"))
+
+
+# .................................................................................................
+def encode_record(record: dict) -> bytes:
+    """
+    Encode a single record as compact UTF-8 JSON
+
+    Parameters
+    ----------
+    record : dict
+        JSON-serializable record
+
+    Returns
+    -------
+    data : bytes
+        Compact JSON encoding of the record
+    """
+
+    return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+
+# .................................................................................................
+def write_json_lines(filepath: Union[str, Path], records: Iterable[dict]) -> int:
+    """
+    Write records to a JSON Lines file, one compact JSON object per line
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to output file
+    records : Iterable[dict]
+        JSON-serializable records
+
+    Returns
+    -------
+    count : int
+        Number of records written
+
+    Examples
+    --------
+    >>> write_json_lines("messages.jsonl", [{"a": 1}, {"a": 2}])
+    2
+    """
+
+    count = 0
+    with open(filepath, "wb") as f:
+        for record in records:
+            f.write(encode_record(record) + b"\n")
+            count += 1
+
+    return count
+
+
+# .................................................................................................
+def read_json_lines(filepath: Union[str, Path]) -> Iterator[dict]:
+    """
+    Lazily read records from a JSON Lines file, skipping blank lines
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to JSON Lines file
+
+    Yields
+    ------
+    record : dict
+        Parsed record
+    """
+
+    with open(filepath, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+# .................................................................................................
+def write_binary(
+    filepath: Union[str, Path], records: Iterable[dict], compress: bool = False
+) -> int:
+    """
+    Write records to a length-prefixed binary record stream
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to output file
+    records : Iterable[dict]
+        JSON-serializable records
+    compress : bool
+        Compress every record with the message dictionary (requires zstandard)
+
+    Returns
+    -------
+    count : int
+        Number of records written
+    """
+
+    count = 0
+    with open(filepath, "wb") as f:
+        f.write(BINARY_MAGIC)
+        for record in records:
+            payload = encode_record(record)
+            if compress:
+                payload = compress_payload(payload)
+            f.write(BINARY_LENGTH.pack(len(payload)))
+            f.write(payload)
+            count += 1
+
+    return count
+
+
+# .................................................................................................
+def _read_binary_frame(f: BinaryIO, filepath: Union[str, Path]) -> Optional[bytes]:
+    """
+    Read the next length-prefixed payload from an open binary record stream, as stored
+
+    Returns None at the end of the stream, and raises `ValueError` if the record is truncated.
+    """
+
+    header = f.read(BINARY_LENGTH.size)
+    if not header:
+        return None
+    if len(header) < BINARY_LENGTH.size:
+        raise ValueError(f"Truncated record header in {filepath}")
+
+    (length,) = BINARY_LENGTH.unpack(header)
+    payload = f.read(length)
+    if len(payload) < length:
+        raise ValueError(f"Truncated record payload in {filepath}")
+
+    return payload
+
+
+# .................................................................................................
+def iter_binary_frames(filepath: Union[str, Path]) -> Iterator[bytes]:
+    """
+    Lazily read raw payload frames from a length-prefixed binary record stream
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to binary record stream
+
+    Yields
+    ------
+    payload : bytes
+        Raw JSON payload of a single record, decompressed if needed
+    """
+
+    with open(filepath, "rb") as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{filepath} is not a SNEWS binary record stream")
+
+        while (payload := _read_binary_frame(f, filepath)) is not None:
+            yield decode_payload(payload)
+
+
+# .................................................................................................
+def read_binary(filepath: Union[str, Path]) -> Iterator[dict]:
+    """
+    Lazily read records from a length-prefixed binary record stream
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to binary record stream
+
+    Yields
+    ------
+    record : dict
+        Parsed record
+    """
+
+    for payload in iter_binary_frames(filepath):
+        yield json.loads(payload)
+
+
+# .................................................................................................
+def is_binary_file(filepath: Union[str, Path]) -> bool:
+    """
+    Return True if the file is a length-prefixed binary record stream
+    """
+
+    with open(filepath, "rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+# .................................................................................................
+def shard_boundaries(filepath: Union[str, Path], n_shards: int) -> List[Tuple[int, int]]:
+    """
+    Split a JSON Lines file or binary record stream into byte ranges aligned to record starts
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to JSON Lines file or binary record stream
+    n_shards : int
+        Requested number of shards. Fewer are returned if the file has fewer records.
+
+    Returns
+    -------
+    shards : List[Tuple[int, int]]
+        Half-open (start, end) byte ranges that together cover every record exactly once
+    """
+
+    size = Path(filepath).stat().st_size
+    binary = is_binary_file(filepath)
+    first = len(BINARY_MAGIC) if binary else 0
+    targets = [first + (size - first) * i // max(n_shards, 1) for i in range(1, n_shards)]
+
+    starts = [first]
+    with open(filepath, "rb") as f:
+        if binary:
+            position = first
+            for target in targets:
+                while position < min(target, size):
+                    f.seek(position)
+                    (length,) = BINARY_LENGTH.unpack(f.read(BINARY_LENGTH.size))
+                    position += BINARY_LENGTH.size + length
+                starts.append(min(position, size))
+
+        else:
+            for target in targets:
+                # Step back one byte so a target landing exactly on a line start is kept
+                f.seek(max(target - 1, 0))
+                f.readline()
+                starts.append(f.tell())
+
+    starts = sorted(set(starts))
+    ends = starts[1:] + [size]
+
+    return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+
+# .................................................................................................
+def iter_payloads(
+    filepath: Union[str, Path],
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Lazily read raw JSON payloads from a JSON Lines file or binary record stream
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to JSON Lines file or binary record stream
+    start : int, optional
+        Byte offset of the first record to read, as returned by `shard_boundaries`
+    end : int, optional
+        Byte offset at which to stop reading
+
+    Yields
+    ------
+    payload : bytes
+        Raw JSON payload of a single record, decompressed if needed
+
+    Raises
+    ------
+    ValueError
+        If a record of a binary record stream is truncated
+    """
+
+    binary = is_binary_file(filepath)
+    if start is None:
+        start = len(BINARY_MAGIC) if binary else 0
+
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        position = start
+
+        while end is None or position < end:
+            if binary:
+                payload = _read_binary_frame(f, filepath)
+                if payload is None:
+                    break
+
+                position += BINARY_LENGTH.size + len(payload)
+                payload = decode_payload(payload)
+
+            else:
+                payload = f.readline()
+                if not payload:
+                    break
+
+                position += len(payload)
+                payload = payload.strip()
+                if not payload:
+                    continue
+
+            yield payload
+
+
+# .................................................................................................
+# Message archive layout (little-endian), all sections 8-byte aligned:
+#
+#   header    ARCHIVE_HEADER, see below
+#   times     int64[count]       sorted time key of each record, in ns since the Unix epoch
+#   offsets   int64[count + 1]   start of each record's payload relative to the payload section
+#   uuids     ARCHIVE_UUID[count] 16-byte uuid keys sorted bytewise, with their record numbers
+#   payloads  concatenated JSON payloads in record (time) order
+#
+# Header: magic, format version, payload codec, record count, and the byte offsets of the times,
+# offsets, uuids and payload sections, followed by the payload section size. With the zstd codec
+# every payload is compressed on its own with the message dictionary, keeping random access.
+ARCHIVE_MAGIC = b"SNEWSARC"
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = struct.Struct("<8sII6Q")
+ARCHIVE_UUID = np.dtype([("key", "S16"), ("record", "<i8")])
+ARCHIVE_CODEC_JSON = 0
+ARCHIVE_CODEC_ZSTD = 1
+ARCHIVE_CODECS = (ARCHIVE_CODEC_JSON, ARCHIVE_CODEC_ZSTD)
+
+# Records without any timestamp sort first
+NO_TIME = np.iinfo(np.int64).min
+
+
+# .................................................................................................
+def _align(n: int) -> int:
+    return (n + 7) // 8 * 8
+
+
+# .................................................................................................
+def uuid_key(value: str) -> bytes:
+    """
+    Return the 16-byte archive index key of a message uuid
+
+    Valid UUIDs map to their raw bytes; any other string maps to a 16-byte BLAKE2b digest.
+    """
+
+    try:
+        return uuid.UUID(value).bytes
+    except (ValueError, AttributeError, TypeError):
+        return hashlib.blake2b(str(value).encode("utf-8"), digest_size=16).digest()
+
+
+# .................................................................................................
+def time_key(record: dict) -> int:
+    """
+    Return the archive time key of a message: the neutrino time if present, otherwise the
+    machine time, otherwise the sent time, as integer nanoseconds since the Unix epoch
+    """
+    # Imported here to avoid a circular import with the timing models
+    from ..models.timing import timestamp_to_ns
+
+    for field in ("neutrino_time_utc", "machine_time_utc", "sent_time_utc"):
+        value = record.get(field)
+        if value is not None:
+            return timestamp_to_ns(value)
+
+    return int(NO_TIME)
+
+
+# .................................................................................................
+def write_archive(
+    filepath: Union[str, Path], messages: Iterable, codec: int = ARCHIVE_CODEC_JSON
+) -> int:
+    """
+    Write messages to a memory-mappable archive indexed by time and uuid
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to output file
+    messages : Iterable[Union[MessageBase, dict]]
+        Validated messages, or dicts shaped like `model_dump(mode="json")` of one
+    codec : int
+        `ARCHIVE_CODEC_JSON` for plain payloads, or `ARCHIVE_CODEC_ZSTD` to compress every
+        payload with the message dictionary (requires zstandard)
+
+    Returns
+    -------
+    count : int
+        Number of messages written
+    """
+
+    if codec not in ARCHIVE_CODECS:
+        raise ValueError(f"Unknown archive codec {codec}")
+
+    records = [m if isinstance(m, dict) else m.model_dump(mode="json") for m in messages]
+    times = np.array([time_key(r) for r in records], dtype="<i8")
+
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    payloads = [encode_record(records[i]) for i in order]
+    if codec == ARCHIVE_CODEC_ZSTD:
+        payloads = [compress_payload(p) for p in payloads]
+
+    offsets = np.zeros(len(payloads) + 1, dtype="<i8")
+    offsets[1:] = np.cumsum([len(p) for p in payloads])
+
+    uuids = np.empty(len(records), dtype=ARCHIVE_UUID)
+    uuids["key"] = [uuid_key(records[i].get("uuid")) for i in order]
+    uuids["record"] = np.arange(len(records))
+    uuids = uuids[np.argsort(uuids["key"], kind="stable")]
+
+    times_at = _align(ARCHIVE_HEADER.size)
+    offsets_at = _align(times_at + times.nbytes)
+    uuids_at = _align(offsets_at + offsets.nbytes)
+    payloads_at = _align(uuids_at + uuids.nbytes)
+
+    header = ARCHIVE_HEADER.pack(
+        ARCHIVE_MAGIC, ARCHIVE_VERSION, codec, len(records),
+        times_at, offsets_at, uuids_at, payloads_at, int(offsets[-1]),
+    )
+
+    with open(filepath, "wb") as f:
+        for position, section in [
+            (0, header),
+            (times_at, times.tobytes()),
+            (offsets_at, offsets.tobytes()),
+            (uuids_at, uuids.tobytes()),
+            (payloads_at, b"".join(payloads)),
+        ]:
+            f.write(b"\0" * (position - f.tell()))
+            f.write(section)
+
+    return len(records)
+
+
+# .................................................................................................
+class MessageArchive:
+    """Read-only, memory-mapped message archive with random access by time and uuid
+
+    Opening an archive only reads its header; the indexes and payloads are zero-copy views into
+    the memory-mapped file, and messages are decoded on access.
+
+    Args:
+        filepath: Path to an archive written by `write_archive`
+
+    Examples
+    --------
+    >>> with MessageArchive("messages.snar") as archive:
+    ...     messages = archive.around("2024-01-01T12:00:00", before_sec=300, after_sec=300)
+    """
+
+    def __init__(self, filepath: Union[str, Path]):
+        self.filepath = Path(filepath)
+
+        with open(self.filepath, "rb") as f:
+            header = f.read(ARCHIVE_HEADER.size)
+            if len(header) < ARCHIVE_HEADER.size or not header.startswith(ARCHIVE_MAGIC):
+                raise ValueError(f"{filepath} is not a SNEWS message archive")
+
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (_, version, codec, count, times_at, offsets_at, uuids_at, payloads_at,
+         payloads_size) = ARCHIVE_HEADER.unpack(header)
+
+        if version != ARCHIVE_VERSION or codec not in ARCHIVE_CODECS:
+            self._mmap.close()
+            if version != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported archive version {version} in {filepath}")
+            raise ValueError(f"Unsupported archive codec {codec} in {filepath}")
+
+        self.codec = codec
+        self.times = np.frombuffer(self._mmap, dtype="<i8", count=count, offset=times_at)
+        self.offsets = np.frombuffer(self._mmap, dtype="<i8", count=count + 1, offset=offsets_at)
+        self.uuids = np.frombuffer(self._mmap, dtype=ARCHIVE_UUID, count=count, offset=uuids_at)
+        self.payloads = np.frombuffer(
+            self._mmap, dtype=np.uint8, count=payloads_size, offset=payloads_at
+        )
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the archive file
+
+        Payload views taken with `payload` must be released first.
+        """
+        self.times = self.offsets = self.uuids = self.payloads = None
+        self._mmap.close()
+
+    # .............................................................................................
+    def payload(self, record: int) -> memoryview:
+        """Zero-copy view of one record's payload as stored, compressed with the zstd codec."""
+        start, end = self.offsets[record], self.offsets[record + 1]
+        return memoryview(self.payloads[start:end])
+
+    def record(self, record: int) -> dict:
+        """One record as a dict."""
+        payload = self.payload(record)
+        if self.codec == ARCHIVE_CODEC_ZSTD:
+            return json.loads(decode_payload(payload))
+
+        return json.loads(payload.tobytes())
+
+    def message(self, record: int):
+        """One record as a message model, built without re-validation."""
+        return self._construct(self.record(record))
+
+    @staticmethod
+    def _construct(record: dict):
+        # Imported here to avoid a circular import with the message models
+        from ..models.messages import construct_message
+
+        return construct_message(record)
+
+    # .............................................................................................
+    def between(self, start, end) -> range:
+        """
+        Record numbers with a time key in the half-open interval [start, end)
+
+        Times may be ISO 8601 strings, numpy datetimes, or integer ns since the Unix epoch.
+        """
+        from ..models.timing import timestamp_to_ns
+
+        first, last = np.searchsorted(
+            self.times, [timestamp_to_ns(start), timestamp_to_ns(end)], side="left"
+        )
+        return range(int(first), int(last))
+
+    def around(self, center, before_sec: float = 300, after_sec: float = 300) -> list:
+        """
+        Messages with a time key within a window around a time, in time order
+        """
+        from ..models.timing import timestamp_to_ns
+
+        center = timestamp_to_ns(center)
+        records = self.between(
+            center - int(before_sec * 1e9), center + int(after_sec * 1e9) + 1
+        )
+        return [self.message(i) for i in records]
+
+    def _matches(self, message_uuid: str) -> Iterator[Tuple[int, dict]]:
+        """Record numbers and decoded records of the messages with the given uuid."""
+        keys = self.uuids["key"]
+        key = np.array(uuid_key(message_uuid), dtype="S16")
+        first = int(np.searchsorted(keys, key, side="left"))
+        last = int(np.searchsorted(keys, key, side="right"))
+
+        # Hashed keys of non-uuid strings may collide, so candidates are checked
+        for r in self.uuids["record"][first:last]:
+            record = self.record(int(r))
+            if record.get("uuid") == message_uuid:
+                yield int(r), record
+
+    def find(self, message_uuid: str) -> List[int]:
+        """
+        Record numbers of all messages with the given uuid
+        """
+        return [r for r, _ in self._matches(message_uuid)]
+
+    def get(self, message_uuid: str):
+        """
+        The message with the given uuid, or None if there is none
+        """
+        match = next(self._matches(message_uuid), None)
+        return None if match is None else self._construct(match[1])
+
+
+# .................................................................................................
+# File formats understood by `read_records` and `write_records`, by file suffix
+FORMATS = {
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".bin": "binary",
+    ".snar": "archive",
+    ".parquet": "parquet",
+}
+
+# Parquet files hold the full JSON payload of each record, plus these fields as columns so that
+# they can be filtered on without decoding payloads
+PARQUET_COLUMNS = ("tier", "uuid", "detector_name", "sent_time_utc", "machine_time_utc")
+
+
+# .................................................................................................
+def infer_format(filepath: Union[str, Path]) -> str:
+    """
+    Infer the format of a message file from its magic bytes, or from its suffix
+
+    Returns
+    -------
+    format : str
+        One of `json`, `jsonl`, `binary`, `archive` or `parquet`
+    """
+
+    path = Path(filepath)
+    if path.is_file():
+        with open(path, "rb") as f:
+            magic = f.read(8)
+
+        if magic == BINARY_MAGIC:
+            return "binary"
+        if magic == ARCHIVE_MAGIC:
+            return "archive"
+        if magic[:4] == b"PAR1":
+            return "parquet"
+
+    try:
+        return FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Cannot infer the format of {filepath}, "
+            f"expected one of {sorted(set(FORMATS.values()))}"
+        )
+
+
+# .................................................................................................
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Reading and writing Parquet files requires pyarrow: pip install pyarrow")
+
+    return pyarrow
+
+
+# .................................................................................................
+def write_parquet(
+    filepath: Union[str, Path], records: Iterable[dict], batch_size: int = 10_000
+) -> int:
+    """
+    Write records to a Parquet file in batches, one row per record (requires pyarrow)
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to output file
+    records : Iterable[dict]
+        JSON-serializable records
+    batch_size : int
+        Number of records per row group
+
+    Returns
+    -------
+    count : int
+        Number of records written
+    """
+
+    pa = _import_pyarrow()
+    schema = pa.schema(
+        [(column, pa.string()) for column in PARQUET_COLUMNS]
+        + [("time_ns", pa.int64()), ("payload", pa.string())]
+    )
+
+    def to_batch(batch):
+        columns = {column: [r.get(column) for r in batch] for column in PARQUET_COLUMNS}
+        columns["time_ns"] = [time_key(r) for r in batch]
+        columns["payload"] = [encode_record(r).decode("utf-8") for r in batch]
+        return pa.record_batch([columns[name] for name in schema.names], schema=schema)
+
+    count = 0
+    with pa.parquet.ParquetWriter(str(filepath), schema) as writer:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == batch_size:
+                writer.write_batch(to_batch(batch))
+                count, batch = count + len(batch), []
+
+        if batch or count == 0:
+            writer.write_batch(to_batch(batch))
+            count += len(batch)
+
+    return count
+
+
+# .................................................................................................
+def read_parquet(filepath: Union[str, Path], batch_size: int = 10_000) -> Iterator[dict]:
+    """
+    Lazily read records from a Parquet file written by `write_parquet` (requires pyarrow)
+    """
+
+    pa = _import_pyarrow()
+    with pa.parquet.ParquetFile(str(filepath)) as f:
+        for batch in f.iter_batches(batch_size=batch_size, columns=["payload"]):
+            for payload in batch.column(0).to_pylist():
+                yield json.loads(payload)
+
+
+# .................................................................................................
+def write_json_array(filepath: Union[str, Path], records: Iterable[dict]) -> int:
+    """
+    Write records to a JSON file holding a single array, one record per line
+    """
+
+    count = 0
+    with open(filepath, "wb") as f:
+        f.write(b"[")
+        for record in records:
+            f.write((b",\n" if count else b"\n") + encode_record(record))
+            count += 1
+        f.write(b"\n]\n")
+
+    return count
+
+
+# .................................................................................................
+def read_records(filepath: Union[str, Path], format: Optional[str] = None) -> Iterator[dict]:
+    """
+    Read records from a message file in any supported format
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to input file
+    format : str, optional
+        One of `json`, `jsonl`, `binary`, `archive` or `parquet`. Inferred if not given.
+
+    Yields
+    ------
+    record : dict
+        Parsed record. All formats except `json` are read lazily.
+    """
+
+    format = format or infer_format(filepath)
+
+    if format == "json":
+        records = read_json_file(Path(filepath))
+        yield from records if isinstance(records, list) else [records]
+
+    elif format == "jsonl":
+        yield from read_json_lines(filepath)
+
+    elif format == "binary":
+        yield from read_binary(filepath)
+
+    elif format == "archive":
+        with MessageArchive(filepath) as archive:
+            for i in range(len(archive)):
+                yield archive.record(i)
+
+    elif format == "parquet":
+        yield from read_parquet(filepath)
+
+    else:
+        raise ValueError(f"Unknown format '{format}'")
+
+
+# .................................................................................................
+def write_records(
+    filepath: Union[str, Path], records: Iterable[dict], format: Optional[str] = None
+) -> int:
+    """
+    Write records to a message file in any supported format
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to output file
+    records : Iterable[dict]
+        JSON-serializable records
+    format : str, optional
+        One of `json`, `jsonl`, `binary`, `archive` or `parquet`. Inferred from the file suffix
+        if not given. Archives are sorted by time, so all records are held in memory.
+
+    Returns
+    -------
+    count : int
+        Number of records written
+    """
+
+    writers = {
+        "json": write_json_array,
+        "jsonl": write_json_lines,
+        "binary": write_binary,
+        "archive": write_archive,
+        "parquet": write_parquet,
+    }
+
+    format = format or FORMATS.get(Path(filepath).suffix.lower())
+    if format not in writers:
+        raise ValueError(f"Unknown format '{format}' for {filepath}")
+
+    return writers[format](filepath, records)
@@ -5,11 +5,15 @@ from importlib import resources
 
 # Local imports
 from ..io import read_json_file
+from . import generate
+from .generate import MessageGenerator
 
 # Module exports
 __all__ = [
     "coincidence_scenarios",
+    "generate",
     "time_formats",
+    "MessageGenerator",
 ]
 
 
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic SNEWS message streams for load testing
+
+Messages are produced as plain dicts shaped like ``model_dump(mode="json")`` of the message
+models, so they can be written straight to disk or fed to consumers without building models.
+"""
+
+# Standard library imports
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Iterable, List, Literal, Optional, Sequence, Union
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from ...__version__ import schema_version
+from ...models.messages import Tier
+from ...models.timing import NS_PER_SEC
+from .. import detectors
+from ..io import write_binary, write_json_lines
+
+# Module exports
+__all__ = [
+    "MessageGenerator",
+]
+
+
+# .................................................................................................
+def _to_ns(timestamp: Union[str, datetime, np.datetime64, None]) -> int:
+    """Convert a timestamp (default: now) to integer nanoseconds since the Unix epoch."""
+    if timestamp is None:
+        timestamp = datetime.now(UTC)
+
+    if isinstance(timestamp, datetime) and timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+
+    return int(np.datetime64(timestamp, "ns").astype(np.int64))
+
+
+# .................................................................................................
+def _format_ns(times_ns: np.ndarray) -> np.ndarray:
+    """Vectorized formatting of integer nanoseconds as ISO 8601 strings with ns precision."""
+    return np.datetime_as_string(
+        np.asarray(times_ns, dtype=np.int64).astype("datetime64[ns]"),
+        unit="ns",
+        timezone="UTC",
+    )
+
+
+# .................................................................................................
+class MessageGenerator:
+    """Seedable, vectorized generator of synthetic SNEWS messages
+
+    Args:
+        seed (optional): Seed for the random number generator. Defaults to fresh entropy.
+        start (optional): Start of the generated stream. Defaults to current UTC time.
+        detector_names (optional): Detectors sending messages. Defaults to all registered.
+        is_test (optional): Value of the `is_test` flag on every message. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        start: Union[str, datetime, np.datetime64, None] = None,
+        detector_names: Optional[Sequence[str]] = None,
+        is_test: bool = True,
+    ):
+        self.rng = np.random.default_rng(seed)
+        self.start_ns = _to_ns(start)
+        self.detector_names = list(detector_names or detectors.names)
+        self.is_test = is_test
+
+    # .............................................................................................
+    def _uuids(self, n: int) -> List[str]:
+        """Random version 4 UUID strings drawn from the generator's random state."""
+        raw = self.rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+        uuids = []
+        for row in raw:
+            h = row.tobytes().hex()
+            uuids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+
+        return uuids
+
+    def _detectors(self, n: int) -> np.ndarray:
+        return self.rng.choice(np.asarray(self.detector_names), size=n)
+
+    def _envelopes(
+        self,
+        tier: Tier,
+        sent_ns: np.ndarray,
+        detector_names: np.ndarray,
+        latency_sec: float = 0.05,
+    ) -> List[dict]:
+        """Fields shared by every message type, with the machine time preceding the sent time."""
+        n = len(sent_ns)
+        latency_ns = (self.rng.exponential(latency_sec, size=n) * NS_PER_SEC).astype(np.int64)
+        sent_utc = _format_ns(sent_ns)
+        machine_utc = _format_ns(sent_ns - latency_ns)
+
+        return [
+            {
+                "id": f"{detector_names[i]}_{tier.value}_{machine_utc[i]}",
+                "uuid": uuid,
+                "tier": tier.value,
+                "sent_time_utc": str(sent_utc[i]),
+                "machine_time_utc": str(machine_utc[i]),
+                "is_pre_sn": False,
+                "is_test": self.is_test,
+                "is_firedrill": False,
+                "meta": None,
+                "schema_version": schema_version,
+                "detector_name": str(detector_names[i]),
+            }
+            for i, uuid in enumerate(self._uuids(n))
+        ]
+
+    def _arrivals(self, rate_hz: float, duration_sec: float) -> np.ndarray:
+        """Sorted Poisson arrival times (ns) over the stream duration."""
+        n = self.rng.poisson(rate_hz * duration_sec)
+        offsets = np.sort(self.rng.uniform(0, duration_sec, size=n))
+        return self.start_ns + (offsets * NS_PER_SEC).astype(np.int64)
+
+    # .............................................................................................
+    def heartbeats(
+        self,
+        duration_sec: float,
+        interval_sec: float = 10.0,
+        p_off: float = 0.01,
+    ) -> List[dict]:
+        """
+        Periodic heartbeats from every detector, with jittered phases
+
+        Parameters
+        ----------
+        duration_sec : float
+            Length of the stream in seconds
+        interval_sec : float
+            Time between heartbeats of a single detector in seconds
+        p_off : float
+            Probability that a detector reports status OFF
+
+        Returns
+        -------
+        messages : List[dict]
+            Heartbeat messages sorted by sent time
+        """
+
+        n_beats = max(int(duration_sec // interval_sec), 1)
+        n_detectors = len(self.detector_names)
+
+        phases = self.rng.uniform(0, interval_sec, size=n_detectors)
+        ticks = np.arange(n_beats) * interval_sec
+        offsets = (ticks[None, :] + phases[:, None]).ravel()
+        names = np.repeat(np.asarray(self.detector_names), n_beats)
+
+        order = np.argsort(offsets, kind="stable")
+        sent_ns = self.start_ns + (offsets[order] * NS_PER_SEC).astype(np.int64)
+        messages = self._envelopes(Tier.HEART_BEAT, sent_ns, names[order])
+
+        statuses = np.where(self.rng.random(len(messages)) < p_off, "OFF", "ON")
+        for message, status in zip(messages, statuses):
+            message["detector_status"] = str(status)
+
+        return messages
+
+    def timing_bursts(
+        self,
+        sent_ns: np.ndarray,
+        hits_per_burst: int = 1000,
+        decay_sec: float = 3.0,
+    ) -> List[dict]:
+        """
+        Timing tier messages, each carrying a burst of exponentially decaying hit times
+
+        Parameters
+        ----------
+        sent_ns : np.ndarray
+            Send times of the messages in integer nanoseconds
+        hits_per_burst : int
+            Number of hits in each message's timing series
+        decay_sec : float
+            Decay constant of the burst in seconds
+
+        Returns
+        -------
+        messages : List[dict]
+            Timing tier messages
+        """
+
+        sent_ns = np.asarray(sent_ns, dtype=np.int64)
+        messages = self._envelopes(Tier.TIMING_TIER, sent_ns, self._detectors(len(sent_ns)))
+
+        # Hits start one burst length (plus jitter) before the message is sent
+        lead_sec = 5 * decay_sec + self.rng.uniform(0, 1, len(sent_ns))
+        onsets = sent_ns - (lead_sec * NS_PER_SEC).astype(np.int64)
+        offsets = np.sort(self.rng.exponential(decay_sec, size=(len(sent_ns), hits_per_burst)))
+        hits_ns = onsets[:, None] + (offsets * NS_PER_SEC).astype(np.int64)
+        hits_utc = _format_ns(hits_ns)
+
+        p_vals = self.rng.uniform(0, 1, len(sent_ns))
+        for message, hits, p_val in zip(messages, hits_utc, p_vals):
+            message["p_val"] = float(p_val)
+            message["timing_series"] = hits.tolist()
+
+        return messages
+
+    def significance_series(
+        self,
+        sent_ns: np.ndarray,
+        n_bins: int = 100,
+        t_bin_width_sec: float = 1e-3,
+    ) -> List[dict]:
+        """
+        Significance tier messages with a p-value series per message
+
+        Parameters
+        ----------
+        sent_ns : np.ndarray
+            Send times of the messages in integer nanoseconds
+        n_bins : int
+            Number of p-values in each message
+        t_bin_width_sec : float
+            Width of each time bin in seconds
+
+        Returns
+        -------
+        messages : List[dict]
+            Significance tier messages
+        """
+
+        sent_ns = np.asarray(sent_ns, dtype=np.int64)
+        messages = self._envelopes(Tier.SIGNIFICANCE_TIER, sent_ns, self._detectors(len(sent_ns)))
+
+        # Background p-values are uniform; a signal pulls a few bins towards zero
+        p_values = self.rng.uniform(0, 1, size=(len(sent_ns), n_bins))
+        p_values *= np.where(self.rng.random((len(sent_ns), n_bins)) < 0.05, 1e-3, 1.0)
+        p_vals = p_values.min(axis=1)
+
+        for message, p_series, p_val in zip(messages, p_values, p_vals):
+            message["p_val"] = float(p_val)
+            message["p_values"] = p_series.tolist()
+            message["t_bin_width_sec"] = t_bin_width_sec
+
+        return messages
+
+    def coincidences(self, sent_ns: np.ndarray) -> List[dict]:
+        """
+        Coincidence tier messages with a neutrino time shortly before the send time
+
+        Parameters
+        ----------
+        sent_ns : np.ndarray
+            Send times of the messages in integer nanoseconds
+
+        Returns
+        -------
+        messages : List[dict]
+            Coincidence tier messages
+        """
+
+        sent_ns = np.asarray(sent_ns, dtype=np.int64)
+        messages = self._envelopes(Tier.COINCIDENCE_TIER, sent_ns, self._detectors(len(sent_ns)))
+
+        delays_ns = (self.rng.uniform(1, 60, len(sent_ns)) * NS_PER_SEC).astype(np.int64)
+        neutrino_utc = _format_ns(sent_ns - delays_ns)
+        p_vals = self.rng.uniform(0, 1, len(sent_ns))
+
+        for message, neutrino_time, p_val in zip(messages, neutrino_utc, p_vals):
+            message["p_val"] = float(p_val)
+            message["neutrino_time_utc"] = str(neutrino_time)
+
+        return messages
+
+    def retractions(self, sent_ns: np.ndarray, targets: Sequence[str] = ()) -> List[dict]:
+        """
+        Retraction messages, retracting either a known message or the latest few
+
+        Parameters
+        ----------
+        sent_ns : np.ndarray
+            Send times of the messages in integer nanoseconds
+        targets : Sequence[str]
+            UUIDs of earlier messages that may be retracted
+
+        Returns
+        -------
+        messages : List[dict]
+            Retraction messages
+        """
+
+        sent_ns = np.asarray(sent_ns, dtype=np.int64)
+        messages = self._envelopes(Tier.RETRACTION, sent_ns, self._detectors(len(sent_ns)))
+
+        by_uuid = self.rng.random(len(sent_ns)) < 0.5 if len(targets) else np.zeros(len(sent_ns))
+        latest_n = self.rng.integers(1, 4, len(sent_ns))
+        picks = self.rng.integers(0, max(len(targets), 1), len(sent_ns))
+
+        for i, message in enumerate(messages):
+            message["retract_message_uuid"] = targets[picks[i]] if by_uuid[i] else None
+            message["retract_latest_n"] = 0 if by_uuid[i] else int(latest_n[i])
+            message["retraction_reason"] = "Synthetic retraction"
+
+        return messages
+
+    # .............................................................................................
+    def stream(
+        self,
+        duration_sec: float,
+        heartbeat_interval_sec: float = 10.0,
+        timing_rate_hz: float = 0.01,
+        significance_rate_hz: float = 0.01,
+        coincidence_rate_hz: float = 0.01,
+        retraction_rate_hz: float = 0.001,
+        hits_per_burst: int = 1000,
+        scale: float = 1.0,
+    ) -> List[dict]:
+        """
+        Mixed stream of all message types, sorted by sent time
+
+        Parameters
+        ----------
+        duration_sec : float
+            Length of the stream in seconds
+        heartbeat_interval_sec : float
+            Time between heartbeats of a single detector in seconds
+        timing_rate_hz : float
+            Mean rate of timing tier messages
+        significance_rate_hz : float
+            Mean rate of significance tier messages
+        coincidence_rate_hz : float
+            Mean rate of coincidence tier messages
+        retraction_rate_hz : float
+            Mean rate of retraction messages
+        hits_per_burst : int
+            Number of hits in each timing tier message
+        scale : float
+            Multiplier applied to every rate, e.g. 10 or 100 for load tests
+
+        Returns
+        -------
+        messages : List[dict]
+            Messages from all tiers
+
+        Examples
+        --------
+        >>> generator = MessageGenerator(seed=42)
+        >>> messages = generator.stream(duration_sec=3600, scale=10)
+        """
+
+        messages = self.heartbeats(duration_sec, heartbeat_interval_sec / scale)
+        messages += self.timing_bursts(
+            self._arrivals(timing_rate_hz * scale, duration_sec), hits_per_burst
+        )
+        messages += self.significance_series(
+            self._arrivals(significance_rate_hz * scale, duration_sec)
+        )
+        messages += self.coincidences(self._arrivals(coincidence_rate_hz * scale, duration_sec))
+
+        targets = [m["uuid"] for m in messages if m["tier"] != Tier.HEART_BEAT.value]
+        messages += self.retractions(
+            self._arrivals(retraction_rate_hz * scale, duration_sec), targets
+        )
+
+        messages.sort(key=lambda m: m["sent_time_utc"])
+
+        return messages
+
+    # .............................................................................................
+    @staticmethod
+    def write(
+        filepath: Union[str, Path],
+        messages: Iterable[dict],
+        format: Literal["jsonl", "binary"] = "jsonl",
+    ) -> int:
+        """
+        Write generated messages to JSON Lines or a binary record stream
+
+        Parameters
+        ----------
+        filepath : Union[str, Path]
+            Path to output file
+        messages : Iterable[dict]
+            Generated messages
+        format : Literal["jsonl", "binary"]
+            Output format
+
+        Returns
+        -------
+        count : int
+            Number of messages written
+        """
+
+        writers = {"jsonl": write_json_lines, "binary": write_binary}
+        if format not in writers:
+            raise ValueError(f"Unsupported format '{format}', expected one of {list(writers)}")
+
+        return writers[format](filepath, messages)
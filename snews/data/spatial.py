@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Spatial index over detectors
+
+Detector positions are precomputed as unit vectors on a spherical Earth, together with arrays of
+the attributes used for filtering, so that distance queries are plain numpy expressions over all
+detectors and never build pydantic objects.
+"""
+
+__all__ = [
+    "DetectorIndex",
+    "EARTH_RADIUS_KM",
+    "chord_distance",
+    "great_circle_distance",
+    "unit_vectors",
+]
+
+# Standard library modules
+from typing import Iterable, List, Literal, Optional, Tuple, Union
+
+# Third-party modules
+import numpy as np
+
+# Local modules
+from ..models.detectors import Detector, DetectorType
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+DistanceKind = Literal["surface", "chord"]
+
+
+# .................................................................................................
+def unit_vectors(latitude, longitude) -> np.ndarray:
+    """
+    Earth-centred unit vectors of points given by latitude and longitude in degrees
+
+    Returns
+    -------
+    vectors : np.ndarray
+        Array of shape (..., 3)
+    """
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    cos_lat = np.cos(lat)
+
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+# .................................................................................................
+def great_circle_distance(u: np.ndarray, v: np.ndarray, radius_km: float = EARTH_RADIUS_KM):
+    """
+    Great-circle distance in km between points given as unit vectors
+
+    Uses the haversine form, 2 R asin(|u - v| / 2), which stays accurate for nearby points.
+    """
+    half_chord = np.linalg.norm(np.asarray(u) - np.asarray(v), axis=-1) / 2
+    return 2 * radius_km * np.arcsin(np.clip(half_chord, 0, 1))
+
+
+# .................................................................................................
+def chord_distance(
+    u: np.ndarray,
+    v: np.ndarray,
+    depth_u_meters=0.0,
+    depth_v_meters=0.0,
+    radius_km: float = EARTH_RADIUS_KM,
+):
+    """
+    Straight-line distance in km through the Earth between points given as unit vectors and depths
+    """
+    r_u = (radius_km - np.asarray(depth_u_meters) / 1e3)[..., None] * np.asarray(u)
+    r_v = (radius_km - np.asarray(depth_v_meters) / 1e3)[..., None] * np.asarray(v)
+
+    return np.linalg.norm(r_u - r_v, axis=-1)
+
+
+# .................................................................................................
+class DetectorIndex:
+    """
+    Precomputed positions and attributes of detectors for vectorized queries
+
+    Parameters
+    ----------
+    detectors : Iterable[Detector]
+        Detectors to index
+
+    Examples
+    --------
+    >>> from snews.data import detectors
+    >>> detectors.index.within(36.0, -137.0, radius_km=500)
+    [('Super-K', 54.9...)]
+    >>> detectors.index.nearest(0.0, 0.0, n=3, type=DetectorType.WATER_CERENKOV, min_mass_kt=10)
+    """
+
+    def __init__(self, detectors: Iterable[Detector]):
+        self.detectors: List[Detector] = list(detectors)
+
+        self.names = np.array([d.name for d in self.detectors], dtype=object)
+        self.types = np.array([d.type.value for d in self.detectors], dtype=object)
+        self.mass_kt = np.array([d.mass_kt for d in self.detectors], dtype=float)
+        self.depth_meters = np.array([d.depth_meters for d in self.detectors], dtype=float)
+        self.latitude = np.array([d.latitude for d in self.detectors], dtype=float)
+        self.longitude = np.array([d.longitude for d in self.detectors], dtype=float)
+        self.vectors = unit_vectors(self.latitude, self.longitude).reshape(-1, 3)
+
+        self._positions = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.detectors)
+
+    def __getitem__(self, name: str) -> Detector:
+        return self.detectors[self._positions[name]]
+
+    def mask(
+        self,
+        type: Optional[Union[DetectorType, str, Iterable[Union[DetectorType, str]]]] = None,
+        min_mass_kt: Optional[float] = None,
+        max_mass_kt: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Boolean mask of detectors matching all of the given filters
+
+        Parameters
+        ----------
+        type : Union[DetectorType, str, Iterable], optional
+            Detector type, or several of which any may match
+        min_mass_kt, max_mass_kt : float, optional
+            Inclusive bounds on detector mass
+        """
+        mask = np.ones(len(self), dtype=bool)
+
+        if type is not None:
+            types = [type] if isinstance(type, (DetectorType, str)) else list(type)
+            mask &= np.isin(self.types, [DetectorType(t).value for t in types])
+
+        if min_mass_kt is not None:
+            mask &= self.mass_kt >= min_mass_kt
+
+        if max_mass_kt is not None:
+            mask &= self.mass_kt <= max_mass_kt
+
+        return mask
+
+    def distances(
+        self,
+        latitude: float,
+        longitude: float,
+        depth_meters: float = 0.0,
+        kind: DistanceKind = "surface",
+    ) -> np.ndarray:
+        """
+        Distance in km from a point to every detector
+
+        Parameters
+        ----------
+        latitude, longitude : float
+            Coordinates of the point in degrees
+        depth_meters : float
+            Depth of the point, only used for chord distances
+        kind : str
+            `surface` for great-circle distance along the surface, ignoring depth, or `chord` for
+            straight-line distance through the Earth including detector depths
+        """
+        point = unit_vectors(latitude, longitude)
+
+        if kind == "surface":
+            return great_circle_distance(self.vectors, point)
+
+        if kind == "chord":
+            return chord_distance(self.vectors, point, self.depth_meters, depth_meters)
+
+        raise ValueError(f"Unknown distance kind '{kind}'")
+
+    def pairwise(self, kind: DistanceKind = "surface") -> np.ndarray:
+        """
+        Matrix of distances in km between all pairs of detectors, in index order
+        """
+        u, v = self.vectors[:, None, :], self.vectors[None, :, :]
+
+        if kind == "surface":
+            return great_circle_distance(u, v)
+
+        if kind == "chord":
+            return chord_distance(u, v, self.depth_meters[:, None], self.depth_meters[None, :])
+
+        raise ValueError(f"Unknown distance kind '{kind}'")
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        depth_meters: float = 0.0,
+        kind: DistanceKind = "surface",
+        **filters,
+    ) -> List[Tuple[str, float]]:
+        """
+        Detectors within a distance of a point, nearest first
+
+        Keyword arguments not listed are filters passed to `mask`.
+
+        Returns
+        -------
+        detectors : List[Tuple[str, float]]
+            Detector names and distances in km
+        """
+        distances = self.distances(latitude, longitude, depth_meters, kind)
+        selected = np.flatnonzero(self.mask(**filters) & (distances <= radius_km))
+        selected = selected[np.argsort(distances[selected], kind="stable")]
+
+        return [(self.names[i], float(distances[i])) for i in selected]
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        n: int = 1,
+        depth_meters: float = 0.0,
+        kind: DistanceKind = "surface",
+        **filters,
+    ) -> List[Tuple[str, float]]:
+        """
+        The `n` detectors nearest to a point, nearest first
+
+        Keyword arguments not listed are filters passed to `mask`.
+
+        Returns
+        -------
+        detectors : List[Tuple[str, float]]
+            Detector names and distances in km
+        """
+        distances = self.distances(latitude, longitude, depth_meters, kind)
+        selected = np.flatnonzero(self.mask(**filters))
+
+        if n < len(selected):
+            selected = selected[np.argpartition(distances[selected], n)[:n]]
+        selected = selected[np.argsort(distances[selected], kind="stable")]
+
+        return [(self.names[i], float(distances[i])) for i in selected]
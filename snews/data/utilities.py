@@ -10,6 +10,8 @@ from pydantic import BaseModel
 # Local imports
 from .timing import leap_seconds
 
+_leap_second_boundaries = np.array(leap_seconds, dtype="datetime64[ns]")
+
 
 # .................................................................................................
 def query(data: list, query: Any) -> Optional[list]:
@@ -110,6 +112,7 @@ def num_leap_seconds_between(date1: np.datetime64, date2: np.datetime64) -> int:
     """
     start, end = sorted([date1, date2])
 
-    boundaries_crossed = [b for b in leap_seconds if start <= b < end]
+    # Boundaries in [start, end), counted by bisecting the sorted boundary array
+    first, last = np.searchsorted(_leap_second_boundaries, [start, end], side="left")
 
-    return len(boundaries_crossed)
+    return int(last - first)
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Memory footprint of the message models
+
+Two measures are reported per message class:
+
+* the resident size of one message, as the deep `sys.getsizeof` of everything it references and
+  does not share with other messages, and
+* the bytes and number of memory blocks still allocated per message after constructing a batch of
+  them, traced with `tracemalloc`, which also counts allocator overhead the first measure misses.
+
+    snews_data_formats bench --memory
+"""
+
+__all__ = [
+    "allocation_profile",
+    "deep_getsizeof",
+    "format_memory_results",
+    "run_memory_benchmarks",
+]
+
+# Standard library imports
+import gc
+import json
+import sys
+import tracemalloc
+from enum import Enum
+from typing import Callable, List, Optional
+
+# Third-party imports
+from pydantic import BaseModel
+
+# Local imports
+from .data.mock import MessageGenerator
+from .models.messages import MESSAGE_TYPES, Tier, warm_up_message_models
+
+
+# .................................................................................................
+def deep_getsizeof(obj, seen: Optional[set] = None) -> int:
+    """
+    Size in bytes of an object and everything it references, counting shared objects once
+
+    Classes and enum members are shared by all instances and are not counted. Pydantic models
+    are followed through their field values, private attributes and extra fields; field names
+    are interned and shared, so only the containers holding them are counted.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen or isinstance(obj, (type, Enum)) or obj is None:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, BaseModel):
+        size += sys.getsizeof(obj.__dict__) + sys.getsizeof(obj.__pydantic_fields_set__)
+        size += sum(deep_getsizeof(v, seen) for v in obj.__dict__.values())
+        for attribute in ("__pydantic_extra__", "__pydantic_private__"):
+            size += deep_getsizeof(getattr(obj, attribute, None), seen)
+    elif isinstance(obj, dict):
+        size += sum(deep_getsizeof(k, seen) + deep_getsizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_getsizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += deep_getsizeof(vars(obj), seen)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_getsizeof(getattr(obj, s, None), seen) for s in obj.__slots__)
+
+    return size
+
+
+# .................................................................................................
+def allocation_profile(factory: Callable[[], object], n: int = 100) -> dict:
+    """
+    Memory still allocated per object after creating `n` objects with `factory`
+
+    Returns
+    -------
+    profile : dict
+        `bytes_per_object` and `blocks_per_object` retained, and `peak_bytes_per_object`
+        allocated at the peak, including temporaries
+    """
+
+    factory()
+    gc.collect()
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+
+        objects = [factory() for _ in range(n)]
+
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    # Leave out the snapshots' own memory
+    own = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    statistics = after.filter_traces(own).compare_to(before.filter_traces(own), "filename")
+    retained_bytes = sum(s.size_diff for s in statistics)
+    retained_blocks = sum(s.count_diff for s in statistics)
+    del objects
+
+    return {
+        "bytes_per_object": retained_bytes / n,
+        "blocks_per_object": retained_blocks / n,
+        "peak_bytes_per_object": (peak_bytes - start_bytes) / n,
+    }
+
+
+# .................................................................................................
+def _sample_payloads(hits_per_burst: int, n_bins: int, seed: int) -> dict:
+    """One payload per tier from the synthetic message generator."""
+    generator = MessageGenerator(seed=seed, start="2024-01-01T00:00:00")
+    sent_ns = generator.start_ns + 10**9 * generator.rng.integers(1, 60, size=1)
+
+    return {
+        Tier.HEART_BEAT: generator.heartbeats(duration_sec=1, interval_sec=1)[0],
+        Tier.RETRACTION: generator.retractions(sent_ns)[0],
+        Tier.TIMING_TIER: generator.timing_bursts(sent_ns, hits_per_burst=hits_per_burst)[0],
+        Tier.SIGNIFICANCE_TIER: generator.significance_series(sent_ns, n_bins=n_bins)[0],
+        Tier.COINCIDENCE_TIER: generator.coincidences(sent_ns)[0],
+    }
+
+
+# .................................................................................................
+def run_memory_benchmarks(
+    hits_per_burst: int = 10_000,
+    n_bins: int = 100,
+    n_messages: int = 20,
+    seed: int = 2024,
+) -> List[dict]:
+    """
+    Measure the memory footprint of one message of every class
+
+    Parameters
+    ----------
+    hits_per_burst : int
+        Number of hits in the timing tier message
+    n_bins : int
+        Number of p-values in the significance tier message
+    n_messages : int
+        Number of messages constructed for the allocation profile
+    seed : int
+        Seed of the synthetic message generator
+
+    Returns
+    -------
+    results : List[dict]
+        One entry per class, with the keys `message_type`, `deep_size_bytes`,
+        `bytes_per_message`, `blocks_per_message` and `peak_bytes_per_message`
+    """
+
+    warm_up_message_models()
+    payloads = _sample_payloads(hits_per_burst, n_bins, seed)
+
+    results = []
+    for tier, message_type in MESSAGE_TYPES.items():
+        # Decoding from JSON gives every message its own strings, as when receiving them
+        raw = json.dumps(payloads[tier])
+        profile = allocation_profile(lambda: message_type.model_validate_json(raw), n_messages)
+
+        results.append({
+            "message_type": message_type.__name__,
+            "deep_size_bytes": deep_getsizeof(message_type.model_validate_json(raw)),
+            "bytes_per_message": profile["bytes_per_object"],
+            "blocks_per_message": profile["blocks_per_object"],
+            "peak_bytes_per_message": profile["peak_bytes_per_object"],
+        })
+
+    return results
+
+
+# .................................................................................................
+def format_memory_results(results: List[dict]) -> str:
+    """
+    Render memory benchmark results as a plain-text table
+    """
+    header = (f"{'message type':<26}{'deep size (B)':>15}{'traced (B)':>14}"
+              f"{'blocks':>10}{'peak (B)':>14}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['message_type']:<26}{r['deep_size_bytes']:>15,}{r['bytes_per_message']:>14,.0f}"
+            f"{r['blocks_per_message']:>10,.1f}{r['peak_bytes_per_message']:>14,.0f}"
+        )
+
+    return "\n".join(lines)
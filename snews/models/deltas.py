@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Delta encoding of repeated heartbeat messages
+
+Detectors send nearly identical heartbeats every few seconds. The encoder sends a full heartbeat
+once per detector as a template frame, and after that only patch frames with the fields that
+differ from the template. Patch frames carry the uuid, the timestamps and sometimes the detector
+status.
+
+    {"template": {...full heartbeat...}}
+    {"detector_name": "Super-K", "patch": {"uuid": "...", "machine_time_utc": "..."}}
+
+The decoder checks only the patched fields, with the same rules as `HeartbeatMessage`, and copies
+them onto the already validated template. A patch that touches any other field falls back to full
+validation of the merged message.
+"""
+
+__all__ = [
+    "HeartbeatDeltaDecoder",
+    "HeartbeatDeltaEncoder",
+]
+
+# Standard library modules
+import copy
+from typing import Dict, Optional, Union
+
+# Third-party modules
+from pydantic import BaseModel
+
+# Local modules
+from .messages import HeartbeatMessage, Tier, convert_timestamp_to_ns_precision
+
+
+# .................................................................................................
+def _default_id(detector_name: str, machine_time_utc: Optional[str]) -> str:
+    """The id a heartbeat gets when none is given, see `MessageBase._format_id`."""
+    return f"{detector_name}_{Tier.HEART_BEAT.value}_{machine_time_utc}"
+
+
+# .................................................................................................
+def _validate_timestamp(v):
+    if v is not None:
+        return convert_timestamp_to_ns_precision(timestamp=v)
+
+
+# .................................................................................................
+def _validate_id(v):
+    if v is not None and not isinstance(v, str):
+        raise ValueError("Heartbeat id must be a string")
+    return v
+
+
+# .................................................................................................
+def _validate_detector_status(v):
+    if v not in {"ON", "OFF"}:
+        raise ValueError("Detector status must be either ON or OFF")
+    return v
+
+
+# Fields a patch frame may carry without triggering a new template, with the checks
+# `HeartbeatMessage` applies to them
+PATCH_VALIDATORS = {
+    "uuid": str,
+    "id": _validate_id,
+    "sent_time_utc": _validate_timestamp,
+    "machine_time_utc": _validate_timestamp,
+    "detector_status": _validate_detector_status,
+}
+
+
+# .................................................................................................
+class HeartbeatDeltaEncoder:
+    """
+    Encode heartbeats as per-detector templates followed by compact patches
+
+    Examples
+    --------
+    >>> encoder = HeartbeatDeltaEncoder()
+    >>> encoder.encode(HeartbeatMessage(detector_name="Super-K", detector_status="ON"))
+    {'template': {...}}
+    >>> encoder.encode(HeartbeatMessage(detector_name="Super-K", detector_status="ON"))
+    {'detector_name': 'Super-K', 'patch': {'uuid': '...', 'sent_time_utc': ...}}
+    """
+
+    def __init__(self):
+        self._templates: Dict[str, dict] = {}
+
+    def encode(self, message: Union[HeartbeatMessage, dict]) -> dict:
+        """
+        Encode a heartbeat as a template frame or a patch frame
+
+        Parameters
+        ----------
+        message : Union[HeartbeatMessage, dict]
+            Validated heartbeat, or a dict shaped like its `model_dump(mode="json")`
+
+        Returns
+        -------
+        frame : dict
+            JSON-serializable template or patch frame
+        """
+
+        record = message.model_dump(mode="json") if isinstance(message, BaseModel) else message
+        detector_name = record["detector_name"]
+        template = self._templates.get(detector_name)
+
+        if template is not None and template.keys() == record.keys():
+            patch = {k: v for k, v in record.items() if template[k] != v}
+
+            # The decoder regenerates ids that follow the default format
+            machine_time = patch.get("machine_time_utc", template["machine_time_utc"])
+            if record["id"] == _default_id(detector_name, machine_time):
+                patch.pop("id", None)
+            elif "id" not in patch:
+                patch["id"] = record["id"]
+
+            if patch.keys() <= PATCH_VALIDATORS.keys():
+                return {"detector_name": detector_name, "patch": patch}
+
+        self._templates[detector_name] = record
+        return {"template": record}
+
+    def reset(self, detector_name: Optional[str] = None) -> None:
+        """
+        Forget the template of one or all detectors, so the next heartbeat is sent in full.
+        """
+        if detector_name is None:
+            self._templates.clear()
+        else:
+            self._templates.pop(detector_name, None)
+
+
+# .................................................................................................
+class HeartbeatDeltaDecoder:
+    """
+    Rebuild full heartbeat models from template and patch frames
+
+    Examples
+    --------
+    >>> decoder = HeartbeatDeltaDecoder()
+    >>> messages = [decoder.decode(frame) for frame in frames]
+    """
+
+    def __init__(self):
+        self._templates: Dict[str, HeartbeatMessage] = {}
+
+    def decode(self, frame: dict) -> HeartbeatMessage:
+        """
+        Decode a template or patch frame into a validated heartbeat
+
+        Parameters
+        ----------
+        frame : dict
+            Frame produced by `HeartbeatDeltaEncoder.encode`
+
+        Returns
+        -------
+        HeartbeatMessage
+            Fully populated heartbeat
+
+        Raises
+        ------
+        ValueError
+            If the frame is malformed, fails validation, or patches a detector without a template
+        """
+
+        if "template" in frame:
+            message = HeartbeatMessage.model_validate(dict(frame["template"]))
+            self._templates[message.detector_name] = message
+            return message
+
+        if "patch" not in frame or "detector_name" not in frame:
+            raise ValueError("Heartbeat frame must contain a 'template' or a 'patch'")
+
+        template = self._templates.get(frame["detector_name"])
+        if template is None:
+            raise ValueError(f"No heartbeat template for detector '{frame['detector_name']}'")
+
+        patch = frame["patch"]
+        if not patch.keys() <= PATCH_VALIDATORS.keys():
+            record = template.model_dump()
+            record.update(patch)
+            if "id" not in patch:
+                record["id"] = None
+            return HeartbeatMessage.model_validate(record)
+
+        update = {k: PATCH_VALIDATORS[k](v) for k, v in patch.items()}
+        if update.get("id") is None:
+            machine_time = update.get("machine_time_utc", template.machine_time_utc)
+            update["id"] = _default_id(template.detector_name, machine_time)
+
+        # Messages do not share mutable metadata with the template, at any depth
+        if template.meta is not None:
+            update["meta"] = copy.deepcopy(template.meta)
+
+        return template.model_copy(update=update)
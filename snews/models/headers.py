@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Routing headers read from raw messages without full validation
+
+A router only needs the tier, detector and machine time of a message to decide where it goes.
+`peek_header` reads just those fields from the raw JSON and checks them with a small model, and
+leaves full validation to the consumer:
+
+    header = peek_header(raw)
+    route(header.tier, header.detector_name)
+    ...
+    message = header.message_type.model_validate_json(raw)
+
+Serialized messages list the envelope fields before the tier-specific payload, so the scan
+normally stops after a few keys and never touches large fields such as `timing_series`. Messages
+in another order are read with the header model, which skips unknown fields without building
+them.
+"""
+
+__all__ = [
+    "MessageHeader",
+    "peek_header",
+]
+
+# Standard library modules
+import json
+from json.decoder import scanstring
+from typing import Optional, Type, Union
+
+# Third-party modules
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# Local modules
+from .messages import MESSAGE_TYPES, MessageBase, Tier, convert_timestamp_to_ns_precision
+from .timing import timestamp_to_ns
+
+HEADER_FIELDS = frozenset({"tier", "detector_name", "machine_time_utc"})
+
+# Number of leading bytes scanned for the header fields before falling back to a full parse
+PEEK_BYTES = 4096
+
+_decoder = json.JSONDecoder()
+
+
+# .................................................................................................
+class MessageHeader(BaseModel):
+    """
+    Envelope fields used for routing
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    tier: Tier
+    detector_name: Optional[str] = None
+    machine_time_utc: Optional[str] = None
+
+    @field_validator("machine_time_utc", mode="before")
+    def _convert_timestamp_to_ns_precision(cls, v):
+        if v is not None:
+            return convert_timestamp_to_ns_precision(timestamp=v)
+
+    @property
+    def machine_time_ns(self) -> Optional[int]:
+        """Machine time in integer nanoseconds since the Unix epoch."""
+        if self.machine_time_utc is not None:
+            return timestamp_to_ns(self.machine_time_utc)
+
+    @property
+    def message_type(self) -> Type[MessageBase]:
+        """Message class to fully validate the message with."""
+        return MESSAGE_TYPES[self.tier]
+
+
+# .................................................................................................
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in " \t\n\r":
+        pos += 1
+    return pos
+
+
+# .................................................................................................
+def _scan_header_fields(text: str) -> Optional[dict]:
+    """
+    Header fields from the leading keys of a JSON object, or None if the scan has to give up
+
+    The scan stops once all header fields are found. It gives up at the first array or object
+    value of a field it does not need, at the end of the text before the object is closed, or at
+    anything unexpected, so the caller can fall back to a full parse.
+    """
+    fields = {}
+    pos = _skip_whitespace(text, 0)
+    if not text.startswith("{", pos):
+        return None
+
+    pos = _skip_whitespace(text, pos + 1)
+    while pos < len(text) and text[pos] == '"':
+        key, pos = scanstring(text, pos + 1)
+        pos = _skip_whitespace(text, pos)
+        if not text.startswith(":", pos):
+            return None
+
+        pos = _skip_whitespace(text, pos + 1)
+        if key not in HEADER_FIELDS and text[pos:pos + 1] in ("[", "{"):
+            return None
+
+        value, pos = _decoder.raw_decode(text, pos)
+        if key in HEADER_FIELDS:
+            fields[key] = value
+            if len(fields) == len(HEADER_FIELDS):
+                return fields
+
+        pos = _skip_whitespace(text, pos)
+        if text.startswith(",", pos):
+            pos = _skip_whitespace(text, pos + 1)
+        elif text.startswith("}", pos):
+            return fields
+        else:
+            return None
+
+    return None
+
+
+# .................................................................................................
+def peek_header(raw: Union[bytes, bytearray, memoryview, str]) -> MessageHeader:
+    """
+    Read and check the routing fields of a raw JSON message without validating the rest
+
+    Parameters
+    ----------
+    raw : Union[bytes, str]
+        Serialized message
+
+    Returns
+    -------
+    header : MessageHeader
+        Tier, detector name and machine time of the message
+
+    Raises
+    ------
+    ValueError
+        If the message is not a JSON object or its header fields are invalid. Errors in other
+        fields are only found by full validation.
+    """
+
+    # A character split at the end of the prefix is dropped; the scan then gives up on the
+    # truncated value instead of reading it
+    if isinstance(raw, str):
+        prefix = raw[:PEEK_BYTES]
+    else:
+        prefix = bytes(raw[:PEEK_BYTES]).decode("utf-8", errors="ignore")
+
+    try:
+        fields = _scan_header_fields(prefix)
+    except ValueError:
+        fields = None
+
+    if fields is None:
+        return MessageHeader.model_validate_json(raw if isinstance(raw, str) else bytes(raw))
+
+    return MessageHeader.model_validate(fields)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Optional validation-time instrumentation for message models
+
+Instrumentation is disabled by default, and while disabled message classes use their plain
+pydantic validators. Once enabled, every message validation is timed and counted by tier and
+outcome, and failures are counted by reason.
+
+Timing individual validator functions needs hooks compiled into the model schemas, so they are only
+installed when the `SNEWS_PROFILE_VALIDATORS` environment variable is set when the message models
+are imported. Without it the hooks are not installed at all and cost nothing.
+"""
+
+__all__ = [
+    "disable",
+    "enable",
+    "get_stats",
+    "is_enabled",
+    "prometheus_text",
+    "reset",
+    "timed_validator",
+]
+
+# Standard library modules
+import functools
+import os
+import threading
+from collections import defaultdict
+from time import perf_counter_ns
+from typing import Callable, Dict, Tuple
+
+# Third-party modules
+from pydantic import ValidationError
+
+_lock = threading.Lock()
+_enabled = False
+_profile_validators = os.environ.get("SNEWS_PROFILE_VALIDATORS", "") not in ("", "0")
+
+# Per validator: [calls, total ns, max ns]
+_validator_timings: Dict[str, list] = defaultdict(lambda: [0, 0, 0])
+
+# Per (tier, outcome): [count, total ns, max ns]
+_message_timings: Dict[Tuple[str, str], list] = defaultdict(lambda: [0, 0, 0])
+
+# Per (tier, reason): count
+_failures: Dict[Tuple[str, str], int] = defaultdict(int)
+
+# Message classes whose validators have been swapped, mapped to their original validator
+_installed: Dict[type, object] = {}
+
+
+# .................................................................................................
+def _record(timings: dict, key, elapsed_ns: int) -> None:
+    with _lock:
+        entry = timings[key]
+        entry[0] += 1
+        entry[1] += elapsed_ns
+        entry[2] = max(entry[2], elapsed_ns)
+
+
+# .................................................................................................
+def _failure_reasons(error: ValidationError) -> list:
+    """Reasons in the form `field:error_type`, or just `error_type` for model-wide errors."""
+    reasons = []
+    for e in error.errors():
+        field = ".".join(str(loc) for loc in e["loc"])
+        reasons.append(f"{field}:{e['type']}" if field else e["type"])
+
+    return reasons
+
+
+# .................................................................................................
+def timed_validator(func: Callable) -> Callable:
+    """
+    Decorate a pydantic validator function so its run time is recorded while enabled.
+
+    Apply it underneath `field_validator` or `model_validator`. Returns the function unchanged
+    unless `SNEWS_PROFILE_VALIDATORS` is set.
+    """
+    if not _profile_validators:
+        return func
+
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(_validator_timings, name, perf_counter_ns() - start)
+
+    return wrapper
+
+
+# .................................................................................................
+class _InstrumentedValidator:
+    """Stand-in for a model's schema validator that times and counts whole-message validation."""
+
+    def __init__(self, validator, tier: str):
+        self._validator = validator
+        self._tier = tier
+
+    def _call(self, method: Callable, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            result = method(*args, **kwargs)
+        except ValidationError as e:
+            _record(_message_timings, (self._tier, "invalid"), perf_counter_ns() - start)
+            with _lock:
+                for reason in _failure_reasons(e):
+                    _failures[(self._tier, reason)] += 1
+            raise
+
+        _record(_message_timings, (self._tier, "valid"), perf_counter_ns() - start)
+        return result
+
+    def validate_python(self, *args, **kwargs):
+        return self._call(self._validator.validate_python, *args, **kwargs)
+
+    def validate_json(self, *args, **kwargs):
+        return self._call(self._validator.validate_json, *args, **kwargs)
+
+    def validate_strings(self, *args, **kwargs):
+        return self._call(self._validator.validate_strings, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._validator, name)
+
+
+# .................................................................................................
+def enable() -> None:
+    """
+    Start recording validation statistics for all message classes defined so far.
+    """
+    global _enabled
+
+    # Imported here to avoid a circular import with the message models
+    from .messages import (MessageBase, _message_subclasses, message_tier_label,
+                           warm_up_message_models)
+
+    # Deferred validators would replace the stand-in when they are built on first use
+    classes = _message_subclasses(MessageBase)
+    warm_up_message_models(classes)
+
+    for cls in classes:
+        if cls in _installed or "__pydantic_validator__" not in cls.__dict__:
+            continue
+
+        _installed[cls] = cls.__pydantic_validator__
+        cls.__pydantic_validator__ = _InstrumentedValidator(
+            cls.__pydantic_validator__, message_tier_label(cls)
+        )
+
+    _enabled = True
+
+
+# .................................................................................................
+def disable() -> None:
+    """
+    Stop recording validation statistics and restore the plain validators. Counters are kept.
+    """
+    global _enabled
+
+    _enabled = False
+    for cls, validator in _installed.items():
+        cls.__pydantic_validator__ = validator
+
+    _installed.clear()
+
+
+# .................................................................................................
+def is_enabled() -> bool:
+    return _enabled
+
+
+# .................................................................................................
+def reset() -> None:
+    """
+    Clear all counters and timings.
+    """
+    with _lock:
+        _validator_timings.clear()
+        _message_timings.clear()
+        _failures.clear()
+
+
+# .................................................................................................
+def _summary(entry: list) -> dict:
+    count, total_ns, max_ns = entry
+    return {"count": count, "total_seconds": total_ns / 1e9, "max_seconds": max_ns / 1e9}
+
+
+# .................................................................................................
+def get_stats() -> dict:
+    """
+    Return a snapshot of all recorded statistics
+
+    Returns
+    -------
+    stats : dict
+        With keys `validators` (timings per validator function), `messages` (timings per tier
+        and outcome), and `failures` (counts per tier and failure reason)
+
+    Examples
+    --------
+    >>> from snews.models import instrumentation
+    >>> instrumentation.enable()
+    >>> HeartbeatMessage(detector_name="Super-K", detector_status="ON")
+    >>> instrumentation.get_stats()["messages"]["Heartbeat"]["valid"]["count"]
+    1
+    """
+    with _lock:
+        messages: dict = defaultdict(dict)
+        for (tier, outcome), entry in _message_timings.items():
+            messages[tier][outcome] = _summary(entry)
+
+        failures: dict = defaultdict(dict)
+        for (tier, reason), count in _failures.items():
+            failures[tier][reason] = count
+
+        return {
+            "validators": {name: _summary(entry) for name, entry in _validator_timings.items()},
+            "messages": dict(messages),
+            "failures": dict(failures),
+        }
+
+
+# .................................................................................................
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+# .................................................................................................
+def prometheus_text(prefix: str = "snews") -> str:
+    """
+    Render all recorded statistics in the Prometheus text exposition format
+    """
+    stats = get_stats()
+    lines = []
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for labels, value in samples:
+            label_str = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+            lines.append(f"{prefix}_{name}{{{label_str}}} {value}")
+
+    validators = stats["validators"].items()
+    metric("validator_calls_total", "counter", "Number of validator calls",
+           [({"validator": k}, v["count"]) for k, v in validators])
+    metric("validator_seconds_total", "counter", "Time spent in validator",
+           [({"validator": k}, v["total_seconds"]) for k, v in validators])
+
+    messages = [
+        ({"tier": tier, "outcome": outcome}, entry)
+        for tier, outcomes in stats["messages"].items()
+        for outcome, entry in outcomes.items()
+    ]
+    metric("messages_validated_total", "counter", "Number of message validations",
+           [(labels, entry["count"]) for labels, entry in messages])
+    metric("message_validation_seconds_total", "counter", "Time spent validating messages",
+           [(labels, entry["total_seconds"]) for labels, entry in messages])
+
+    metric("message_failures_total", "counter", "Number of validation errors by reason",
+           [({"tier": tier, "reason": reason}, count)
+            for tier, reasons in stats["failures"].items()
+            for reason, count in reasons.items()])
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+Raw JSON values parsed on first access
+
+`LazyJSON` keeps a JSON object as the bytes it arrived in. It behaves as a read-only mapping and
+parses the bytes the first time a key is read, so a message can carry a large `meta` payload that
+most consumers never look at without paying to parse or store it as Python objects. Serializing a
+message with `MessageBase.to_json` writes the bytes back unchanged.
+"""
+
+__all__ = [
+    "LazyJSON",
+    "find_object_value",
+]
+
+# Standard library modules
+import json
+import re
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional, Tuple, Union
+
+# Third-party modules
+import numpy as np
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import core_schema
+
+# Bytes that delimit strings and nesting levels in JSON text
+_QUOTE, _BACKSLASH = ord('"'), ord("\\")
+_OPENING = frozenset(b"{[")
+_MATCHING = {ord("}"): ord("{"), ord("]"): ord("[")}
+_STRUCTURAL = np.zeros(256, dtype=bool)
+_STRUCTURAL[list(b'"\\{}[]')] = True
+
+_SEPARATOR = re.compile(rb"\s*:\s*")
+_NULL = re.compile(rb"null\b")
+_OBJECT = re.compile(rb"\s*\{.*\}\s*\Z", re.DOTALL)
+
+_UNPARSED = object()
+
+
+# .................................................................................................
+class LazyJSON(Mapping):
+    """
+    JSON object kept as raw bytes and parsed on first access
+
+    Parameters
+    ----------
+    raw : Union[bytes, str]
+        Serialized JSON object. Only its enclosing braces are checked until first access, when a
+        `ValueError` is raised if it is not a valid JSON object.
+
+    Raises
+    ------
+    ValueError
+        If `raw` is not enclosed in braces
+    """
+
+    __slots__ = ("_raw", "_value")
+
+    def __init__(self, raw: Union[bytes, bytearray, memoryview, str]):
+        self._raw = raw.encode("utf-8") if isinstance(raw, str) else bytes(raw)
+        self._value = _UNPARSED
+
+        if _OBJECT.match(self._raw) is None:
+            raise ValueError("Lazy JSON value must be an object")
+
+    @classmethod
+    def from_value(cls, value: dict) -> "LazyJSON":
+        """
+        Wrap an already parsed object, serializing it once
+        """
+        lazy = cls(json.dumps(value, separators=(",", ":")))
+        lazy._value = value
+        return lazy
+
+    @property
+    def raw(self) -> bytes:
+        """Serialized object, exactly as given."""
+        return self._raw
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._value is not _UNPARSED
+
+    @property
+    def value(self) -> dict:
+        """Parsed object, parsed on the first call."""
+        if self._value is _UNPARSED:
+            value = json.loads(self._raw)
+            if not isinstance(value, dict):
+                raise ValueError("Lazy JSON value must be an object")
+            self._value = value
+
+        return self._value
+
+    def __getitem__(self, key: str) -> Any:
+        return self.value[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __repr__(self) -> str:
+        if self.is_parsed:
+            return f"LazyJSON({self._value!r})"
+        return f"LazyJSON(<{len(self._raw)} bytes>)"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyJSON) and self._raw == other._raw:
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Parsed objects stay plain dicts and lazy values are kept as they are, and both serialize
+        # as the parsed object. Raw JSON is only wrapped explicitly, as in `MessageBase.from_json`.
+        dict_schema = core_schema.dict_schema()
+        return core_schema.json_or_python_schema(
+            json_schema=dict_schema,
+            python_schema=core_schema.union_schema([
+                core_schema.is_instance_schema(cls),
+                dict_schema,
+            ]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda v: v.value if isinstance(v, LazyJSON) else v
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict:
+        return handler(core_schema.dict_schema())
+
+
+# .................................................................................................
+def find_object_value(raw: bytes, key: str) -> Optional[Tuple[int, int]]:
+    """
+    Span of the value of a top-level key of a JSON object, without parsing the object
+
+    Quotes, backslashes and brackets are located in one vectorized pass, and only those bytes are
+    visited to track strings and nesting, so numbers and string contents are never decoded. Every
+    closing bracket must match the innermost open one. The span of the first occurrence of the key
+    is returned.
+
+    Parameters
+    ----------
+    raw : bytes
+        Serialized JSON object
+    key : str
+        Key to find, which must not need escaping
+
+    Returns
+    -------
+    span : Tuple[int, int], optional
+        Start and end of the value if it is an object or null, None if the key is missing, has
+        any other value, or the brackets of `raw` do not nest properly
+    """
+
+    target = b'"' + key.encode("utf-8") + b'"'
+    positions = np.flatnonzero(_STRUCTURAL[np.frombuffer(raw, dtype=np.uint8)]).tolist()
+
+    stack = []
+    start = None
+    string_start = None
+    escaped = -1
+
+    for position in positions:
+        char = raw[position]
+
+        if string_start is not None:
+            if position == escaped:
+                continue
+            if char == _BACKSLASH:
+                escaped = position + 1
+            elif char == _QUOTE:
+                is_key = (
+                    start is None and len(stack) == 1 and raw[string_start:position + 1] == target
+                )
+                string_start = None
+
+                if is_key:
+                    separator = _SEPARATOR.match(raw, position + 1)
+                    if separator is None:
+                        continue
+
+                    start = separator.end()
+                    if _NULL.match(raw, start):
+                        return start, start + 4
+                    if raw[start:start + 1] != b"{":
+                        return None
+
+        elif char == _QUOTE:
+            string_start = position
+        elif char in _OPENING:
+            stack.append(char)
+        elif not stack or stack.pop() != _MATCHING[char]:
+            return None
+        elif start is not None and len(stack) == 1:
+            return start, position + 1
+        elif not stack:
+            return None
+
+    return None
@@ -1,23 +1,34 @@
 # -*- coding: utf-8 -*-
 
 # Standard library modules
-from datetime import UTC, datetime, timedelta
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Annotated, Any, Callable, ClassVar, Dict, Iterable, List, Optional, Union
 from uuid import uuid4
 
 # Third-party modules
 import numpy as np
-from pydantic import (BaseModel, ConfigDict, Field, NonNegativeFloat,
-                      NonNegativeInt, ValidationError, field_validator,
+from pydantic import (AfterValidator, BaseModel, BeforeValidator, ConfigDict, Discriminator,
+                      Field, NonNegativeFloat, NonNegativeInt, PlainValidator, Tag, TypeAdapter,
+                      ValidationError, WrapValidator, field_validator, model_serializer,
                       model_validator)
 
 # Local modules
 from ..__version__ import schema_version
 from ..data import detectors
-from ..models.timing import PrecisionTimestamp
+from ..models.timing import NS_PER_SEC, format_timestamp, timestamp_to_ns
+from .instrumentation import timed_validator
+from .lazy import LazyJSON, find_object_value
 
 __all__ = [
+    "MessageCache",
+    "MessageBatch",
     "HeartbeatMessage",
     "RetractionMessage",
     "CoincidenceTierMessage",
@@ -26,9 +37,28 @@ __all__ = [
     "compatible_message_types",
     "create_messages",
     "get_fields",
+    "construct_message",
+    "message_tier_label",
+    "parse_message",
+    "warm_up_message_models",
 ]
 
 
+# Single-field validators per message class, see `MessageBase.update`
+_FIELD_VALIDATORS: Dict[type, Dict[str, TypeAdapter]] = {}
+
+# Annotated equivalents of `field_validator` modes
+_VALIDATOR_ANNOTATIONS = {
+    "before": BeforeValidator,
+    "after": AfterValidator,
+    "wrap": WrapValidator,
+    "plain": PlainValidator,
+}
+
+# A `meta` key with a null value, which can be validated without splitting it out
+_NULL_META = re.compile(rb'"meta"\s*:\s*null\b')
+
+
 # .................................................................................................
 def get_fields(model, required=False) -> list:
     """
@@ -53,7 +83,7 @@ def convert_timestamp_to_ns_precision(timestamp: Union[str, datetime, np.datetim
     Timestamp at nanosecond precision in ISO 8601-1:2019 format
     """
 
-    return PrecisionTimestamp(timestamp=timestamp, precision="ns").to_string()
+    return format_timestamp(timestamp, precision="ns")
 
 
 # .................................................................................................
@@ -71,7 +101,9 @@ class MessageBase(BaseModel):
     Base class for all messages.
     """
 
-    model_config = ConfigDict(validate_assignment=True)
+    # Validators are built on first use (or by `warm_up_message_models`) rather than at import,
+    # and subclasses inherit this
+    model_config = ConfigDict(validate_assignment=True, defer_build=True)
 
     # NOTE: This field is optional from the user's perspective, but during model validation,
     # it will be automatically generated if not already specified, so in practice this field
@@ -127,7 +159,8 @@ class MessageBase(BaseModel):
         description="True if the message is associated with a fire drill"
     )
 
-    meta: Optional[dict] = Field(
+    # Raw JSON read by `from_json`, or wrapped in `LazyJSON`, is kept unparsed until first read
+    meta: Optional[LazyJSON] = Field(
         default=None,
         title="Metadata",
         description="Attached metadata"
@@ -140,7 +173,11 @@ class MessageBase(BaseModel):
         frozen=True,
     )
 
+    # Largest raw `meta` payload accepted, in bytes, or None for no limit
+    meta_max_bytes: ClassVar[Optional[int]] = None
+
     @field_validator("sent_time_utc", "machine_time_utc", mode="before")
+    @timed_validator
     def _convert_timestamp_to_ns_precision(cls, v):
         """
         Convert to nanosecond precision (before running Pydantic validators).
@@ -148,14 +185,187 @@ class MessageBase(BaseModel):
         if v is not None:
             return convert_timestamp_to_ns_precision(timestamp=v)
 
+    @property
+    def sent_time_ns(self) -> Optional[int]:
+        """Sent time in integer nanoseconds since the Unix epoch."""
+        if self.sent_time_utc is not None:
+            return timestamp_to_ns(self.sent_time_utc)
+
+    @property
+    def machine_time_ns(self) -> Optional[int]:
+        """Machine time in integer nanoseconds since the Unix epoch."""
+        if self.machine_time_utc is not None:
+            return timestamp_to_ns(self.machine_time_utc)
+
     @field_validator("uuid", mode="before")
+    @timed_validator
     def _cast_uuid_to_string(cls, v):
         """
         Cast UUID to string (before running Pydantic validators).
         """
         return str(v)
 
+    @field_validator("meta")
+    @timed_validator
+    def _check_meta_size(cls, v):
+        if isinstance(v, LazyJSON) and cls.meta_max_bytes is not None:
+            if len(v.raw) > cls.meta_max_bytes:
+                raise ValueError(f"meta must be at most {cls.meta_max_bytes} bytes")
+        return v
+
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> "MessageBase":
+        """
+        Validate a raw JSON message, keeping its `meta` object as unparsed bytes
+
+        The `meta` value is cut out of the message before validation and attached as `LazyJSON`,
+        so it is only parsed if it is read. Until then only its size and the nesting of its
+        brackets are checked.
+
+        Raises
+        ------
+        ValueError
+            If the message is invalid or `meta` is larger than `meta_max_bytes`
+        """
+        raw = raw.encode("utf-8") if isinstance(raw, str) else bytes(raw)
+
+        # Most messages have no meta, or a null one, and need no scan
+        n_keys = raw.count(b'"meta"')
+        if n_keys == 0 or (n_keys == 1 and _NULL_META.search(raw) is not None):
+            return cls.model_validate_json(raw)
+
+        span = find_object_value(raw, "meta")
+        if span is None or raw[span[0]:span[1]] == b"null":
+            return cls.model_validate_json(raw)
+
+        start, end = span
+        meta = cls._check_meta_size(LazyJSON(raw[start:end]))
+
+        message = cls.model_validate_json(raw[:start] + b"null" + raw[end:])
+        message.__dict__["meta"] = meta
+
+        return message
+
+    def to_json(self) -> bytes:
+        """
+        Serialize the message as JSON, writing a `LazyJSON` meta back byte for byte
+
+        A lazy `meta` is spliced in as the last key of the object without being parsed.
+        """
+        meta = self.__dict__.get("meta")
+        if not isinstance(meta, LazyJSON):
+            return self.model_dump_json().encode("utf-8")
+
+        body = self.model_dump_json(exclude={"meta"}).encode("utf-8")
+        separator = b"," if body != b"{}" else b""
+
+        return body[:-1] + separator + b'"meta":' + meta.raw + b"}"
+
+    @classmethod
+    def _field_validators(cls) -> Dict[str, TypeAdapter]:
+        """
+        Validators of single fields, including their field validators, built once per class
+
+        Each is a `TypeAdapter` of the field's type annotated with its constraints and with its
+        `field_validator` functions, applied in the order the class declares them.
+        """
+        if cls not in _FIELD_VALIDATORS:
+            decorators = cls.__pydantic_decorators__.field_validators.values()
+            validators = {}
+            for name, field in cls.model_fields.items():
+                annotations = [*field.metadata] + [
+                    _VALIDATOR_ANNOTATIONS[decorator.info.mode](decorator.func)
+                    for decorator in decorators
+                    if name in decorator.info.fields or "*" in decorator.info.fields
+                ]
+                validators[name] = TypeAdapter(
+                    Annotated[(field.annotation, *annotations)] if annotations
+                    else field.annotation,
+                    config=cls.model_config,
+                )
+
+            _FIELD_VALIDATORS[cls] = validators
+
+        return _FIELD_VALIDATORS[cls]
+
+    @classmethod
+    def _after_validators(cls) -> List[Callable]:
+        """Model validators run after field validation, in the order pydantic applies them."""
+        return [
+            decorator.func for decorator in cls.__pydantic_decorators__.model_validators.values()
+            if decorator.info.mode == "after"
+        ]
+
+    def update(self, **fields) -> "MessageBase":
+        """
+        Change several fields at once, validating them together
+
+        Each new value is checked by its field's validation alone, and the model validators then
+        run once for all changes, instead of once per assignment as with `validate_assignment`.
+        Nothing is changed if any value is invalid.
+
+        Returns
+        -------
+        message : MessageBase
+            This message, updated in place
+
+        Raises
+        ------
+        ValidationError
+            Listing every invalid value
+        """
+
+        model_fields = type(self).model_fields
+        validators = self._field_validators()
+
+        values, errors = {}, []
+        for name, value in fields.items():
+            if name not in model_fields:
+                raise ValueError(f'"{type(self).__name__}" object has no field "{name}"')
+
+            if model_fields[name].frozen:
+                errors.append({"type": "frozen_field", "loc": (name,), "input": value})
+                continue
+
+            try:
+                values[name] = validators[name].validate_python(value)
+            except ValidationError as e:
+                errors.extend({**error, "loc": (name, *error["loc"])} for error in e.errors())
+
+        if errors:
+            raise ValidationError.from_exception_data(type(self).__name__, errors)
+
+        # Model validators may set other fields too, so everything is restored if one fails
+        previous = dict(self.__dict__)
+        fields_set = set(self.__pydantic_fields_set__)
+
+        self.__dict__.update(values)
+        self.__pydantic_fields_set__.update(values)
+
+        try:
+            for validator in self._after_validators():
+                validator(self)
+        except ValueError as e:
+            self.__dict__.clear()
+            self.__dict__.update(previous)
+            self.__pydantic_fields_set__ = fields_set
+
+            if isinstance(e, ValidationError):
+                raise
+            raise ValidationError.from_exception_data(type(self).__name__, [
+                {"type": "value_error", "loc": (), "input": fields, "ctx": {"error": e}}
+            ])
+
+        return self
+
+    def with_updates(self, **fields) -> "MessageBase":
+        """
+        Copy of the message with several fields changed, validated together as by `update`
+        """
+        return self.model_copy().update(**fields)
+
     @model_validator(mode="after")
+    @timed_validator
     def _format_id(self):
         """
         Validate the full model.
@@ -205,17 +415,20 @@ class HeartbeatMessage(DetectorMessageBase):
     )
 
     @model_validator(mode="before")
+    @timed_validator
     def _set_tier(cls, values):
         values['tier'] = Tier.HEART_BEAT
         return values
 
     @field_validator("detector_status")
+    @timed_validator
     def _validate_detector_status(cls, v):
         if v not in {"ON", "OFF"}:
             raise ValueError("Detector status must be either ON or OFF")
         return v
 
     @model_validator(mode="after")
+    @timed_validator
     def _validate_model(self):
         # Model-wide validataion after initiation goes here
         return self
@@ -248,11 +461,13 @@ class RetractionMessage(DetectorMessageBase):
     )
 
     @model_validator(mode="before")
+    @timed_validator
     def _set_tier(cls, values):
         values['tier'] = Tier.RETRACTION
         return values
 
     @model_validator(mode="after")
+    @timed_validator
     def _validate_model(self):
         if self.retract_latest_n > 0 and self.retract_message_uuid is not None:
             raise ValueError("retract_message_uuid cannot be specified when retract_latest_n > 0")
@@ -278,6 +493,7 @@ class TierMessageBase(DetectorMessageBase):
     )
 
     @model_validator(mode="after")
+    @timed_validator
     def validate_model(self):
         # Model-wide validataion after initiation goes here
         return self
@@ -298,11 +514,13 @@ class TimingTierMessage(TierMessageBase):
     )
 
     @model_validator(mode="before")
+    @timed_validator
     def _set_tier(cls, values):
         values['tier'] = Tier.TIMING_TIER
         return values
 
     @field_validator("timing_series")
+    @timed_validator
     def _validate_timing_series(cls, v: List[str]):
         try:
             converted_timestamps = list(map(convert_timestamp_to_ns_precision, v))
@@ -311,6 +529,7 @@ class TimingTierMessage(TierMessageBase):
         return converted_timestamps
 
     @model_validator(mode="after")
+    @timed_validator
     def _validate_model(self):
         # Model-wide validataion after initiation goes here
         return self
@@ -337,21 +556,25 @@ class SignificanceTierMessage(TierMessageBase):
     )
 
     @model_validator(mode="before")
+    @timed_validator
     def _set_tier(cls, values):
         values['tier'] = Tier.SIGNIFICANCE_TIER
         return values
 
     @field_validator("p_values")
+    @timed_validator
     def _validate_p_values(cls, v):
         if any(p > 1 for p in v):
             raise ValueError("p-value in list out of range.")
         return v
 
     @field_validator("t_bin_width_sec")
+    @timed_validator
     def _validate_t_bin_width(cls, v):
         return v
 
     @model_validator(mode="after")
+    @timed_validator
     def _validate_model(self):
         # Model-wide validataion after initiation goes here
         return self
@@ -372,39 +595,458 @@ class CoincidenceTierMessage(TierMessageBase):
     )
 
     @model_validator(mode="before")
+    @timed_validator
     def _set_tier(cls, values):
         values['tier'] = Tier.COINCIDENCE_TIER
         return values
 
     @field_validator("neutrino_time_utc", mode="before")
+    @timed_validator
     def _validate_neutrino_time_format(cls, v: str):
         return convert_timestamp_to_ns_precision(v)
 
+    @property
+    def neutrino_time_ns(self) -> int:
+        """Neutrino time in integer nanoseconds since the Unix epoch."""
+        return timestamp_to_ns(self.neutrino_time_utc)
+
     @model_validator(mode="after")
+    @timed_validator
     def _validate_neutrino_time(self):
-        now = datetime.now(UTC)
-
-        # Cast into ISO 8601-1:2019 format with ns precision
-        neutrino_time_pt = PrecisionTimestamp(timestamp=self.neutrino_time_utc)
-
         if not self.is_test:
+            now_ns = time.time_ns()
+            neutrino_time_ns = self.neutrino_time_ns
+
             # Check newer than 48 hours ago
-            if neutrino_time_pt.to_datetime() < now - timedelta(hours=48):
+            if neutrino_time_ns < now_ns - 48 * 3600 * NS_PER_SEC:
                 raise ValueError("neutrino_time_utc must be within past 48 hours")
 
             # Check not in the future
-            if neutrino_time_pt.to_datetime() > now:
+            if neutrino_time_ns > now_ns:
                 raise ValueError("neutrino_time_utc must be in the past")
 
         return self
 
 
 # .................................................................................................
-def compatible_message_types(include_heartbeats=False, **kwargs) -> list:
+MESSAGE_TYPES = {
+    Tier.HEART_BEAT: HeartbeatMessage,
+    Tier.RETRACTION: RetractionMessage,
+    Tier.TIMING_TIER: TimingTierMessage,
+    Tier.SIGNIFICANCE_TIER: SignificanceTierMessage,
+    Tier.COINCIDENCE_TIER: CoincidenceTierMessage,
+}
+
+
+# .................................................................................................
+def _message_tag(message: Any) -> Optional[str]:
+    """Tier of a message or message payload, used to pick its type within a batch."""
+    if isinstance(message, dict):
+        tier = message.get("tier")
+        return tier.value if isinstance(tier, Tier) else tier
+
+    if isinstance(message, MessageBase):
+        return message_tier_label(type(message))
+
+    return None
+
+
+AnyMessage = Annotated[
+    Union[
+        Annotated[HeartbeatMessage, Tag(Tier.HEART_BEAT.value)],
+        Annotated[RetractionMessage, Tag(Tier.RETRACTION.value)],
+        Annotated[TimingTierMessage, Tag(Tier.TIMING_TIER.value)],
+        Annotated[SignificanceTierMessage, Tag(Tier.SIGNIFICANCE_TIER.value)],
+        Annotated[CoincidenceTierMessage, Tag(Tier.COINCIDENCE_TIER.value)],
+    ],
+    Discriminator(_message_tag),
+]
+
+
+# .................................................................................................
+class MessageBatch(BaseModel):
+    """
+    Envelope carrying many messages of any tier in a single record.
+
+    Fields shared by every message can be given once on the envelope instead of on each message.
+    They are filled into messages that do not set them when the batch is validated, and left out
+    of messages that match them when the batch is serialized.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    # Envelope fields that are shared with the messages
+    shared_fields: ClassVar[tuple] = ("detector_name", "schema_version", "is_test")
+
+    detector_name: Optional[str] = Field(
+        default=None,
+        title="Detector Name",
+        description="Name of the detector that sent all messages in the batch"
+    )
+
+    schema_version: Optional[str] = Field(
+        default=schema_version,
+        title="Schema Version",
+        description="Schema version of all messages in the batch",
+    )
+
+    is_test: Optional[bool] = Field(
+        default=None,
+        title="Test Flag",
+        description="True if all messages in the batch are tests"
+    )
+
+    messages: List[AnyMessage] = Field(
+        ...,
+        title="Messages",
+        description="Messages of any tier, each identified by its tier field"
+    )
+
+    @model_validator(mode="before")
+    @timed_validator
+    def _fill_shared_fields(cls, values):
+        if not isinstance(values, dict) or not isinstance(values.get("messages"), list):
+            return values
+
+        shared = {k: values[k] for k in cls.shared_fields if values.get(k) is not None}
+        if "schema_version" not in values:
+            shared["schema_version"] = schema_version
+
+        return {
+            **values,
+            "messages": [
+                {**shared, **m} if isinstance(m, dict) else m for m in values["messages"]
+            ],
+        }
+
+    @model_serializer(mode="wrap")
+    def _omit_shared_fields(self, handler):
+        data = handler(self)
+
+        shared = {k: data[k] for k in self.shared_fields if data.get(k) is not None}
+        for message in data.get("messages", []):
+            for key, value in shared.items():
+                if key in message and message[key] == value:
+                    del message[key]
+
+        return data
+
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs) -> dict:
+        # Messages in a batch may leave out the fields given on the envelope
+        schema = super().model_json_schema(*args, **kwargs)
+        for definition in schema.get("$defs", {}).values():
+            if "required" in definition:
+                definition["required"] = [
+                    k for k in definition["required"] if k not in cls.shared_fields
+                ]
+
+        return schema
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[MessageBase], **envelope) -> "MessageBatch":
+        """
+        Batch validated messages, hoisting every shared field on which all messages agree.
+
+        Parameters
+        ----------
+        messages : Iterable[MessageBase]
+            Validated messages of any tier
+        envelope
+            Envelope fields to set explicitly instead of detecting them
+        """
+
+        messages = list(messages)
+        for key in cls.shared_fields:
+            if key in envelope or not messages:
+                continue
+
+            values = {getattr(m, key, None) for m in messages}
+            envelope[key] = values.pop() if len(values) == 1 else None
+
+        return cls(messages=messages, **envelope)
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+
+# .................................................................................................
+def message_tier_label(message_type: type) -> str:
+    """
+    Return the tier name of a message class (or subclass), falling back to the class name.
+    """
+    for base in message_type.__mro__:
+        for tier, tier_message_type in MESSAGE_TYPES.items():
+            if base is tier_message_type:
+                return tier.value
+
+    return message_type.__name__
+
+
+# .................................................................................................
+def _message_subclasses(message_type: type) -> list:
+    """Return the message class and all of its subclasses, parents before children."""
+    classes = [message_type]
+    for subclass in message_type.__subclasses__():
+        classes.extend(c for c in _message_subclasses(subclass) if c not in classes)
+
+    return classes
+
+
+# .................................................................................................
+def warm_up_message_models(
+    message_types: Optional[Iterable[type]] = None
+) -> Dict[type, float]:
+    """
+    Build the validators of message classes ahead of their first use.
+
+    Message classes defer building their pydantic schemas and validators until first used, which
+    keeps import cheap. Call this at worker startup to pay that cost up front instead, including
+    for downstream subclasses defined by the time it is called.
+
+    Parameters
+    ----------
+    message_types : Iterable[type], optional
+        Message classes to build. Defaults to `MessageBase` and all of its subclasses.
+
+    Returns
+    -------
+    build_seconds : Dict[type, float]
+        Time spent building each class that was not already built
+
+    Examples
+    --------
+    >>> for message_type, seconds in warm_up_message_models().items():
+    ...     print(f"{message_type.__name__}: {seconds * 1e3:.1f} ms")
+    """
+
+    if message_types is None:
+        message_types = _message_subclasses(MessageBase)
+
+    build_seconds = {}
+    for message_type in message_types:
+        if message_type.__pydantic_complete__:
+            continue
+
+        start = time.perf_counter()
+        message_type.model_rebuild()
+        build_seconds[message_type] = time.perf_counter() - start
+
+    return build_seconds
+
+
+# The `is_test` field as the message models read it, so that e.g. "false" counts as False
+_IS_TEST = TypeAdapter(Optional[bool])
+
+
+# .................................................................................................
+class MessageCache:
+    """
+    Bounded LRU cache of validation results, keyed by a hash of the raw payload
+
+    Pass it as `cache=` to `parse_message`, `compatible_message_types` or `create_messages` to skip
+    re-validating payloads that were already seen, e.g. redeliveries from an at-least-once bus.
+    Messages handed out are deep copies, so modifying them or their containers does not affect
+    the cache.
+
+    Payloads are never cached when their result could differ from one call to the next: those
+    without a `uuid`, which get a fresh one on every validation, and non-test payloads with a
+    `neutrino_time_utc`, whose coincidence tier validity depends on the current time.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached payloads. The least recently used entry is evicted first.
+    ttl : float, optional
+        Time in seconds after which an entry expires. By default entries do not expire.
+
+    Examples
+    --------
+    >>> cache = MessageCache(maxsize=10_000, ttl=600)
+    >>> message = parse_message(raw_bytes, cache=cache)
+    >>> cache.stats()
+    {'hits': 0, 'misses': 1, 'bypassed': 0, 'size': 1}
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(payload: dict) -> bool:
+        """Return True if validating the payload always gives the same result."""
+        if "uuid" not in payload:
+            return False
+
+        if payload.get("neutrino_time_utc") is not None:
+            try:
+                return bool(_IS_TEST.validate_python(payload.get("is_test")))
+            except ValidationError:
+                return False
+
+        return True
+
+    @staticmethod
+    def payload_key(payload: Union[dict, str, bytes]) -> bytes:
+        """Hash raw JSON as is, and dicts by their canonical JSON."""
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        elif not isinstance(payload, (bytes, bytearray)):
+            payload = json.dumps(payload, sort_keys=True, default=str).encode()
+
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def cached(self, namespace: Any, payload: Union[dict, str, bytes], compute: Callable) -> Any:
+        """
+        Return the cached result of `compute` for the payload, computing it on a miss
+
+        Parameters
+        ----------
+        namespace : Any
+            Hashable label separating results of different computations on the same payload
+        payload : Union[dict, str, bytes]
+            Message payload as a dict or as raw JSON
+        compute : Callable
+            Called with the payload as a dict on a miss. Exceptions are not cached.
+
+        Returns
+        -------
+        value : Any
+            The computed value, shared with the cache
+        """
+
+        key = (namespace, self.payload_key(payload))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+
+        if isinstance(payload, (str, bytes, bytearray)):
+            payload = json.loads(payload)
+
+        if not isinstance(payload, dict) or not self.is_cacheable(payload):
+            with self._lock:
+                self.bypassed += 1
+            return compute(payload)
+
+        value = compute(payload)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.bypassed = 0
+
+    def stats(self) -> dict:
+        """
+        Return hit, miss and bypass counts and the current number of entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# .................................................................................................
+def parse_message(
+    payload: Union[dict, str, bytes], cache: Optional[MessageCache] = None
+) -> MessageBase:
+    """
+    Validate a message payload into the message class given by its `tier` field.
+
+    Parameters
+    ----------
+    payload : Union[dict, str, bytes]
+        Message as a dict or as raw JSON
+    cache : MessageCache, optional
+        Cache of earlier validation results to reuse
+
+    Returns
+    -------
+    MessageBase
+        Validated message of the matching type
+    """
+
+    if cache is not None:
+        return cache.cached("message", payload, parse_message).model_copy(deep=True)
+
+    if isinstance(payload, (str, bytes, bytearray)):
+        payload = json.loads(payload)
+
+    if not isinstance(payload, dict) or "tier" not in payload:
+        raise ValueError("Message payload must be an object with a 'tier' field")
+
+    try:
+        message_type = MESSAGE_TYPES[Tier(payload["tier"])]
+    except ValueError:
+        raise ValueError(f"Unknown message tier '{payload['tier']}'")
+
+    return message_type.model_validate(payload)
+
+
+# .................................................................................................
+def construct_message(payload: dict) -> MessageBase:
+    """
+    Build a message from a trusted, already validated payload without running validation.
+
+    Intended for payloads produced by `model_dump` of a validated message, e.g. when reading back
+    archives. No checks are made, including the coincidence tier freshness check.
+    """
+
+    tier = Tier(payload["tier"])
+    return MESSAGE_TYPES[tier].model_construct(**{**payload, "tier": tier})
+
+
+# .................................................................................................
+def compatible_message_types(include_heartbeats=False, cache=None, **kwargs) -> list:
     """
     Return a list of message types that are compatible with the given keyword arguments.
+
+    If a `MessageCache` is given as `cache`, results for previously seen arguments are reused.
     """
 
+    if cache is not None:
+        return list(cache.cached(
+            ("compatible_message_types", include_heartbeats), kwargs,
+            lambda payload: compatible_message_types(include_heartbeats, **payload)
+        ))
+
     message_types = [
         HeartbeatMessage,
         RetractionMessage,
@@ -413,28 +1055,36 @@ def compatible_message_types(include_heartbeats=False, **kwargs) -> list:
         TimingTierMessage,
     ]
 
-    compatible_message_types = []
+    compatible_types = []
     for message_type in message_types:
         try:
             message_type(**kwargs)
-            compatible_message_types.append(message_type)
+            compatible_types.append(message_type)
 
             # Coincidence tier messages can also double as heartbeats
             if include_heartbeats and message_type == CoincidenceTierMessage:
-                compatible_message_types.append(HeartbeatMessage)
+                compatible_types.append(HeartbeatMessage)
 
         except ValidationError:
             pass
 
-    return compatible_message_types
+    return compatible_types
 
 
 # .................................................................................................
-def create_messages(**kwargs) -> list:
+def create_messages(cache=None, **kwargs) -> list:
     """
     Return a list of messages initialized with the given keyword arguments.
+
+    If a `MessageCache` is given as `cache`, messages for previously seen arguments are reused.
     """
 
+    if cache is not None:
+        messages = cache.cached(
+            "create_messages", kwargs, lambda payload: create_messages(**payload)
+        )
+        return [message.model_copy(deep=True) for message in messages]
+
     messages = []
     for message_type in compatible_message_types(**kwargs):
         if message_type == HeartbeatMessage and "detector_status" not in kwargs.keys():
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Schema version migrations for message payloads
+
+Migrations are dict-level transforms registered for a pair of schema versions. Payloads are
+upgraded before validation by applying the shortest chain of registered migrations from their
+`schema_version` to the target version, which defaults to the current schema version.
+
+    from snews.models.migrations import register_migration
+
+    @register_migration("0.1", "0.2")
+    def rename_detector(payload):
+        payload["detector_name"] = payload.pop("detector")
+        return payload
+"""
+
+__all__ = [
+    "MigrationRegistry",
+    "register_migration",
+    "registry",
+    "upgrade",
+    "upgrade_file",
+    "upgrade_records",
+]
+
+# Standard library modules
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Local modules
+from ..__version__ import schema_version
+from ..data.io import read_records, write_records
+
+Migration = Callable[[dict], dict]
+
+
+# .................................................................................................
+class MigrationRegistry:
+    """
+    Registry of migrations between schema versions
+
+    Each migration receives a copy of the payload, may modify it in place, and returns the
+    migrated payload. The `schema_version` field is updated after every step. Resolved chains are
+    cached per source and target version, and the cache is cleared when a migration is added.
+    """
+
+    def __init__(self):
+        self._migrations: Dict[str, Dict[str, Migration]] = {}
+        self._chains: Dict[Tuple[str, str], List[Tuple[str, Migration]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, source: str, target: str, migration: Migration) -> None:
+        """
+        Register a migration from one schema version to another
+        """
+        if source == target:
+            raise ValueError("A migration must change the schema version")
+
+        with self._lock:
+            self._migrations.setdefault(source, {})[target] = migration
+            self._chains.clear()
+
+    def register(self, source: str, target: str) -> Callable[[Migration], Migration]:
+        """
+        Decorator form of `add`
+        """
+        def decorator(migration: Migration) -> Migration:
+            self.add(source, target, migration)
+            return migration
+
+        return decorator
+
+    def chain(self, source: str, target: Optional[str] = None) -> List[Tuple[str, Migration]]:
+        """
+        Shortest chain of migrations from one schema version to another
+
+        Parameters
+        ----------
+        source : str
+            Schema version of the payloads
+        target : str, optional
+            Schema version to migrate to. Defaults to the current schema version.
+
+        Returns
+        -------
+        chain : List[Tuple[str, Migration]]
+            Version reached and migration applied at each step, empty if the versions are equal
+
+        Raises
+        ------
+        ValueError
+            If no chain of registered migrations connects the versions
+        """
+
+        target = schema_version if target is None else target
+        key = (source, target)
+
+        with self._lock:
+            if key in self._chains:
+                return self._chains[key]
+
+            # Breadth-first search gives the chain with the fewest steps
+            previous = {source: None}
+            queue = deque([source])
+            while queue and target not in previous:
+                version = queue.popleft()
+                for next_version in self._migrations.get(version, {}):
+                    if next_version not in previous:
+                        previous[next_version] = version
+                        queue.append(next_version)
+
+            if target not in previous:
+                raise ValueError(f"No migration path from schema version {source} to {target}")
+
+            chain = []
+            version = target
+            while previous[version] is not None:
+                chain.append((version, self._migrations[previous[version]][version]))
+                version = previous[version]
+
+            self._chains[key] = chain[::-1]
+            return self._chains[key]
+
+    def upgrade(self, payload: dict, target: Optional[str] = None) -> dict:
+        """
+        Migrate a single payload to the target schema version
+
+        Payloads without a `schema_version` are returned unchanged. The input is not modified.
+        """
+        source = payload.get("schema_version")
+        if source is None:
+            return payload
+
+        chain = self.chain(source, target)
+        if not chain:
+            return payload
+
+        payload = dict(payload)
+        for version, migration in chain:
+            payload = migration(payload)
+            payload["schema_version"] = version
+
+        return payload
+
+    def upgrade_records(
+        self, records: Iterable[dict], target: Optional[str] = None
+    ) -> Iterator[dict]:
+        """
+        Lazily migrate a stream of payloads to the target schema version, as by `upgrade`
+        """
+        for record in records:
+            yield self.upgrade(record, target)
+
+
+# Default registry used by the module-level functions
+registry = MigrationRegistry()
+register_migration = registry.register
+upgrade = registry.upgrade
+upgrade_records = registry.upgrade_records
+
+
+# .................................................................................................
+def upgrade_file(
+    source: Union[str, Path],
+    destination: Union[str, Path],
+    target: Optional[str] = None,
+    source_format: Optional[str] = None,
+    destination_format: Optional[str] = None,
+    migrations: Optional[MigrationRegistry] = None,
+) -> int:
+    """
+    Migrate every message in a file to the target schema version in a single streaming pass
+
+    Parameters
+    ----------
+    source, destination : Union[str, Path]
+        Input and output message files, in any format supported by `snews.data.io.read_records`
+    target : str, optional
+        Schema version to migrate to. Defaults to the current schema version.
+    source_format, destination_format : str, optional
+        File formats, inferred if not given
+    migrations : MigrationRegistry, optional
+        Registry to use instead of the default one
+
+    Returns
+    -------
+    count : int
+        Number of messages written
+    """
+
+    migrations = registry if migrations is None else migrations
+    records = migrations.upgrade_records(read_records(source, source_format), target)
+
+    return write_records(destination, records, destination_format)
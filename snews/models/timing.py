@@ -1,19 +1,307 @@
 # -*- coding: utf-8 -*-
 __all__ = [
-    "PrecisionTimestamp"
+    "PrecisionTimestamp",
+    "convert_time_scale",
+    "format_timestamp",
+    "gps_to_utc",
+    "tai_to_utc",
+    "tai_utc_offset",
+    "timestamp_to_ns",
+    "timestamps_to_ns",
+    "utc_to_gps",
+    "utc_to_tai",
 ]
 
 # Standard library imports
-from datetime import UTC, datetime
-from typing import Literal, Optional, Union
+import re
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Iterable, Literal, Optional, Tuple, Union
 
 # Third party imports
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 # Local imports
+from ..data.timing import leap_seconds
 from ..data.utilities import num_leap_seconds_between
 
+TimeScale = Literal["utc", "tai", "gps"]
+TimeValue = Union[int, np.integer, np.ndarray, np.datetime64]
+
+NS_PER_SEC = 1_000_000_000
+
+# TAI - UTC when leap seconds were introduced on 1972-01-01. Earlier times use this same offset.
+TAI_UTC_1972 = 10
+
+# TAI - GPS, fixed since the GPS epoch
+TAI_GPS = 19
+
+# Start of GPS time, 1980-01-06T00:00:00 (UTC and GPS agree here), in ns since the Unix epoch
+GPS_EPOCH_NS = int(np.datetime64("1980-01-06T00:00:00", "ns").astype(np.int64))
+
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Nanoseconds per numpy datetime unit, for units with a fixed length
+NS_PER_UNIT = {
+    "W": 7 * 86_400 * NS_PER_SEC,
+    "D": 86_400 * NS_PER_SEC,
+    "h": 3_600 * NS_PER_SEC,
+    "m": 60 * NS_PER_SEC,
+    "s": NS_PER_SEC,
+    "ms": 1_000_000,
+    "us": 1_000,
+    "ns": 1,
+}
+
+# ISO 8601-1:2019 UTC timestamp at nanosecond precision, as produced by `format_timestamp`
+_NS_TIMESTAMP = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{9}Z")
+
+
+# .................................................................................................
+def to_datetime64(timestamp: Union[np.datetime64, datetime, str]) -> np.datetime64:
+    """
+    Cast a timestamp to `numpy.datetime64`, converting timezone-aware inputs to UTC
+    """
+    if isinstance(timestamp, datetime) and timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC)
+
+    # A trailing "Z" already means UTC; dropping it avoids numpy's timezone deprecation path
+    if isinstance(timestamp, str) and timestamp.endswith("Z"):
+        timestamp = timestamp[:-1]
+
+    if not isinstance(timestamp, np.datetime64):
+        timestamp = np.datetime64(timestamp)
+
+    return timestamp
+
+
+# .................................................................................................
+def datetime64_to_ns(timestamp: np.datetime64) -> int:
+    """
+    Exact integer nanoseconds since the Unix epoch, without overflow for dates outside the
+    range representable by `datetime64[ns]`
+    """
+    if np.isnat(timestamp):
+        raise ValueError("NaT cannot be converted to nanoseconds")
+
+    unit, count = np.datetime_data(timestamp.dtype)
+    if unit in ("Y", "M"):
+        timestamp, unit, count = timestamp.astype("datetime64[D]"), "D", 1
+
+    if unit not in NS_PER_UNIT:
+        return int(timestamp.astype("datetime64[ns]").astype(np.int64))
+
+    return int(timestamp.astype(np.int64)) * count * NS_PER_UNIT[unit]
+
+
+# .................................................................................................
+def timestamp_to_ns(timestamp: Union[np.datetime64, datetime, str, int]) -> int:
+    """
+    Integer nanoseconds since the Unix epoch of a timestamp
+
+    Parameters
+    ----------
+    timestamp : Union[np.datetime64, datetime, str, int]
+        Timestamp in any format supported by `PrecisionTimestamp`, or integer ns
+
+    Returns
+    -------
+    ns : int
+        Nanoseconds since 1970-01-01T00:00:00 UTC
+
+    Examples
+    --------
+    >>> timestamp_to_ns("1970-01-01T00:00:01.000000001Z")
+    1000000001
+    """
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+
+    return datetime64_to_ns(to_datetime64(timestamp))
+
+
+# .................................................................................................
+def timestamps_to_ns(timestamps: Iterable[Union[np.datetime64, datetime, str]]) -> np.ndarray:
+    """
+    Vectorized conversion of timestamps to an int64 array of nanoseconds since the Unix epoch
+
+    Timestamps must lie between the years 1678 and 2262.
+    """
+    timestamps = [to_datetime64(t) if not isinstance(t, str) else t.removesuffix("Z")
+                  for t in timestamps]
+
+    return np.array(timestamps, dtype="datetime64[ns]").astype(np.int64)
+
+
+# .................................................................................................
+def format_timestamp(timestamp: Any, precision: str = "ns") -> str:
+    """
+    Format a timestamp as an ISO 8601-1:2019 UTC string with the given precision
+
+    Strings, `datetime` and `numpy.datetime64` inputs are formatted directly; anything else is
+    validated through `PrecisionTimestamp`.
+    """
+    # Timestamps that are already normalized, e.g. from a serialized message, only need checking
+    if precision == "ns" and isinstance(timestamp, str) and _NS_TIMESTAMP.fullmatch(timestamp):
+        try:
+            datetime.fromisoformat(timestamp[:26])
+            return timestamp
+        except ValueError:
+            pass
+
+    if isinstance(timestamp, (str, datetime, np.datetime64)):
+        return np.datetime_as_string(to_datetime64(timestamp), unit=precision, timezone="UTC")
+
+    return PrecisionTimestamp(timestamp=timestamp, precision=precision).to_string()
+
+
+# .................................................................................................
+@lru_cache(maxsize=None)
+def _leap_second_table() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Cumulative leap second table, built once from `snews/data/timing/leap_seconds.json`.
+
+    Returns the UTC instants (ns) at which TAI - UTC increases, the same instants on the TAI
+    scale, and TAI - UTC in seconds before the first step and after each step.
+    """
+    steps_utc = (
+        np.array(leap_seconds, dtype="datetime64[ns]") + np.timedelta64(1, "s")
+    ).astype(np.int64)
+    offsets = TAI_UTC_1972 + np.arange(len(steps_utc) + 1, dtype=np.int64)
+    steps_tai = steps_utc + offsets[1:] * NS_PER_SEC
+
+    for array in (steps_utc, steps_tai, offsets):
+        array.flags.writeable = False
+
+    return steps_utc, steps_tai, offsets
+
+
+# .................................................................................................
+def _as_ns(t: TimeValue) -> Tuple[np.ndarray, bool, bool]:
+    """Integer ns view of the input, and whether it was a datetime and/or a scalar."""
+    t = np.asarray(t)
+    is_datetime = np.issubdtype(t.dtype, np.datetime64)
+    ns = t.astype("datetime64[ns]").astype(np.int64) if is_datetime else t.astype(np.int64)
+
+    return ns, is_datetime, ns.ndim == 0
+
+
+# .................................................................................................
+def _from_ns(ns: np.ndarray, is_datetime: bool, is_scalar: bool) -> TimeValue:
+    if is_datetime:
+        ns = ns.astype("datetime64[ns]")
+
+    return ns[()] if is_scalar and is_datetime else (int(ns) if is_scalar else ns)
+
+
+# .................................................................................................
+def tai_utc_offset(t: TimeValue, scale: TimeScale = "utc") -> Union[int, np.ndarray]:
+    """
+    TAI - UTC in whole seconds at the given times
+
+    Parameters
+    ----------
+    t : TimeValue
+        Time(s) as integer ns since 1970-01-01 on the given scale, or numpy datetime64 labels
+    scale : TimeScale
+        Scale on which `t` is expressed
+
+    Returns
+    -------
+    offset : Union[int, np.ndarray]
+        TAI - UTC in seconds, with the same shape as `t`
+
+    Examples
+    --------
+    >>> tai_utc_offset(np.datetime64("2017-01-01T00:00:00"))
+    37
+    """
+
+    ns, _, is_scalar = _as_ns(t)
+    steps_utc, steps_tai, offsets = _leap_second_table()
+
+    if scale == "gps":
+        ns = ns + TAI_GPS * NS_PER_SEC
+
+    steps = steps_utc if scale == "utc" else steps_tai
+    offset = offsets[np.searchsorted(steps, ns, side="right")]
+
+    return int(offset) if is_scalar else offset
+
+
+# .................................................................................................
+def convert_time_scale(t: TimeValue, from_scale: TimeScale, to_scale: TimeScale) -> TimeValue:
+    """
+    Convert times between the UTC, TAI and GPS time scales, accounting for leap seconds
+
+    Times are either integer nanoseconds since 1970-01-01T00:00:00 on the respective scale (for
+    UTC, these are Unix ns) or numpy datetime64 labels. Scalars and arrays of any shape are
+    supported and the output has the same type and shape as the input. Leap seconds come from
+    a lookup table built once and cached. Times within an inserted leap second have no UTC
+    label of their own and map to the first second of the following day, as Unix time does.
+    Before 1972, TAI - UTC is taken to be a constant 10 s.
+
+    Parameters
+    ----------
+    t : TimeValue
+        Time(s) to convert
+    from_scale : TimeScale
+        Scale of the input: "utc", "tai" or "gps"
+    to_scale : TimeScale
+        Scale of the output: "utc", "tai" or "gps"
+
+    Returns
+    -------
+    t : TimeValue
+        Converted time(s)
+
+    Examples
+    --------
+    >>> convert_time_scale(np.datetime64("2017-01-01T00:00:00"), "utc", "gps")
+    numpy.datetime64('2017-01-01T00:00:18.000000000')
+    """
+
+    for scale in (from_scale, to_scale):
+        if scale not in ("utc", "tai", "gps"):
+            raise ValueError(f"Unsupported time scale '{scale}', expected 'utc', 'tai' or 'gps'")
+
+    ns, is_datetime, is_scalar = _as_ns(t)
+
+    # Via TAI, which has no discontinuities
+    if from_scale == "utc":
+        ns = ns + tai_utc_offset(ns, "utc") * NS_PER_SEC
+    elif from_scale == "gps":
+        ns = ns + TAI_GPS * NS_PER_SEC
+
+    if to_scale == "utc":
+        ns = ns - tai_utc_offset(ns, "tai") * NS_PER_SEC
+    elif to_scale == "gps":
+        ns = ns - TAI_GPS * NS_PER_SEC
+
+    return _from_ns(np.asarray(ns, dtype=np.int64), is_datetime, is_scalar)
+
+
+# .................................................................................................
+def utc_to_tai(t: TimeValue) -> TimeValue:
+    """Convert UTC times to TAI. See `convert_time_scale`."""
+    return convert_time_scale(t, "utc", "tai")
+
+
+def tai_to_utc(t: TimeValue) -> TimeValue:
+    """Convert TAI times to UTC. See `convert_time_scale`."""
+    return convert_time_scale(t, "tai", "utc")
+
+
+def utc_to_gps(t: TimeValue) -> TimeValue:
+    """Convert UTC times to GPS. See `convert_time_scale`."""
+    return convert_time_scale(t, "utc", "gps")
+
+
+def gps_to_utc(t: TimeValue) -> TimeValue:
+    """Convert GPS times to UTC. See `convert_time_scale`."""
+    return convert_time_scale(t, "gps", "utc")
+
 
 # .................................................................................................
 class PrecisionTimestamp(BaseModel, arbitrary_types_allowed=True):
@@ -44,29 +332,67 @@ class PrecisionTimestamp(BaseModel, arbitrary_types_allowed=True):
         validate_default=True
     )
 
+    # Memoized forms of the timestamp, cleared whenever a field is assigned
+    _string: Optional[str] = PrivateAttr(default=None)
+    _datetime: Optional[datetime] = PrivateAttr(default=None)
+    _ns: Optional[int] = PrivateAttr(default=None)
+
+    # Private attributes are read through `__pydantic_private__`, which skips the much slower
+    # attribute lookup fallback of pydantic models
     def to_string(self):
-        return np.datetime_as_string(
-            self.timestamp,
-            unit=self.precision,
-            timezone="UTC"
-        )
+        cache = self.__pydantic_private__
+        if cache["_string"] is None:
+            cache["_string"] = np.datetime_as_string(
+                self.timestamp,
+                unit=self.precision,
+                timezone="UTC"
+            )
+
+        return cache["_string"]
 
     def to_numpy(self):
         return self.timestamp
 
+    def to_ns(self) -> int:
+        """Return the timestamp as integer nanoseconds since the Unix epoch."""
+        cache = self.__pydantic_private__
+        if cache["_ns"] is None:
+            cache["_ns"] = datetime64_to_ns(self.timestamp)
+
+        return cache["_ns"]
+
     def to_datetime(self):
-        timestamp_str = self.to_string()
-        return datetime.fromisoformat(timestamp_str)
+        """Return the timestamp, truncated to its precision, as a timezone-aware datetime."""
+        cache = self.__pydantic_private__
+        if cache["_datetime"] is None:
+            ns = self.to_ns()
+            ns -= ns % NS_PER_UNIT[self.precision or "ns"]
+            cache["_datetime"] = UNIX_EPOCH + timedelta(microseconds=ns // 1_000)
+
+        return cache["_datetime"]
+
+    def to_scale(self, scale: TimeScale) -> np.datetime64:
+        """Return the timestamp as a nanosecond label on the UTC, TAI or GPS time scale."""
+        return convert_time_scale(self.timestamp, "utc", scale)
+
+    @classmethod
+    def from_scale(cls, timestamp: TimeValue, scale: TimeScale,
+                   precision: str = "ns") -> "PrecisionTimestamp":
+        """Create a (UTC) timestamp from a time on the UTC, TAI or GPS time scale."""
+        if not isinstance(timestamp, np.datetime64):
+            timestamp = np.datetime64(int(timestamp), "ns")
+
+        return cls(timestamp=convert_time_scale(timestamp, scale, "utc"), precision=precision)
 
     @field_validator("timestamp")
     def _validate_and_cast_timestamp(cls, v):
-        if isinstance(v, datetime) and v.tzinfo is not None:
-            v = v.astimezone(UTC)
+        return to_datetime64(v)
 
-        if not isinstance(v, np.datetime64):
-            v = np.datetime64(v)
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
 
-        return v
+        if name in type(self).model_fields:
+            self.__pydantic_private__.update(_string=None, _datetime=None, _ns=None)
 
     def __sub__(self, other) -> np.timedelta64:
         if isinstance(other, PrecisionTimestamp):
@@ -82,5 +408,38 @@ class PrecisionTimestamp(BaseModel, arbitrary_types_allowed=True):
             raise TypeError("Unsupported operand type(s) for -: 'PrecisionTimestamp' and " +
                             type(other).__name__)
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PrecisionTimestamp):
+            return NotImplemented
+
+        return self.to_ns() == other.to_ns()
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, PrecisionTimestamp):
+            return NotImplemented
+
+        return self.to_ns() < other.to_ns()
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, PrecisionTimestamp):
+            return NotImplemented
+
+        return self.to_ns() <= other.to_ns()
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, PrecisionTimestamp):
+            return NotImplemented
+
+        return self.to_ns() > other.to_ns()
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, PrecisionTimestamp):
+            return NotImplemented
+
+        return self.to_ns() >= other.to_ns()
+
+    def __hash__(self) -> int:
+        return hash(self.to_ns())
+
     def __str__(self):
         return self.to_string()
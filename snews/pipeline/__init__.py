@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+from .ordering import ReorderBuffer, UuidFilter, reorder
+from .sharedring import RingReader, RingRecord, SharedMessageRing
+from .streaming import validate_stream
+from .validation import ValidationReport, validate_archive
+
+__all__ = [
+    "ReorderBuffer",
+    "RingReader",
+    "RingRecord",
+    "SharedMessageRing",
+    "UuidFilter",
+    "ValidationReport",
+    "reorder",
+    "validate_archive",
+    "validate_stream",
+]
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Deduplication and reordering of out-of-order message streams
+
+Messages are held in a heap keyed on their integer ns timestamp and released in time order once
+the watermark, the latest timestamp seen minus the allowed lateness, has passed them. Duplicates
+are dropped by uuid using a pair of rotating Bloom filters, so memory stays bounded however long
+the stream runs.
+"""
+
+__all__ = [
+    "ReorderBuffer",
+    "UuidFilter",
+    "reorder",
+]
+
+# Standard library modules
+import hashlib
+import heapq
+import math
+from itertools import count
+from typing import Callable, Iterable, Iterator, List, Optional
+
+# Local modules
+from ..models.messages import MessageBase
+from ..models.timing import NS_PER_SEC
+
+
+# .................................................................................................
+class UuidFilter:
+    """
+    Bounded set membership for message uuids, with rare false positives
+
+    Two Bloom filters are kept. New uuids go into the current one, and once it holds `capacity`
+    uuids the older one is dropped and a fresh one started. Every uuid from the last `capacity`
+    insertions is always remembered, and up to `2 * capacity` are.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of uuids per filter generation
+    error_rate : float
+        False positive rate of each generation at capacity
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-6):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+
+        self.capacity = capacity
+        n_bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self.n_hashes = max(round(n_bits / capacity * math.log(2)), 1)
+
+        # A power of two, so that the odd hash stride visits distinct bits
+        self.n_bits = 1 << max(math.ceil(math.log2(n_bits)), 3)
+
+        self._current = bytearray((self.n_bits + 7) // 8)
+        self._previous = bytearray(len(self._current))
+        self._count = 0
+
+    def _positions(self, uuid: str) -> List[int]:
+        digest = hashlib.blake2b(uuid.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        mask = self.n_bits - 1
+        return [(h1 + i * h2) & mask for i in range(self.n_hashes)]
+
+    @staticmethod
+    def _contains(bits: bytearray, positions: List[int]) -> bool:
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def add(self, uuid: str) -> bool:
+        """
+        Add a uuid, returning True if it was (probably) already present.
+        """
+        positions = self._positions(uuid)
+        if self._contains(self._current, positions) or self._contains(self._previous, positions):
+            return True
+
+        if self._count >= self.capacity:
+            self._previous, self._current = self._current, self._previous
+            self._current[:] = bytes(len(self._current))
+            self._count = 0
+
+        for p in positions:
+            self._current[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+        return False
+
+    def __contains__(self, uuid: str) -> bool:
+        positions = self._positions(uuid)
+        return self._contains(self._current, positions) or self._contains(self._previous, positions)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._current) + len(self._previous)
+
+
+# .................................................................................................
+class ReorderBuffer:
+    """
+    Release messages in timestamp order, dropping duplicates and messages that arrive too late
+
+    Parameters
+    ----------
+    time_field : str
+        Timestamp to order by: `sent_time_utc`, `machine_time_utc` or `neutrino_time_utc`.
+        Messages without it, e.g. non-coincidence messages ordered by neutrino time, fall back
+        to their sent time.
+    lateness_sec : float
+        How far behind the latest timestamp seen a message may arrive and still be released in
+        order. This is also the longest a message is held, in stream time.
+    max_buffered : int, optional
+        Maximum number of held messages. When exceeded the earliest message is released early and
+        the watermark moves up to it.
+    dedup_capacity : int
+        Number of recent uuids remembered for deduplication, see `UuidFilter`. Set to 0 to
+        disable deduplication.
+    on_late : Callable[[MessageBase], None], optional
+        Called with every message that arrives behind the watermark and is dropped
+
+    Examples
+    --------
+    >>> buffer = ReorderBuffer(lateness_sec=2.0)
+    >>> for message in incoming:
+    ...     for ordered in buffer.push(message):
+    ...         handle(ordered)
+    >>> for ordered in buffer.flush():
+    ...     handle(ordered)
+    """
+
+    def __init__(
+        self,
+        time_field: str = "sent_time_utc",
+        lateness_sec: float = 5.0,
+        max_buffered: Optional[int] = None,
+        dedup_capacity: int = 100_000,
+        on_late: Optional[Callable[[MessageBase], None]] = None,
+    ):
+        if time_field not in ("sent_time_utc", "machine_time_utc", "neutrino_time_utc"):
+            raise ValueError(f"Cannot order messages by '{time_field}'")
+
+        self.time_field = time_field
+        self.lateness_ns = int(lateness_sec * NS_PER_SEC)
+        self.max_buffered = max_buffered
+        self.on_late = on_late
+
+        self._accessor = time_field.replace("_utc", "_ns")
+        self._filter = UuidFilter(dedup_capacity) if dedup_capacity else None
+        self._heap: list = []
+        self._sequence = count()
+        self._latest_ns: Optional[int] = None
+        self._watermark_ns: Optional[int] = None
+
+        self.released = 0
+        self.duplicates = 0
+        self.late = 0
+
+    def timestamp_ns(self, message: MessageBase) -> int:
+        """Ordering timestamp of a message in integer ns."""
+        timestamp = getattr(message, self._accessor, None)
+        if timestamp is None:
+            timestamp = message.sent_time_ns
+
+        if timestamp is None:
+            raise ValueError(f"Message {message.uuid} has no {self.time_field} or sent_time_utc")
+
+        return timestamp
+
+    def push(self, message: MessageBase) -> List[MessageBase]:
+        """
+        Add a message and return any messages now ready, in timestamp order.
+        """
+        # A message without a timestamp raises before its uuid is recorded, so a redelivery
+        # is not mistaken for a duplicate
+        timestamp = self.timestamp_ns(message)
+        if self._filter is not None and self._filter.add(message.uuid):
+            self.duplicates += 1
+            return []
+
+        if self._watermark_ns is not None and timestamp < self._watermark_ns:
+            self.late += 1
+            if self.on_late is not None:
+                self.on_late(message)
+            return []
+
+        heapq.heappush(self._heap, (timestamp, next(self._sequence), message))
+
+        if self._latest_ns is None or timestamp > self._latest_ns:
+            self._latest_ns = timestamp
+
+        ready = self._release_until(self._latest_ns - self.lateness_ns)
+
+        if self.max_buffered is not None:
+            while len(self._heap) > self.max_buffered:
+                ready.extend(self._release_until(self._heap[0][0]))
+
+        return ready
+
+    def _release_until(self, watermark_ns: int) -> List[MessageBase]:
+        if self._watermark_ns is None or watermark_ns > self._watermark_ns:
+            self._watermark_ns = watermark_ns
+
+        ready = []
+        while self._heap and self._heap[0][0] <= self._watermark_ns:
+            ready.append(heapq.heappop(self._heap)[2])
+
+        self.released += len(ready)
+        return ready
+
+    def flush(self) -> List[MessageBase]:
+        """
+        Release all held messages in timestamp order, e.g. at the end of a stream.
+        """
+        if not self._heap:
+            return []
+
+        return self._release_until(max(entry[0] for entry in self._heap))
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._heap),
+            "released": self.released,
+            "duplicates": self.duplicates,
+            "late": self.late,
+        }
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+# .................................................................................................
+def reorder(messages: Iterable[MessageBase], **kwargs) -> Iterator[MessageBase]:
+    """
+    Yield messages deduplicated and in timestamp order
+
+    Keyword arguments are passed to `ReorderBuffer`.
+    """
+    buffer = ReorderBuffer(**kwargs)
+    for message in messages:
+        yield from buffer.push(message)
+
+    yield from buffer.flush()
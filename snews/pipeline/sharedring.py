@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Shared-memory ring buffer for fanning out validated messages between processes
+
+One validator process publishes messages into a ring of fixed-size slots in a
+`multiprocessing.shared_memory` segment, and any number of consumer processes on the same host
+read them by sequence number. Each slot carries a compact binary header with the tier and machine
+time, so consumers can filter without touching the payload, followed by the canonical JSON of the
+already validated message. Consumers get zero-copy views of the payload and build messages
+without validating them again.
+
+    ring = SharedMessageRing.create("snews-validated", slots=4096)   # validator process
+    ring.publish(message)
+
+    ring = SharedMessageRing.attach("snews-validated")                # consumer process
+    reader = ring.reader()
+    for record in reader.poll():
+        if record.tier == Tier.COINCIDENCE_TIER:
+            handle(record.message())
+
+Every slot is guarded by a sequence lock: the writer marks the slot as being written before
+copying the payload and as committed afterwards, and a reader checks that the mark is unchanged
+after reading. A reader that falls more than one ring behind the writer skips the overwritten
+messages and counts them in `lost`. The lock relies on stores becoming visible in program order,
+as on x86-64.
+"""
+
+__all__ = [
+    "RingReader",
+    "RingRecord",
+    "SharedMessageRing",
+]
+
+# Standard library modules
+import json
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional
+
+# Local modules
+from ..data.io import NO_TIME
+from ..models.messages import MessageBase, Tier, construct_message
+
+RING_MAGIC = b"SNEWSRNG"
+RING_VERSION = 1
+
+# Magic, version, slot count, slot size, reserved, next sequence number to publish
+RING_HEADER = struct.Struct("<8sIIIIQ")
+RING_SEQUENCE_OFFSET = 24
+
+# Lock word, event time in ns, tier code, flags, reserved, payload length
+SLOT_HEADER = struct.Struct("<QqBBHI")
+SLOT_LOCK = struct.Struct("<Q")
+
+TIERS = list(Tier)
+TIER_CODES = {tier: code for code, tier in enumerate(TIERS)}
+
+# Segments created by this process, which stay registered for cleanup when attached to
+_created = set()
+
+
+# .................................................................................................
+def _committed(sequence: int) -> int:
+    """Lock word of a slot once the message with this sequence number is fully written."""
+    return 2 * sequence + 2
+
+
+# .................................................................................................
+class RingRecord:
+    """
+    One message in the ring, read without copying its payload
+
+    `payload` is a view into shared memory and stays valid only until the writer reuses the slot;
+    check `valid` after using it, or call `message` or `payload_bytes`, which copy it and raise if
+    the slot was overwritten in the meantime.
+    """
+
+    __slots__ = ("ring", "sequence", "tier", "time_ns", "_start", "_stop")
+
+    def __init__(
+        self,
+        ring: "SharedMessageRing",
+        sequence: int,
+        tier: Tier,
+        time_ns: Optional[int],
+        start: int,
+        stop: int,
+    ):
+        self.ring = ring
+        self.sequence = sequence
+        self.tier = tier
+        self.time_ns = time_ns
+        self._start = start
+        self._stop = stop
+
+    def __repr__(self) -> str:
+        return (f"RingRecord(sequence={self.sequence}, tier={self.tier.value}, "
+                f"time_ns={self.time_ns})")
+
+    @property
+    def payload(self) -> memoryview:
+        """Serialized message, as a view into shared memory."""
+        return self.ring._buffer[self._start:self._stop]
+
+    @property
+    def valid(self) -> bool:
+        """True while the slot still holds this message."""
+        return self.ring._lock_word(self.sequence) == _committed(self.sequence)
+
+    def payload_bytes(self) -> bytes:
+        """
+        Copy of the payload
+
+        Raises
+        ------
+        LookupError
+            If the slot was overwritten
+        """
+        data = bytes(self.ring._buffer[self._start:self._stop])
+        if not self.valid:
+            raise LookupError(f"Message {self.sequence} was overwritten while reading")
+
+        return data
+
+    def message(self) -> MessageBase:
+        """
+        The message, built from its validated payload without validating it again
+        """
+        return construct_message(json.loads(self.payload_bytes()))
+
+
+# .................................................................................................
+class SharedMessageRing:
+    """
+    Ring of fixed-size message slots in shared memory
+
+    Use `create` in the single writer process and `attach` in readers. Closing does not remove
+    the segment; the creating process calls `unlink` when the ring is no longer needed.
+
+    Parameters
+    ----------
+    memory : shared_memory.SharedMemory
+        Segment holding the ring
+    owner : bool
+        Whether this process created the segment
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool = False):
+        magic, version, slots, slot_size, _, _ = RING_HEADER.unpack_from(memory.buf)
+        if magic != RING_MAGIC or version != RING_VERSION:
+            memory.close()
+            if magic != RING_MAGIC:
+                raise ValueError(f"Shared memory segment {memory.name} is not a message ring")
+            raise ValueError(f"Unsupported message ring version {version}")
+
+        self._memory = memory
+        self._buffer = memory.buf
+        self.owner = owner
+        self.slots = slots
+        self.slot_size = slot_size
+
+        self.max_payload = self.slot_size - SLOT_HEADER.size
+
+    @classmethod
+    def create(
+        cls,
+        name: Optional[str] = None,
+        slots: int = 1024,
+        slot_size: int = 4096,
+    ) -> "SharedMessageRing":
+        """
+        Create a ring for a writer process
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the shared memory segment. Defaults to a random name.
+        slots : int
+            Number of messages kept in the ring
+        slot_size : int
+            Bytes per slot, including a 24-byte header. Rounded up to a multiple of 8.
+        """
+
+        slot_size = -(-slot_size // 8) * 8
+        if slots < 1 or slot_size <= SLOT_HEADER.size:
+            raise ValueError("A ring needs at least one slot larger than the slot header")
+
+        size = RING_HEADER.size + slots * slot_size
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        memory.buf[:size] = bytes(size)
+        RING_HEADER.pack_into(memory.buf, 0, RING_MAGIC, RING_VERSION, slots, slot_size, 0, 0)
+        _created.add(memory._name)
+
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, track: bool = False) -> "SharedMessageRing":
+        """
+        Attach to an existing ring as a reader
+
+        Parameters
+        ----------
+        name : str
+            Name of the shared memory segment
+        track : bool
+            Whether this process shares the resource tracker of the writer, as processes started
+            by the writer with `multiprocessing` do, whatever the start method. The tracker records
+            each segment once, so such readers keep the registration, which lets the tracker remove
+            the segment if the writer dies without calling `unlink`. Independent readers leave it
+            False, so that their own tracker does not remove the segment when they exit.
+        """
+        memory = shared_memory.SharedMemory(name=name)
+
+        if not track and memory._name not in _created:
+            resource_tracker.unregister(memory._name, "shared_memory")
+
+        return cls(memory)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def next_sequence(self) -> int:
+        """Sequence number the next published message will get."""
+        return SLOT_LOCK.unpack_from(self._buffer, RING_SEQUENCE_OFFSET)[0]
+
+    @property
+    def oldest_sequence(self) -> int:
+        """Sequence number of the oldest message still in the ring."""
+        return max(0, self.next_sequence - self.slots)
+
+    def __len__(self) -> int:
+        return self.next_sequence - self.oldest_sequence
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _offset(self, sequence: int) -> int:
+        return RING_HEADER.size + (sequence % self.slots) * self.slot_size
+
+    def _lock_word(self, sequence: int) -> int:
+        return SLOT_LOCK.unpack_from(self._buffer, self._offset(sequence))[0]
+
+    def publish(self, message: MessageBase) -> int:
+        """
+        Write a validated message into the next slot
+
+        Only one process may publish to a ring.
+
+        Parameters
+        ----------
+        message : MessageBase
+            Validated message
+
+        Returns
+        -------
+        sequence : int
+            Sequence number of the message
+
+        Raises
+        ------
+        ValueError
+            If the serialized message does not fit in a slot
+        """
+
+        payload = message.to_json()
+        if len(payload) > self.max_payload:
+            raise ValueError(
+                f"Message of {len(payload)} bytes does not fit in a {self.max_payload} byte slot"
+            )
+
+        sequence = self.next_sequence
+        offset = self._offset(sequence)
+        start = offset + SLOT_HEADER.size
+
+        # Mark the slot as being written, copy the message, then commit it and publish
+        SLOT_LOCK.pack_into(self._buffer, offset, 2 * sequence + 1)
+        self._buffer[start:start + len(payload)] = payload
+        time_ns = message.machine_time_ns or message.sent_time_ns
+        SLOT_HEADER.pack_into(
+            self._buffer, offset, 2 * sequence + 1, NO_TIME if time_ns is None else time_ns,
+            TIER_CODES[message.tier], 0, 0, len(payload)
+        )
+        SLOT_LOCK.pack_into(self._buffer, offset, _committed(sequence))
+        SLOT_LOCK.pack_into(self._buffer, RING_SEQUENCE_OFFSET, sequence + 1)
+
+        return sequence
+
+    def read(self, sequence: int) -> Optional[RingRecord]:
+        """
+        Read a message by sequence number, without copying its payload
+
+        Returns
+        -------
+        record : RingRecord, optional
+            The message, or None if it has not been published yet
+
+        Raises
+        ------
+        LookupError
+            If the message was already overwritten
+        """
+
+        offset = self._offset(sequence)
+        lock, time_ns, tier, _, _, length = SLOT_HEADER.unpack_from(self._buffer, offset)
+
+        if lock != _committed(sequence):
+            if lock < 2 * sequence + 1:
+                return None
+            raise LookupError(f"Message {sequence} was overwritten")
+
+        # The header may have been overwritten while unpacking it
+        if self._lock_word(sequence) != lock:
+            raise LookupError(f"Message {sequence} was overwritten while reading")
+
+        start = offset + SLOT_HEADER.size
+        return RingRecord(self, sequence, TIERS[tier], None if time_ns == NO_TIME else time_ns,
+                          start, start + length)
+
+    def reader(self, start: Optional[int] = None) -> "RingReader":
+        """
+        Cursor over published messages
+
+        Parameters
+        ----------
+        start : int, optional
+            First sequence number to read. Defaults to the next message to be published.
+        """
+        return RingReader(self, self.next_sequence if start is None else start)
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory segment
+
+        Payload views taken from records must be released first.
+        """
+        self._buffer = None
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """
+        Remove the shared memory segment, once all processes are done with it
+        """
+        self._memory.unlink()
+
+
+# .................................................................................................
+class RingReader:
+    """
+    Reading position of one consumer in a ring
+
+    Attributes
+    ----------
+    sequence : int
+        Next sequence number to read
+    lost : int
+        Number of messages overwritten before this reader got to them
+    """
+
+    def __init__(self, ring: SharedMessageRing, sequence: int = 0):
+        self.ring = ring
+        self.sequence = sequence
+        self.lost = 0
+
+    def __len__(self) -> int:
+        """Number of published messages not read yet."""
+        return max(0, self.ring.next_sequence - self.sequence)
+
+    def poll(self, max_messages: Optional[int] = None) -> List[RingRecord]:
+        """
+        Published messages not read yet, oldest first, skipping any that were overwritten
+        """
+        records = []
+        end = self.ring.next_sequence
+        if max_messages is not None:
+            end = min(end, self.sequence + max_messages)
+
+        while self.sequence < end:
+            oldest = self.ring.oldest_sequence
+            if self.sequence < oldest:
+                self.lost += oldest - self.sequence
+                self.sequence = oldest
+                continue
+
+            try:
+                record = self.ring.read(self.sequence)
+            except LookupError:
+                self.lost += 1
+                self.sequence += 1
+                continue
+
+            if record is None:
+                break
+
+            records.append(record)
+            self.sequence += 1
+
+        return records
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Asynchronous ingestion of raw message frames
+
+Frames pulled from any async source are batched by size or by age, validated off the event loop
+in an executor, and yielded as typed messages in arrival order. Once `max_pending` batches are
+waiting for the consumer, the source is not read again until the consumer catches up.
+"""
+
+__all__ = [
+    "validate_stream",
+]
+
+# Standard library modules
+import asyncio
+from concurrent.futures import Executor
+from typing import (AsyncIterable, AsyncIterator, Callable, List, Optional,
+                    Union)
+
+# Local modules
+from ..data.compression import decode_payload
+from ..models.messages import MessageBase, parse_message
+
+_END = object()
+
+
+# .................................................................................................
+def _validate_batch(frames: List[bytes]) -> List[Union[MessageBase, Exception]]:
+    """Validate a batch of frames, returning a message or the raised exception for each."""
+    results = []
+    for frame in frames:
+        try:
+            results.append(parse_message(decode_payload(frame)))
+        except (ValueError, TypeError) as e:
+            results.append(e)
+
+    return results
+
+
+# .................................................................................................
+async def _produce(
+    source: AsyncIterable[bytes],
+    queue: asyncio.Queue,
+    batch_size: int,
+    max_latency: float,
+    executor: Optional[Executor],
+) -> None:
+    """Read frames, submit batches for validation and queue (frames, future) pairs in order."""
+    loop = asyncio.get_running_loop()
+    iterator = source.__aiter__()
+    batch: List[bytes] = []
+    deadline = None
+    next_frame = None
+
+    async def flush():
+        nonlocal batch, deadline
+        if batch:
+            future = loop.run_in_executor(executor, _validate_batch, batch)
+            await queue.put((batch, future))
+        batch, deadline = [], None
+
+    try:
+        while True:
+            if next_frame is None:
+                next_frame = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            done, _ = await asyncio.wait({next_frame}, timeout=timeout)
+
+            if not done:
+                await flush()
+                continue
+
+            frame_task, next_frame = next_frame, None
+            try:
+                frame = frame_task.result()
+            except StopAsyncIteration:
+                break
+
+            if not batch:
+                deadline = loop.time() + max_latency
+            batch.append(frame)
+
+            if len(batch) >= batch_size:
+                await flush()
+
+        await flush()
+        await queue.put(_END)
+
+    except Exception as e:
+        await queue.put(e)
+
+    finally:
+        if next_frame is not None:
+            next_frame.cancel()
+
+
+# .................................................................................................
+async def validate_stream(
+    source: AsyncIterable[bytes],
+    batch_size: int = 256,
+    max_latency: float = 0.05,
+    max_pending: int = 4,
+    executor: Optional[Executor] = None,
+    on_error: Optional[Callable[[bytes, Exception], None]] = None,
+) -> AsyncIterator[MessageBase]:
+    """
+    Validate raw JSON frames from an async source and yield typed messages in order
+
+    Parameters
+    ----------
+    source : AsyncIterable[bytes]
+        Any async iterable of raw JSON message frames, which may be compressed with
+        `snews.data.compression.compress`
+    batch_size : int
+        Maximum number of frames validated together
+    max_latency : float
+        Maximum time in seconds a frame waits for its batch to fill before it is validated
+    max_pending : int
+        Maximum number of batches submitted but not yet consumed
+    executor : concurrent.futures.Executor, optional
+        Executor used for validation. Defaults to the event loop's default thread pool; pass a
+        `ProcessPoolExecutor` to validate in worker processes.
+    on_error : Callable[[bytes, Exception], None], optional
+        Called with the frame and exception for every invalid frame, which is then skipped.
+        If not given, the first invalid frame raises its exception.
+
+    Yields
+    ------
+    message : MessageBase
+        Validated message of the type given by the frame's `tier`
+
+    Examples
+    --------
+    >>> async for message in validate_stream(consumer.frames(), batch_size=100):
+    ...     handle(message)
+    """
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(max_pending, 1))
+    producer = asyncio.ensure_future(
+        _produce(source, queue, batch_size, max_latency, executor)
+    )
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+
+            if isinstance(item, Exception):
+                raise item
+
+            frames, future = item
+            for frame, result in zip(frames, await future):
+                if isinstance(result, Exception):
+                    if on_error is None:
+                        raise result
+                    on_error(frame, result)
+                    continue
+
+                yield result
+
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
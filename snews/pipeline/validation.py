@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel validation of message archives
+
+Archives (JSON Lines files or binary record streams) are split into byte ranges aligned to record
+boundaries. Each worker process opens the archive itself, validates its shard and returns only
+compact results: error strings and, optionally, the normalized JSON of each valid message. No
+pydantic objects cross process boundaries.
+"""
+
+__all__ = [
+    "ValidationReport",
+    "validate_archive",
+]
+
+# Standard library modules
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+# Third-party modules
+from pydantic import ValidationError
+
+# Local modules
+from ..data.io import iter_payloads, shard_boundaries
+from ..models.messages import parse_message
+
+
+# .................................................................................................
+@dataclass
+class ValidationReport:
+    """Merged, ordered result of validating an archive
+
+    Attributes:
+        total: Number of records read
+        errors: (record index, reason) for every invalid record, in archive order
+        payloads: Normalized JSON of every valid record in archive order, if requested
+    """
+
+    total: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+    payloads: Optional[List[bytes]] = None
+
+    @property
+    def valid(self) -> int:
+        return self.total - len(self.errors)
+
+    @property
+    def invalid(self) -> int:
+        return len(self.errors)
+
+    def iter_payloads(self) -> Iterator[bytes]:
+        return iter(self.payloads or [])
+
+
+# .................................................................................................
+def _describe(error: Exception) -> str:
+    """One-line description of why a record failed."""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in e['loc']) or '__root__'}: {e['msg']}"
+            for e in error.errors()
+        )
+
+    return f"{type(error).__name__}: {error}"
+
+
+# .................................................................................................
+def _available_cpus() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+# .................................................................................................
+def _validate_shard(
+    filepath: str,
+    start: int,
+    end: int,
+    keep_payloads: bool,
+) -> Tuple[int, List[Tuple[int, str]], Optional[bytes]]:
+    """
+    Validate one shard. Returns the record count, (local index, reason) errors, and optionally
+    the normalized JSON of valid records joined by newlines.
+    """
+
+    count = 0
+    errors = []
+    payloads = []
+
+    for count, raw in enumerate(iter_payloads(filepath, start, end), start=1):
+        try:
+            message = parse_message(json.loads(raw))
+        except (ValueError, TypeError) as e:
+            errors.append((count - 1, _describe(e)))
+            continue
+
+        if keep_payloads:
+            payloads.append(message.model_dump_json().encode("utf-8"))
+
+    return count, errors, b"\n".join(payloads) if keep_payloads else None
+
+
+# .................................................................................................
+def validate_archive(
+    filepath: Union[str, Path],
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+    keep_payloads: bool = False,
+) -> ValidationReport:
+    """
+    Validate every message in a JSON Lines file or binary record stream across processes
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        Path to archive
+    workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs available to this process.
+        With 1, the archive is validated in the calling process.
+    shards : int, optional
+        Number of byte-range shards. Defaults to four per worker for load balancing.
+    keep_payloads : bool
+        Whether to return the normalized JSON of every valid message
+
+    Returns
+    -------
+    report : ValidationReport
+        Record counts, errors and (optionally) payloads, in archive order
+
+    Examples
+    --------
+    >>> report = validate_archive("messages.jsonl", workers=8)
+    >>> report.valid, report.invalid
+    (100000, 0)
+    """
+
+    filepath = str(Path(filepath).resolve())
+    workers = workers or _available_cpus()
+    ranges = shard_boundaries(filepath, shards or 4 * workers)
+
+    args = (
+        [filepath] * len(ranges),
+        [start for start, _ in ranges],
+        [end for _, end in ranges],
+        [keep_payloads] * len(ranges),
+    )
+
+    if workers == 1:
+        results = list(map(_validate_shard, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_shard, *args))
+
+    # Merge shard results in archive order
+    report = ValidationReport(payloads=[] if keep_payloads else None)
+    for count, errors, payloads in results:
+        report.errors.extend((report.total + i, reason) for i, reason in errors)
+        if keep_payloads and payloads:
+            report.payloads.extend(payloads.split(b"\n"))
+        report.total += count
+
+    return report
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import json
+import subprocess
+import sys
+
+import pytest
+
+from snews.__main__ import main
+from snews.data.io import read_records, write_json_lines
+from snews.data.mock import MessageGenerator
+
+
+@pytest.fixture
+def messages_file(tmp_path):
+    messages = MessageGenerator(seed=5, start="2024-01-01T00:00:00").stream(
+        duration_sec=300, scale=5, hits_per_burst=10
+    )
+    filepath = tmp_path / "messages.jsonl"
+    write_json_lines(filepath, messages)
+
+    return filepath, messages
+
+
+@pytest.mark.parametrize("suffix", [".json", ".bin", ".snar", ".parquet"])
+def test_convert_round_trip(tmp_path, messages_file, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+
+    source, messages = messages_file
+    converted = tmp_path / f"converted{suffix}"
+    back = tmp_path / "back.jsonl"
+
+    main(["convert", str(source), str(converted)])
+    main(["convert", str(converted), str(back), "--validate"])
+
+    key = lambda m: m["uuid"]  # noqa: E731
+    assert sorted(read_records(back), key=key) == sorted(messages, key=key)
+
+
+def test_validate_reports_errors(tmp_path, messages_file, capsys):
+    source, messages = messages_file
+    main(["validate", str(source), "--workers", "1"])
+    assert f"{len(messages)} valid, 0 invalid" in capsys.readouterr().out
+
+    broken = tmp_path / "broken.jsonl"
+    write_json_lines(broken, messages[:3] + [{**messages[0], "tier": "Unknown"}])
+
+    with pytest.raises(SystemExit):
+        main(["validate", str(broken), "--workers", "1"])
+    assert "3 valid, 1 invalid" in capsys.readouterr().out
+
+
+def test_stats(messages_file, capsys):
+    source, messages = messages_file
+    main(["stats", str(source)])
+
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["messages"] == len(messages)
+    assert sum(stats["tiers"].values()) == len(messages)
+    assert stats["first_time_utc"] <= stats["last_time_utc"]
+
+
+def test_bench(capsys):
+    main(["bench", "--messages", "5", "--repeat", "1"])
+
+    output = capsys.readouterr().out
+    assert "HeartbeatMessage" in output and "validate_json" in output
+
+
+def test_bench_memory(capsys):
+    main(["bench", "--memory"])
+
+    output = capsys.readouterr().out
+    assert "TimingTierMessage" in output and "deep size" in output
+
+
+def test_migrate(tmp_path, messages_file):
+    source, messages = messages_file
+    destination = tmp_path / "migrated.jsonl"
+    main(["migrate", str(source), str(destination)])
+
+    assert [r["uuid"] for r in read_records(destination)] == [m["uuid"] for m in messages]
+
+
+def test_startup_skips_command_modules():
+    script = (
+        "import sys\n"
+        "import snews.__main__\n"
+        "print(sorted(m for m in ('snews.bench', 'snews.memory', 'snews.models.migrations',\n"
+        "                         'snews.pipeline') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            check=True)
+
+    assert result.stdout.strip() == "[]"
@@ -1,6 +1,17 @@
 # -*- coding: utf-8 -*-
+import json
+
 from snews.__main__ import main
+from snews.data import detectors
 
 
 def test_main():
-    assert main() is None
+    assert main([]) is None
+
+
+def test_main_build_detectors(tmp_path):
+    bundle_path = tmp_path / "bundle.json"
+    assert main(["build-detectors", "--output", str(bundle_path)]) is None
+
+    bundle = json.loads(bundle_path.read_text())
+    assert bundle["detectors"] == [d.model_dump(mode="json") for d in detectors.all]
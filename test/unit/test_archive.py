@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.data.io import MessageArchive, time_key, write_archive
+from snews.data.mock import MessageGenerator
+from snews.models.messages import (CoincidenceTierMessage, HeartbeatMessage,
+                                   RetractionMessage)
+from snews.models.timing import timestamp_to_ns
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def messages():
+    generator = MessageGenerator(seed=5, start="2024-01-01T00:00:00", is_test=False)
+    return generator.stream(duration_sec=3600, scale=10, hits_per_burst=10)
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory, messages):
+    filepath = tmp_path_factory.mktemp("archive") / "messages.snar"
+    write_archive(filepath, messages)
+
+    with MessageArchive(filepath) as archive:
+        yield archive
+
+
+# .................................................................................................
+def test_archive_time_index_is_sorted(archive, messages):
+    assert len(archive) == len(messages)
+    assert np.all(np.diff(archive.times) >= 0)
+    assert sorted(time_key(m) for m in messages) == archive.times.tolist()
+
+
+# .................................................................................................
+def test_archive_window_around_time(archive, messages):
+    center = "2024-01-01T00:30:00"
+    window = archive.around(center, before_sec=300, after_sec=300)
+
+    expected = [m for m in messages if abs(time_key(m) - timestamp_to_ns(center)) <= 300 * 10**9]
+    assert sorted(m.uuid for m in window) == sorted(m["uuid"] for m in expected)
+    assert [time_key(m.model_dump()) for m in window] == sorted(time_key(m) for m in expected)
+
+
+# .................................................................................................
+def test_archive_lookup_by_uuid(archive, messages):
+    for message in messages[::97]:
+        assert archive.get(message["uuid"]).model_dump(mode="json") == message
+
+    assert archive.get("00000000-0000-0000-0000-000000000000") is None
+
+
+# .................................................................................................
+def test_archive_reads_stale_coincidence_messages(archive, messages):
+    # Coincidence messages older than 48 hours no longer validate, but must still be readable
+    stale = next(m for m in messages if m["tier"] == "CoincidenceTier")
+    message = archive.get(stale["uuid"])
+
+    assert isinstance(message, CoincidenceTierMessage)
+    assert message.neutrino_time_utc == stale["neutrino_time_utc"]
+
+
+# .................................................................................................
+def test_archive_from_models_with_arbitrary_uuids(tmp_path):
+    messages = [
+        HeartbeatMessage(detector_name="Super-K", detector_status="ON", uuid="heartbeat-1",
+                         machine_time_utc="2024-01-01T00:00:01"),
+        RetractionMessage(detector_name="Super-K", retract_latest_n=1, uuid="retraction-1",
+                          machine_time_utc="2024-01-01T00:00:00"),
+        HeartbeatMessage(detector_name="Super-K", detector_status="OFF"),
+    ]
+    write_archive(tmp_path / "messages.snar", messages)
+
+    with MessageArchive(tmp_path / "messages.snar") as archive:
+        assert archive.get("heartbeat-1") == messages[0]
+        assert archive.get("retraction-1") == messages[1]
+        assert [archive.message(i) for i in archive.between(0, "2100-01-01")] == messages[1::-1]
+
+
+# .................................................................................................
+def test_archive_get_decodes_once_and_close_unmaps(tmp_path, messages, monkeypatch):
+    filepath = tmp_path / "messages.snar"
+    write_archive(filepath, messages[:50])
+
+    archive = MessageArchive(filepath)
+    decoded = []
+    record = archive.record
+    monkeypatch.setattr(archive, "record", lambda r: decoded.append(r) or record(r))
+
+    assert archive.get(messages[10]["uuid"]).uuid == messages[10]["uuid"]
+    assert len(decoded) == 1
+
+    mapping = archive._mmap
+    archive.close()
+    assert mapping.closed
+
+
+# .................................................................................................
+def test_archive_rejects_other_files(tmp_path):
+    (tmp_path / "messages.jsonl").write_bytes(b"{}\n" * 20)
+
+    with pytest.raises(ValueError) as exc_info:
+        MessageArchive(tmp_path / "messages.jsonl")
+
+    assert "is not a SNEWS message archive" in str(exc_info.value)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import json
+import time
+from datetime import UTC, datetime
+
+# Third-party modules
+import pytest
+from pydantic import ValidationError
+
+# Local modules
+from snews.models.messages import (CoincidenceTierMessage, HeartbeatMessage,
+                                   MessageCache, compatible_message_types,
+                                   create_messages, parse_message)
+
+heartbeat = HeartbeatMessage(detector_name="Super-K", detector_status="ON").model_dump(mode="json")
+
+
+# .................................................................................................
+def test_cache_hits_on_redelivered_payload():
+    cache = MessageCache()
+    raw = json.dumps(heartbeat).encode()
+
+    first = parse_message(raw, cache=cache)
+    second = parse_message(raw, cache=cache)
+
+    assert first == second and first is not second
+    assert cache.stats() == {"hits": 1, "misses": 1, "bypassed": 0, "size": 1}
+
+    # Changes to returned messages do not leak into the cache
+    second.detector_status = "OFF"
+    assert parse_message(raw, cache=cache).detector_status == "ON"
+
+
+# .................................................................................................
+def test_cache_returns_independent_containers():
+    cache = MessageCache()
+    raw = json.dumps({**heartbeat, "meta": {"runs": [1, 2]}}).encode()
+
+    parse_message(raw, cache=cache).meta["runs"].append(3)
+    assert parse_message(raw, cache=cache).meta["runs"] == [1, 2]
+
+    inputs = {
+        "uuid": "0f8fad5b-d9cb-469f-a165-70867728950e",
+        "detector_name": "Super-K",
+        "neutrino_time_utc": datetime.now(UTC).isoformat(),
+        "is_test": True,
+        "meta": {"runs": [1, 2]},
+    }
+    create_messages(cache=cache, **inputs)[0].meta["runs"].clear()
+    assert create_messages(cache=cache, **inputs)[0].meta["runs"] == [1, 2]
+    assert cache.stats()["hits"] == 2
+
+
+# .................................................................................................
+@pytest.mark.parametrize("is_test, cacheable", [
+    (True, True), ("true", True), (1, True), (None, False), (False, False), ("false", False),
+    ("0", False), ("maybe", False),
+])
+def test_cache_reads_is_test_like_the_models(is_test, cacheable):
+    payload = {"uuid": "x", "neutrino_time_utc": "2024-01-01T00:00:00Z", "is_test": is_test}
+    assert MessageCache.is_cacheable(payload) is cacheable
+
+
+# .................................................................................................
+def test_cache_bypasses_time_dependent_and_uuidless_payloads():
+    cache = MessageCache()
+    coincidence = {
+        "uuid": "0f8fad5b-d9cb-469f-a165-70867728950e",
+        "detector_name": "Super-K",
+        "neutrino_time_utc": datetime.now(UTC).isoformat(),
+    }
+
+    for _ in range(2):
+        assert parse_message({**coincidence, "tier": "CoincidenceTier"}, cache=cache)
+        create_messages(cache=cache, detector_name="Super-K", detector_status="ON")
+
+    assert cache.stats() == {"hits": 0, "misses": 0, "bypassed": 4, "size": 0}
+
+    # Test messages are exempt from the time window, so they can be cached
+    create_messages(cache=cache, is_test=True, **coincidence)
+    messages = create_messages(cache=cache, is_test=True, **coincidence)
+    assert [type(m) for m in messages] == [CoincidenceTierMessage]
+    assert cache.stats()["hits"] == 1
+
+
+# .................................................................................................
+def test_cache_compatible_message_types():
+    cache = MessageCache()
+    inputs = {"uuid": heartbeat["uuid"], "detector_name": "Super-K", "detector_status": "ON"}
+
+    assert compatible_message_types(cache=cache, **inputs) == [HeartbeatMessage]
+    assert compatible_message_types(cache=cache, **inputs) == [HeartbeatMessage]
+    assert compatible_message_types(include_heartbeats=True, cache=cache, **inputs)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+# .................................................................................................
+def test_cache_eviction_and_expiry():
+    cache = MessageCache(maxsize=2, ttl=0.05)
+    payloads = [{**heartbeat, "uuid": str(i)} for i in range(3)]
+
+    for payload in payloads:
+        parse_message(payload, cache=cache)
+    assert len(cache) == 2
+
+    parse_message(payloads[0], cache=cache)
+    assert cache.stats()["misses"] == 4
+
+    time.sleep(0.1)
+    parse_message(payloads[0], cache=cache)
+    assert cache.stats()["hits"] == 0 and cache.stats()["misses"] == 5
+
+
+# .................................................................................................
+def test_cache_does_not_store_errors():
+    cache = MessageCache()
+    invalid = {**heartbeat, "detector_status": "OK"}
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            parse_message(invalid, cache=cache)
+
+    assert len(cache) == 0
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import asyncio
+import json
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data import compression
+from snews.data.io import (ARCHIVE_CODEC_ZSTD, MessageArchive, encode_record, iter_payloads,
+                           read_binary, write_archive, write_binary)
+from snews.data.mock import MessageGenerator
+from snews.models.messages import Tier, parse_message
+from snews.pipeline import validate_stream
+
+zstandard = pytest.importorskip("zstandard")
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def records():
+    generator = MessageGenerator(seed=9, start="2024-01-01T00:00:00")
+    messages = generator.stream(duration_sec=3600, scale=10, hits_per_burst=10)
+    return [parse_message(m).model_dump(mode="json") for m in messages]
+
+
+# .................................................................................................
+def test_shipped_dictionary_matches_its_version():
+    dictionary = compression.load_dictionary()
+
+    assert compression.dictionary_path().name == f"messages-v{compression.DICTIONARY_VERSION}.zdict"
+    assert dictionary.dict_id() == compression.DICTIONARY_ID_BASE + compression.DICTIONARY_VERSION
+
+    with pytest.raises(ValueError, match="Unknown message dictionary version"):
+        compression.load_dictionary(0)
+
+
+# .................................................................................................
+def test_compression_round_trips_and_shrinks_every_tier(records):
+    by_tier = {}
+    for record in records:
+        by_tier.setdefault(record["tier"], []).append(encode_record(record))
+
+    assert set(by_tier) == {tier.value for tier in Tier}
+
+    plain = zstandard.ZstdCompressor()
+    for tier, payloads in by_tier.items():
+        frames = [compression.compress(p) for p in payloads]
+        assert [compression.decompress(f) for f in frames] == payloads
+        assert all(compression.is_compressed(f) for f in frames)
+
+        # The dictionary beats compressing each message on its own, by a wide margin for
+        # messages that are mostly envelope fields
+        size = sum(len(f) for f in frames)
+        margin = 0.9 if tier == Tier.SIGNIFICANCE_TIER.value else 0.6
+        assert size < margin * sum(len(plain.compress(p)) for p in payloads), tier
+        assert size < 0.5 * sum(len(p) for p in payloads), tier
+
+
+# .................................................................................................
+def test_decode_payload_accepts_plain_and_compressed(records):
+    payload = encode_record(records[0])
+
+    assert compression.decode_payload(payload) == payload
+    assert compression.decode_payload(memoryview(compression.compress(payload))) == payload
+    assert compression.decode_payload(zstandard.ZstdCompressor().compress(payload)) == payload
+
+    with pytest.raises(ValueError, match="Invalid compressed message"):
+        compression.decode_payload(compression.compress(payload)[:-5])
+
+    # Text frames are plain JSON
+    assert compression.decode_payload(payload.decode()) == payload.decode()
+
+
+# .................................................................................................
+def test_decompress_checks_declared_size_first(records):
+    payload = encode_record(records[0])
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        compression.decode_payload(compression.compress(payload), max_payload=len(payload) - 1)
+
+    # Single-segment frame header declaring 2**40 bytes, followed by one empty raw block
+    forged = compression.ZSTD_MAGIC + b"\xe0" + (2**40).to_bytes(8, "little") + b"\x01\x00\x00"
+    assert len(forged) == 16
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        compression.decompress(forged)
+
+    unsized = zstandard.ZstdCompressor(write_content_size=False).compress(payload)
+    with pytest.raises(ValueError, match="does not declare its size"):
+        compression.decompress(unsized)
+
+
+# .................................................................................................
+def test_compressed_binary_stream(tmp_path, records):
+    plain, compressed = tmp_path / "plain.bin", tmp_path / "compressed.bin"
+    write_binary(plain, records)
+    write_binary(compressed, records, compress=True)
+
+    assert compressed.stat().st_size < plain.stat().st_size / 2
+    assert list(read_binary(compressed)) == records
+    assert [json.loads(p) for p in iter_payloads(compressed)] == records
+
+
+# .................................................................................................
+def test_compressed_archive(tmp_path, records):
+    filepath = tmp_path / "messages.snar"
+    write_archive(filepath, records, codec=ARCHIVE_CODEC_ZSTD)
+
+    with MessageArchive(filepath) as archive:
+        assert archive.codec == ARCHIVE_CODEC_ZSTD
+        assert compression.is_compressed(archive.payload(0))
+        assert sorted(archive.record(i)["uuid"] for i in range(len(archive))) == sorted(
+            r["uuid"] for r in records
+        )
+        assert archive.get(records[3]["uuid"]).model_dump(mode="json") == records[3]
+
+    with pytest.raises(ValueError, match="Unknown archive codec"):
+        write_archive(filepath, records, codec=7)
+
+
+# .................................................................................................
+def test_stream_validates_compressed_frames(records):
+    async def source():
+        for record in records[:20]:
+            yield compression.compress(encode_record(record))
+
+    async def collect():
+        return [message async for message in validate_stream(source(), batch_size=8)]
+
+    messages = asyncio.run(collect())
+    assert [m.uuid for m in messages] == [r["uuid"] for r in records[:20]]
+
+
+# .................................................................................................
+def test_stream_validates_text_frames(records):
+    async def source():
+        for record in records[:5]:
+            yield encode_record(record).decode()
+
+    async def collect():
+        return [message async for message in validate_stream(source(), batch_size=2)]
+
+    messages = asyncio.run(collect())
+    assert [m.uuid for m in messages] == [r["uuid"] for r in records[:5]]
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import json
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data.mock import MessageGenerator
+from snews.models.deltas import HeartbeatDeltaDecoder, HeartbeatDeltaEncoder
+from snews.models.messages import HeartbeatMessage
+
+
+# .................................................................................................
+@pytest.fixture
+def heartbeats():
+    generator = MessageGenerator(seed=3, start="2024-01-01T00:00:00",
+                                 detector_names=["Super-K", "IceCube"])
+    return generator.heartbeats(duration_sec=600, interval_sec=5, p_off=0.2)
+
+
+# .................................................................................................
+def test_delta_round_trip(heartbeats):
+    encoder, decoder = HeartbeatDeltaEncoder(), HeartbeatDeltaDecoder()
+    frames = [encoder.encode(m) for m in heartbeats]
+
+    decoded = [decoder.decode(json.loads(json.dumps(f))) for f in frames]
+
+    assert sum("template" in f for f in frames) == 2
+    assert all(isinstance(m, HeartbeatMessage) for m in decoded)
+    assert [m.model_dump(mode="json") for m in decoded] == heartbeats
+    assert sum(len(json.dumps(f)) for f in frames) < sum(len(json.dumps(m)) for m in heartbeats)
+
+
+# .................................................................................................
+def test_delta_patch_contains_only_changed_fields():
+    encoder = HeartbeatDeltaEncoder()
+    first = HeartbeatMessage(detector_name="Super-K", detector_status="ON",
+                             machine_time_utc="2024-01-01T00:00:00")
+    second = HeartbeatMessage(detector_name="Super-K", detector_status="OFF",
+                              machine_time_utc="2024-01-01T00:00:05")
+
+    assert "template" in encoder.encode(first)
+    frame = encoder.encode(second)
+
+    assert frame["detector_name"] == "Super-K"
+    assert set(frame["patch"]) == {"uuid", "machine_time_utc", "detector_status"}
+
+
+# .................................................................................................
+def test_delta_custom_id_and_new_fields():
+    encoder, decoder = HeartbeatDeltaEncoder(), HeartbeatDeltaDecoder()
+    messages = [
+        HeartbeatMessage(detector_name="Super-K", detector_status="ON"),
+        HeartbeatMessage(id="custom", detector_name="Super-K", detector_status="ON"),
+        HeartbeatMessage(detector_name="Super-K", detector_status="ON", is_test=True),
+    ]
+
+    frames = [encoder.encode(m) for m in messages]
+    assert frames[1]["patch"]["id"] == "custom"
+    assert "template" in frames[2]
+
+    assert [decoder.decode(f) for f in frames] == messages
+
+
+# .................................................................................................
+def test_delta_decoder_validates_patches():
+    decoder = HeartbeatDeltaDecoder()
+
+    with pytest.raises(ValueError, match="No heartbeat template"):
+        decoder.decode({"detector_name": "Super-K", "patch": {}})
+
+    decoder.decode({"template": {"detector_name": "Super-K", "detector_status": "ON"}})
+
+    with pytest.raises(ValueError, match="ON or OFF"):
+        decoder.decode({"detector_name": "Super-K", "patch": {"detector_status": "OK"}})
+
+    with pytest.raises(ValueError):
+        decoder.decode({"detector_name": "Super-K", "patch": {"machine_time_utc": "yesterday"}})
+
+    # Other fields fall back to full validation
+    message = decoder.decode({"detector_name": "Super-K", "patch": {"is_pre_sn": True}})
+    assert message.is_pre_sn and message.id == "Super-K_Heartbeat_None"
+
+
+# .................................................................................................
+def test_delta_decoded_messages_do_not_share_meta():
+    decoder = HeartbeatDeltaDecoder()
+    template = decoder.decode({"template": {"detector_name": "Super-K", "detector_status": "ON",
+                                            "meta": {"a": {"b": [1]}}}})
+    patch = {"detector_name": "Super-K", "patch": {"detector_status": "OFF"}}
+
+    first, second = decoder.decode(patch), decoder.decode(patch)
+    first.meta["a"]["b"].append(2)
+
+    assert second.meta == {"a": {"b": [1]}}
+    assert template.meta == {"a": {"b": [1]}}
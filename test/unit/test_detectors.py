@@ -1,6 +1,9 @@
 import unittest
+from unittest import mock
 
+from snews.data.io import read_json_file
 from snews.models import detectors
+from snews.models.detectors import Detector, DetectorType
 
 
 class TestDetectors(unittest.TestCase):
@@ -9,3 +12,34 @@ class TestDetectors(unittest.TestCase):
         expected = detectors.__all__
         actual = detectors.__dir__()
         self.assertEqual(expected, actual)
+
+
+class TestDetectorBundle(unittest.TestCase):
+
+    def test_bundle_matches_validated_detectors(self):
+        from snews.data import detectors as data
+
+        validated = [Detector(**read_json_file(f)) for f in data._source_filepaths()]
+        loaded = data.load_detectors()
+
+        self.assertEqual(loaded, validated)
+        self.assertEqual([type(d.type) for d in loaded], [DetectorType] * len(loaded))
+
+    def test_bundle_is_ignored_when_stale(self):
+        from snews.data import detectors as data
+
+        validated = [Detector(**read_json_file(f)) for f in data._source_filepaths()]
+
+        with mock.patch.object(data, "read_json_file", wraps=read_json_file) as read, \
+                mock.patch.object(data, "source_hash", return_value="stale"):
+            self.assertEqual(data.load_detectors(), validated)
+
+        self.assertEqual(read.call_count, len(validated))
+
+    def test_source_hash_depends_on_package_version(self):
+        from snews.data import detectors as data
+
+        filepaths = data._source_filepaths()
+        current = data.source_hash(filepaths)
+        with mock.patch.object(data, "__version__", "0.0.0"):
+            self.assertNotEqual(data.source_hash(filepaths), current)
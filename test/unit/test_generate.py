@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.data.io import read_binary, read_json_lines
+from snews.data.mock import MessageGenerator
+from snews.models.messages import (CoincidenceTierMessage, HeartbeatMessage,
+                                   RetractionMessage, SignificanceTierMessage,
+                                   Tier, TimingTierMessage)
+from snews.models.timing import timestamp_to_ns
+
+message_types = {
+    Tier.HEART_BEAT.value: HeartbeatMessage,
+    Tier.RETRACTION.value: RetractionMessage,
+    Tier.TIMING_TIER.value: TimingTierMessage,
+    Tier.SIGNIFICANCE_TIER.value: SignificanceTierMessage,
+    Tier.COINCIDENCE_TIER.value: CoincidenceTierMessage,
+}
+
+
+# .................................................................................................
+def make_stream(seed=42):
+    generator = MessageGenerator(seed=seed, start="2024-01-01T00:00:00")
+    return generator.stream(duration_sec=600, scale=20, hits_per_burst=50)
+
+
+# .................................................................................................
+def test_generated_stream_is_reproducible():
+    assert make_stream(seed=1) == make_stream(seed=1)
+    assert make_stream(seed=1) != make_stream(seed=2)
+
+
+# .................................................................................................
+def test_generated_stream_covers_all_tiers_in_order():
+    messages = make_stream()
+
+    assert {m["tier"] for m in messages} == set(message_types)
+    assert [m["sent_time_utc"] for m in messages] == sorted(m["sent_time_utc"] for m in messages)
+
+
+# .................................................................................................
+def test_generated_messages_validate_unchanged():
+    for message in make_stream():
+        model = message_types[message["tier"]](**message)
+        assert model.model_dump(mode="json") == message
+
+
+# .................................................................................................
+def test_generated_timing_burst_size():
+    generator = MessageGenerator(seed=0, start="2024-01-01T00:00:00")
+    bursts = generator.timing_bursts([generator.start_ns], hits_per_burst=5000)
+
+    assert len(bursts[0]["timing_series"]) == 5000
+    assert bursts[0]["timing_series"] == sorted(bursts[0]["timing_series"])
+
+
+# .................................................................................................
+def test_generated_timing_onsets_keep_ns_precision():
+    # Without decay every hit sits at the burst onset, which float64 would round to 256 ns steps
+    generator = MessageGenerator(seed=0, start="2024-01-01T00:00:00")
+    bursts = generator.timing_bursts(generator.start_ns + np.arange(1, 51), hits_per_burst=1,
+                                     decay_sec=0)
+
+    assert any(timestamp_to_ns(b["timing_series"][0]) % 256 for b in bursts)
+
+
+# .................................................................................................
+@pytest.mark.parametrize("format, reader", [("jsonl", read_json_lines), ("binary", read_binary)])
+def test_generated_stream_write_roundtrip(tmp_path, format, reader):
+    messages = make_stream()
+    filepath = tmp_path / f"messages.{format}"
+
+    assert MessageGenerator.write(filepath, messages, format=format) == len(messages)
+    assert list(reader(filepath)) == messages
+
+
+# .................................................................................................
+def test_generated_stream_write_unknown_format(tmp_path):
+    with pytest.raises(ValueError) as exc_info:
+        MessageGenerator.write(tmp_path / "messages.xml", [], format="xml")
+
+    assert "Unsupported format" in str(exc_info.value)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Standard library modules
+import json
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.data.mock import MessageGenerator
+from snews.models.headers import PEEK_BYTES, peek_header
+from snews.models.messages import Tier, TimingTierMessage
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def timing_payload():
+    generator = MessageGenerator(seed=5, start="2024-01-01T00:00:00")
+    return generator.timing_bursts(np.array([generator.start_ns]), hits_per_burst=2000)[0]
+
+
+# .................................................................................................
+def test_peek_header_reads_routing_fields(timing_payload):
+    message = TimingTierMessage(**timing_payload)
+    raw = message.model_dump_json().encode()
+
+    header = peek_header(raw)
+
+    assert header.tier == Tier.TIMING_TIER
+    assert header.detector_name == message.detector_name
+    assert header.machine_time_utc == message.machine_time_utc
+    assert header.machine_time_ns == message.machine_time_ns
+    assert header.message_type is TimingTierMessage
+    assert peek_header(memoryview(raw)) == peek_header(raw.decode()) == header
+
+
+# .................................................................................................
+def test_peek_header_falls_back_to_full_parse(timing_payload):
+    expected = peek_header(json.dumps(timing_payload))
+
+    # Header fields after the timing series, and after a long non-ASCII prefix
+    reordered = dict(reversed(list(timing_payload.items())))
+    padded = {"meta": {"note": "é" * PEEK_BYTES}, **timing_payload}
+
+    assert peek_header(json.dumps(reordered)) == expected
+    assert peek_header(json.dumps(padded, ensure_ascii=False).encode()) == expected
+
+
+# .................................................................................................
+@pytest.mark.parametrize("raw", [
+    b'{"tier": "NotATier", "detector_name": "Super-K"}',
+    b'{"detector_name": "Super-K"}',
+    b'{"tier": "Heartbeat", "machine_time_utc": "not a time"}',
+    b'["Heartbeat"]',
+    b'{"tier": "Heart',
+])
+def test_peek_header_rejects_invalid_headers(raw):
+    with pytest.raises(ValueError):
+        peek_header(raw)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import json
+import os
+import subprocess
+import sys
+
+# Third-party modules
+import pytest
+from pydantic import ValidationError
+
+# Local modules
+from snews.models import instrumentation
+from snews.models.messages import HeartbeatMessage, RetractionMessage
+
+
+# .................................................................................................
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+# .................................................................................................
+def test_instrumentation_disabled_by_default():
+    assert not instrumentation.is_enabled()
+    assert not isinstance(HeartbeatMessage.__pydantic_validator__,
+                          instrumentation._InstrumentedValidator)
+
+
+# .................................................................................................
+def test_instrumentation_counts_messages_by_tier(enabled):
+    HeartbeatMessage(detector_name="Super-K", detector_status="ON")
+    HeartbeatMessage.model_validate({"detector_name": "Super-K", "detector_status": "OFF"})
+    RetractionMessage(detector_name="Super-K", retract_latest_n=1)
+
+    messages = instrumentation.get_stats()["messages"]
+    assert messages["Heartbeat"]["valid"]["count"] == 2
+    assert messages["Retraction"]["valid"]["count"] == 1
+
+
+# .................................................................................................
+def test_instrumentation_counts_failures_by_reason(enabled):
+    with pytest.raises(ValidationError):
+        HeartbeatMessage(detector_name="Super-K", detector_status="OK")
+
+    with pytest.raises(ValidationError):
+        HeartbeatMessage(detector_status="ON")
+
+    stats = instrumentation.get_stats()
+    assert stats["messages"]["Heartbeat"]["invalid"]["count"] == 2
+    assert stats["failures"]["Heartbeat"] == {
+        "detector_status:value_error": 1,
+        "detector_name:missing": 1,
+    }
+
+
+# .................................................................................................
+def test_instrumentation_disable_keeps_counters(enabled):
+    HeartbeatMessage(detector_name="Super-K", detector_status="ON")
+    instrumentation.disable()
+    HeartbeatMessage(detector_name="Super-K", detector_status="ON")
+
+    assert type(HeartbeatMessage.__pydantic_validator__).__name__ == "SchemaValidator"
+    assert instrumentation.get_stats()["messages"]["Heartbeat"]["valid"]["count"] == 1
+
+
+# .................................................................................................
+def test_instrumentation_prometheus_text(enabled):
+    with pytest.raises(ValidationError):
+        HeartbeatMessage(detector_name="Super-K", detector_status="OK")
+
+    text = instrumentation.prometheus_text()
+    assert "# TYPE snews_messages_validated_total counter" in text
+    assert 'snews_messages_validated_total{tier="Heartbeat",outcome="invalid"} 1' in text
+    assert ('snews_message_failures_total{tier="Heartbeat",reason="detector_status:value_error"} 1'
+            in text)
+
+
+# .................................................................................................
+def test_instrumentation_profiles_validators_when_requested():
+    script = (
+        "import json\n"
+        "from snews.models import instrumentation\n"
+        "from snews.models.messages import TimingTierMessage\n"
+        "instrumentation.enable()\n"
+        "TimingTierMessage(detector_name='Super-K', timing_series=['2020-01-01T00:00:00'])\n"
+        "print(json.dumps(instrumentation.get_stats()))\n"
+    )
+    env = {**os.environ, "SNEWS_PROFILE_VALIDATORS": "1"}
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True,
+                            check=True, text=True)
+    stats = json.loads(result.stdout)
+    validators = stats["validators"]
+
+    # Validators built on enable are instrumented too
+    assert stats["messages"]["TimingTier"]["valid"]["count"] == 1
+    assert validators["TimingTierMessage._validate_timing_series"]["count"] == 1
+    assert validators["MessageBase._convert_timestamp_to_ns_precision"]["count"] == 2
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Standard library modules
+import json
+from typing import Optional
+
+# Third-party modules
+import pytest
+from pydantic import TypeAdapter
+
+# Local modules
+from snews.models.headers import peek_header
+from snews.models.lazy import LazyJSON, find_object_value
+from snews.models.messages import HeartbeatMessage, SignificanceTierMessage
+
+META = {"diagnostics": [[0.5, 1.5], [2.5]], "note": 'quoted " } ] \\ text', "nested": {"meta": 1}}
+
+
+# .................................................................................................
+def heartbeat(**kwargs):
+    return HeartbeatMessage(detector_name="Super-K", detector_status="ON", is_test=True, **kwargs)
+
+
+# .................................................................................................
+def test_lazy_json_parses_on_first_access():
+    lazy = LazyJSON(json.dumps(META, indent=1))
+    assert not lazy.is_parsed
+
+    assert lazy["nested"] == {"meta": 1}
+    assert lazy.is_parsed
+    assert lazy == META and dict(lazy) == META
+
+    with pytest.raises(ValueError):
+        LazyJSON(b'{"a": 1').value
+
+    for raw in (b"[1, 2]", b"hello", b" "):
+        with pytest.raises(ValueError):
+            LazyJSON(raw)
+
+
+# .................................................................................................
+def test_find_object_value():
+    raw = json.dumps({"id": "meta", "a": {"meta": [1]}, "meta": META, "b": [1]}).encode()
+    start, end = find_object_value(raw, "meta")
+    assert json.loads(raw[start:end]) == META
+
+    assert find_object_value(b'{"meta": null, "a": 1}', "meta") == (9, 13)
+    assert find_object_value(b'{"meta": [1]}', "meta") is None
+    assert find_object_value(b'{"a": {"meta": {}}}', "meta") is None
+
+    # Closing brackets must match the innermost open one
+    assert find_object_value(b'{"meta": {"a": [1, 2}]}', "meta") is None
+    assert find_object_value(b'{"a": [1}, "meta": {}}', "meta") is None
+
+
+# .................................................................................................
+def test_message_meta_round_trips_verbatim():
+    raw_meta = json.dumps(META, indent=2).encode()
+    message = heartbeat(meta=LazyJSON(raw_meta))
+
+    assert isinstance(message.meta, LazyJSON) and not message.meta.is_parsed
+    assert message.model_dump()["meta"] == META
+
+    raw = message.to_json()
+    assert raw.endswith(b'"meta":' + raw_meta + b"}")
+    assert peek_header(raw).detector_name == "Super-K"
+
+    decoded = HeartbeatMessage.from_json(raw)
+    assert decoded.meta.raw == raw_meta and not decoded.meta.is_parsed
+    assert decoded.to_json() == raw
+    assert decoded.model_dump() == message.model_dump()
+
+
+# .................................................................................................
+def test_message_meta_dicts_and_nulls_are_unchanged():
+    message = heartbeat(meta=META)
+    assert type(message.meta) is dict
+
+    for meta in (META, None):
+        raw = heartbeat(meta=meta).model_dump_json()
+        assert HeartbeatMessage.from_json(raw) == HeartbeatMessage.model_validate_json(raw)
+
+    expected = TypeAdapter(Optional[dict]).json_schema()
+    schema = SignificanceTierMessage.model_json_schema()["properties"]["meta"]
+    assert schema["anyOf"] == expected["anyOf"]
+
+
+# .................................................................................................
+def test_meta_size_limit(monkeypatch):
+    raw = heartbeat(meta=LazyJSON(json.dumps(META))).to_json()
+    monkeypatch.setattr(HeartbeatMessage, "meta_max_bytes", 32)
+
+    with pytest.raises(ValueError):
+        HeartbeatMessage.from_json(raw)
+
+    with pytest.raises(ValueError):
+        heartbeat(meta=LazyJSON(json.dumps(META)))
+
+    assert heartbeat(meta=LazyJSON(b'{"ok": true}')).meta == {"ok": True}
+
+
+# .................................................................................................
+def test_raw_meta_only_through_from_json():
+    # Raw JSON is never taken for a meta object unless it is wrapped explicitly
+    for meta in ("hello", b'{"ok": true}', json.dumps(META)):
+        with pytest.raises(ValueError):
+            heartbeat(meta=meta)
+
+    raw = heartbeat(meta=None).to_json().replace(b'"meta":null', b'"meta":{"a":[1,2}]')
+    assert b'"meta":{"a":[1,2}]' in raw
+    with pytest.raises(ValueError):
+        HeartbeatMessage.from_json(raw)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.analysis import LightCurve, build_light_curves, hit_times_ns
+from snews.data.mock import MessageGenerator
+from snews.models.messages import TimingTierMessage
+
+
+# .................................................................................................
+def timing_payloads(n_messages=4, hits_per_burst=500):
+    generator = MessageGenerator(seed=11, start="2024-01-01T00:00:00", detector_names=["Super-K"])
+    return generator.timing_bursts(
+        sent_ns=generator.start_ns + np.arange(n_messages) * 10**9, hits_per_burst=hits_per_burst
+    )
+
+
+# .................................................................................................
+def test_hit_times_ns():
+    payload = timing_payloads(1)[0]
+    message = TimingTierMessage(**payload)
+
+    expected = hit_times_ns(payload)
+    assert expected.dtype == np.int64
+    np.testing.assert_array_equal(hit_times_ns(message), expected)
+    np.testing.assert_array_equal(hit_times_ns(list(expected)), expected)
+
+
+# .................................................................................................
+def test_light_curve_matches_histogram():
+    payload = timing_payloads(1)[0]
+    times_ns = hit_times_ns(payload)
+
+    curve = LightCurve(bin_width_sec=0.01)
+    assert curve.append(payload) == len(times_ns)
+
+    edges = curve.origin_ns + 10_000_000 * np.arange(len(curve) + 1)
+    expected, _ = np.histogram(times_ns, bins=edges)
+
+    np.testing.assert_array_equal(curve.counts, expected)
+    assert curve.counts.sum() == curve.n_hits == len(times_ns)
+    np.testing.assert_allclose(curve.rate()[1], expected / 0.01)
+
+
+# .................................................................................................
+def test_light_curve_incremental_appends_and_pyramid():
+    payloads = timing_payloads()
+
+    # Later messages first, so the grid also grows towards earlier times
+    incremental = LightCurve(bin_width_sec=0.001, levels=4, factor=3)
+    incremental.extend(payloads[::-1])
+
+    batch = LightCurve(bin_width_sec=0.001, origin=incremental.origin_ns)
+    batch.append(np.concatenate([hit_times_ns(p) for p in payloads]))
+
+    assert incremental.origin_ns < hit_times_ns(payloads[0]).min()
+    np.testing.assert_array_equal(incremental.counts, batch.counts)
+
+    for level in range(1, 5):
+        times_ns, counts = incremental.level(level)
+        base = np.pad(incremental.counts, (0, len(counts) * 3 ** level - len(incremental)))
+        np.testing.assert_array_equal(counts, base.reshape(len(counts), -1).sum(axis=1))
+        assert times_ns[0] == incremental.origin_ns
+
+
+# .................................................................................................
+def test_light_curve_zoom_picks_level():
+    curve = LightCurve(bin_width_sec=0.001, levels=6)
+    curve.extend(timing_payloads())
+
+    start, stop = curve.origin_ns, curve.origin_ns + 1_024_000_000
+    times_ns, counts = curve.zoom(start, stop, max_bins=100)
+
+    # 1.024 s at 1 ms needs 1024 bins, the first level with at most 100 is 16 ms
+    assert times_ns[1] - times_ns[0] == 16_000_000
+    assert len(counts) <= 100
+    assert counts.sum() == ((curve.times_ns >= start) & (curve.times_ns < stop)) @ curve.counts
+
+
+# .................................................................................................
+def test_build_light_curves_shares_grid():
+    payloads = timing_payloads()
+    for payload, name in zip(payloads, ["Super-K", "IceCube", "Super-K", "KM3NeT"]):
+        payload["detector_name"] = name
+
+    curves = build_light_curves(payloads, bin_width_sec=0.01)
+
+    assert sorted(curves) == ["IceCube", "KM3NeT", "Super-K"]
+    assert len({c.origin_ns for c in curves.values()}) == 1
+    assert sum(c.n_hits for c in curves.values()) == sum(len(p["timing_series"]) for p in payloads)
+
+    with pytest.raises(ValueError):
+        LightCurve(bin_width_sec=0.0)
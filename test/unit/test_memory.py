@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.memory import allocation_profile, deep_getsizeof, run_memory_benchmarks
+from snews.models.messages import HeartbeatMessage
+
+# Memory budgets per message, with a 10k-hit timing message and 100 significance bins. Raise a
+# budget only together with the change that needs it.
+BUDGETS = {
+    "HeartbeatMessage": {"bytes": 2_500, "blocks": 20},
+    "RetractionMessage": {"bytes": 2_500, "blocks": 20},
+    "TimingTierMessage": {"bytes": 1_000_000, "blocks": 10_100},
+    "SignificanceTierMessage": {"bytes": 6_500, "blocks": 150},
+    "CoincidenceTierMessage": {"bytes": 2_500, "blocks": 20},
+}
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def memory_results():
+    return {r["message_type"]: r for r in run_memory_benchmarks(n_messages=10)}
+
+
+# .................................................................................................
+@pytest.mark.parametrize("message_type", BUDGETS)
+def test_message_memory_budget(memory_results, message_type):
+    result, budget = memory_results[message_type], BUDGETS[message_type]
+
+    assert result["deep_size_bytes"] <= budget["bytes"]
+    assert result["bytes_per_message"] <= budget["bytes"]
+    assert result["blocks_per_message"] <= budget["blocks"]
+
+
+# .................................................................................................
+def test_deep_getsizeof_counts_shared_objects_once():
+    shared = ["x" * 1000]
+    assert deep_getsizeof([shared, shared]) < deep_getsizeof([shared, ["x" * 1000]])
+
+    message = HeartbeatMessage(detector_name="Super-K", detector_status="ON")
+    with_meta = message.with_updates(meta={"blob": "y" * 10_000})
+    assert deep_getsizeof(with_meta) - deep_getsizeof(message) >= 10_000
+
+
+# .................................................................................................
+def test_allocation_profile():
+    profile = allocation_profile(lambda: bytes(10_000), n=100)
+
+    assert 10_000 <= profile["bytes_per_object"] < 10_500
+    assert profile["blocks_per_object"] == pytest.approx(1, abs=0.2)
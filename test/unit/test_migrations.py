@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.__version__ import schema_version
+from snews.data.io import read_json_lines, write_json_lines
+from snews.models.messages import HeartbeatMessage, parse_message
+from snews.models.migrations import MigrationRegistry, upgrade_file
+
+
+# .................................................................................................
+@pytest.fixture
+def migrations():
+    migrations = MigrationRegistry()
+
+    @migrations.register("0.0", "0.1")
+    def rename_detector(payload):
+        payload["detector_name"] = payload.pop("detector")
+        return payload
+
+    @migrations.register("0.1", schema_version)
+    def status_to_upper(payload):
+        payload["detector_status"] = payload["detector_status"].upper()
+        return payload
+
+    # A longer detour that must not be taken
+    migrations.add("0.0", "0.05", lambda p: p)
+    migrations.add("0.05", "0.1", lambda p: p)
+
+    return migrations
+
+
+old_heartbeat = {
+    "tier": "Heartbeat", "detector": "Super-K", "detector_status": "on", "schema_version": "0.0",
+}
+
+
+# .................................................................................................
+def test_migration_chain_is_shortest_and_cached(migrations):
+    chain = migrations.chain("0.0")
+
+    assert [version for version, _ in chain] == ["0.1", schema_version]
+    assert migrations.chain("0.0") is chain
+    assert migrations.chain(schema_version) == []
+
+    with pytest.raises(ValueError, match="No migration path"):
+        migrations.chain(schema_version, "0.0")
+
+
+# .................................................................................................
+def test_upgrade_payload(migrations):
+    upgraded = migrations.upgrade(old_heartbeat)
+
+    assert upgraded["schema_version"] == schema_version
+    assert old_heartbeat["schema_version"] == "0.0"
+    assert isinstance(parse_message(upgraded), HeartbeatMessage)
+
+    unversioned = {"detector_name": "Super-K"}
+    assert migrations.upgrade(unversioned) is unversioned
+
+
+# .................................................................................................
+def test_upgrade_file(tmp_path, migrations):
+    current = HeartbeatMessage(detector_name="Super-K", detector_status="ON")
+    records = [old_heartbeat, current.model_dump(mode="json"), {**old_heartbeat, "detector": "X"}]
+
+    source, destination = tmp_path / "old.jsonl", tmp_path / "new.jsonl"
+    write_json_lines(source, records)
+
+    assert upgrade_file(source, destination, migrations=migrations) == 3
+
+    upgraded = list(read_json_lines(destination))
+    assert [r["schema_version"] for r in upgraded] == [schema_version] * 3
+    assert upgraded[1] == records[1] and upgraded[2]["detector_name"] == "X"
@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 
+# Standard modules
+import subprocess
+import sys
+
 # Third-party modules
 import pytest
+from pydantic import ValidationError
 
 # Local modules
 from snews import models
+from snews.models.messages import (CoincidenceTierMessage, HeartbeatMessage,
+                                   MessageBatch, RetractionMessage,
+                                   TimingTierMessage)
 
 
 # .................................................................................................
@@ -92,3 +100,91 @@ def test_get_message_fields():
     ])
 
     assert fields == expected_fields and req_fields == expected_req_fields
+
+
+# .................................................................................................
+def test_warm_up_message_models():
+    script = (
+        "from snews.models.messages import *\n"
+        "from snews.models.messages import TierMessageBase\n"
+        "class CustomTimingMessage(TimingTierMessage):\n"
+        "    trigger_id: int = 0\n"
+        "assert not HeartbeatMessage.__pydantic_complete__\n"
+        "built = {t.__name__ for t in warm_up_message_models()}\n"
+        "assert {'HeartbeatMessage', 'CustomTimingMessage', 'TierMessageBase'} <= built, built\n"
+        "assert HeartbeatMessage.__pydantic_complete__\n"
+        "assert warm_up_message_models() == {}\n"
+        "CustomTimingMessage(detector_name='Super-K', timing_series=[0], trigger_id=1)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+# .................................................................................................
+def test_message_batch_round_trip():
+    messages = [
+        HeartbeatMessage(detector_name="Super-K", detector_status="ON"),
+        RetractionMessage(detector_name="Super-K", retract_latest_n=1),
+        TimingTierMessage(detector_name="Super-K", timing_series=["2024-01-01T00:00:00Z"]),
+    ]
+    batch = MessageBatch.from_messages(messages)
+    assert batch.detector_name == "Super-K" and batch.is_test is False
+
+    payload = batch.model_dump(mode="json")
+    assert all("detector_name" not in m and "is_test" not in m for m in payload["messages"])
+
+    decoded = MessageBatch.model_validate_json(batch.model_dump_json())
+    assert list(decoded) == messages
+
+
+# .................................................................................................
+def test_message_batch_mixed_detectors_and_errors():
+    batch = MessageBatch.model_validate({
+        "is_test": True,
+        "messages": [
+            {"tier": "Heartbeat", "detector_name": "Super-K", "detector_status": "ON"},
+            {"tier": "Heartbeat", "detector_name": "IceCube", "detector_status": "OFF"},
+        ],
+    })
+    assert [m.detector_name for m in batch] == ["Super-K", "IceCube"]
+    assert all(isinstance(m, HeartbeatMessage) and m.is_test for m in batch)
+
+    with pytest.raises(ValidationError):
+        MessageBatch(detector_name="Super-K", messages=[{"tier": "Unknown"}])
+
+
+# .................................................................................................
+def test_update_validates_fields_together():
+    message = HeartbeatMessage(detector_name="Super-K", detector_status="ON", is_test=True)
+    expected = message.model_copy()
+    expected.sent_time_utc = "2024-01-01T00:00:01Z"
+    expected.meta = {"hop": 1}
+
+    updated = message.with_updates(sent_time_utc="2024-01-01T00:00:01Z", meta={"hop": 1})
+    assert updated == expected and message.meta is None
+    assert message.update(sent_time_utc="2024-01-01T00:00:01Z", meta={"hop": 1}) is message
+    assert message == expected
+
+    # Every invalid value is reported, and nothing is changed
+    with pytest.raises(ValidationError) as error:
+        message.update(detector_status="BROKEN", sent_time_utc="not a time", schema_version="9")
+    assert {e["loc"][0] for e in error.value.errors()} == {
+        "detector_status", "sent_time_utc", "schema_version"
+    }
+    assert message == expected
+
+    with pytest.raises(ValueError):
+        message.update(unknown_field=1)
+
+    # Model validators run on the updated message
+    coincidence = CoincidenceTierMessage(
+        detector_name="Super-K", neutrino_time_utc="2012-06-09T15:31:08.109876Z", is_test=True
+    )
+    with pytest.raises(ValidationError):
+        coincidence.update(is_test=False, meta={"hop": 1})
+    assert coincidence.is_test and coincidence.meta is None
+
+    # Fields set by model validators are restored too when a later one fails
+    constructed = CoincidenceTierMessage.model_construct(**coincidence.model_dump(exclude={"id"}))
+    with pytest.raises(ValidationError):
+        constructed.update(is_test=False)
+    assert constructed.id is None and constructed.is_test
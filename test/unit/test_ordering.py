@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.data.mock import MessageGenerator
+from snews.models.messages import HeartbeatMessage, construct_message
+from snews.pipeline import ReorderBuffer, UuidFilter, reorder
+
+
+# .................................................................................................
+def shuffled_stream(seed=7, max_delay_sec=2.0):
+    """Generated messages, delayed by up to `max_delay_sec` and with some redelivered."""
+    messages = MessageGenerator(seed=seed, start="2024-01-01T00:00:00").stream(
+        duration_sec=300, scale=5, hits_per_burst=10
+    )
+    models = [construct_message(m) for m in messages]
+
+    rng = np.random.default_rng(seed)
+    arrival = [m.sent_time_ns + rng.uniform(0, max_delay_sec) * 1e9 for m in models]
+    delivered = [models[i] for i in np.argsort(arrival, kind="stable")]
+    redelivered = [delivered[i] for i in rng.choice(len(delivered), 20, replace=False)]
+
+    return models, delivered + redelivered
+
+
+# .................................................................................................
+def test_reorder_restores_order_and_drops_duplicates():
+    models, delivered = shuffled_stream()
+
+    ordered = list(reorder(delivered, lateness_sec=2.0))
+
+    expected = sorted(models, key=lambda m: m.sent_time_ns)
+    assert [m.uuid for m in ordered] == [m.uuid for m in expected]
+
+
+# .................................................................................................
+def test_reorder_buffer_drops_late_messages():
+    late = []
+    buffer = ReorderBuffer(lateness_sec=1.0, on_late=late.append)
+
+    def beat(second):
+        return HeartbeatMessage(detector_name="Super-K", detector_status="ON",
+                                sent_time_utc=f"2024-01-01T00:00:{second:02d}")
+
+    assert buffer.push(beat(10)) == []
+    assert [m.sent_time_utc for m in buffer.push(beat(12))] == ["2024-01-01T00:00:10.000000000Z"]
+
+    buffer.push(beat(9))
+    assert len(late) == 1 and buffer.stats()["late"] == 1
+
+    assert len(buffer.flush()) == 1 and len(buffer) == 0
+
+
+# .................................................................................................
+def test_reorder_buffer_bounds_memory():
+    _, delivered = shuffled_stream()
+    buffer = ReorderBuffer(lateness_sec=3600, max_buffered=10)
+
+    released = []
+    for message in delivered:
+        released.extend(buffer.push(message))
+        assert len(buffer) <= 10
+
+    released.extend(buffer.flush())
+    times = [m.sent_time_ns for m in released]
+    assert times == sorted(times)
+
+
+# .................................................................................................
+def test_reorder_buffer_by_neutrino_time():
+    with pytest.raises(ValueError):
+        ReorderBuffer(time_field="uuid")
+
+    buffer = ReorderBuffer(time_field="neutrino_time_utc")
+    message = construct_message({
+        "tier": "CoincidenceTier", "uuid": "a", "detector_name": "Super-K",
+        "sent_time_utc": "2024-01-01T00:00:10Z", "neutrino_time_utc": "2024-01-01T00:00:05Z",
+    })
+    assert buffer.timestamp_ns(message) == message.neutrino_time_ns
+
+
+# .................................................................................................
+def test_reorder_buffer_rejected_message_is_not_a_duplicate():
+    buffer = ReorderBuffer()
+    message = construct_message({"tier": "Heartbeat", "uuid": "a", "detector_name": "Super-K"})
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="has no"):
+            buffer.push(message)
+
+    assert buffer.stats()["duplicates"] == 0
+
+
+# .................................................................................................
+def test_uuid_filter_rotates():
+    uuid_filter = UuidFilter(capacity=100, error_rate=1e-6)
+
+    assert not any(uuid_filter.add(str(i)) for i in range(100))
+    assert all(str(i) in uuid_filter for i in range(100))
+
+    # A full generation later, the first uuids are forgotten
+    for i in range(100, 300):
+        uuid_filter.add(str(i))
+
+    assert "0" not in uuid_filter and "299" in uuid_filter
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import json
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data.io import iter_payloads, shard_boundaries
+from snews.data.mock import MessageGenerator
+from snews.models.messages import HeartbeatMessage, parse_message
+from snews.pipeline import validate_archive
+
+
+# .................................................................................................
+@pytest.fixture(scope="module")
+def messages():
+    generator = MessageGenerator(seed=7, start="2024-01-01T00:00:00")
+    messages = generator.stream(duration_sec=600, scale=10, hits_per_burst=20)
+
+    # Corrupt a few records
+    messages[3]["detector_status"] = "MAYBE"
+    messages[10]["tier"] = "Unknown"
+    del messages[-1]["detector_name"]
+
+    return messages
+
+
+@pytest.fixture(scope="module", params=["jsonl", "binary"])
+def archive(request, tmp_path_factory, messages):
+    filepath = tmp_path_factory.mktemp("archive") / f"messages.{request.param}"
+    MessageGenerator.write(filepath, messages, format=request.param)
+    return filepath
+
+
+# .................................................................................................
+def test_parse_message_dispatches_on_tier():
+    message = parse_message('{"tier": "Heartbeat", "detector_name": "Super-K", '
+                            '"detector_status": "ON"}')
+    assert isinstance(message, HeartbeatMessage)
+
+    with pytest.raises(ValueError) as exc_info:
+        parse_message({"tier": "Unknown"})
+    assert "Unknown message tier" in str(exc_info.value)
+
+
+# .................................................................................................
+@pytest.mark.parametrize("n_shards", [1, 2, 5, 1000])
+def test_shards_cover_every_record_once(archive, messages, n_shards):
+    shards = shard_boundaries(archive, n_shards)
+    payloads = [p for start, end in shards for p in iter_payloads(archive, start, end)]
+
+    assert len(shards) <= n_shards
+    assert [json.loads(p) for p in payloads] == messages
+
+
+# .................................................................................................
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_archive_reports_errors_in_order(archive, messages, workers):
+    report = validate_archive(archive, workers=workers, shards=4)
+
+    assert report.total == len(messages)
+    assert [i for i, _ in report.errors] == [3, 10, len(messages) - 1]
+    assert "Detector status must be either ON or OFF" in report.errors[0][1]
+    assert "Unknown message tier" in report.errors[1][1]
+    assert "detector_name" in report.errors[2][1]
+    assert report.payloads is None
+
+
+# .................................................................................................
+def test_validate_archive_keeps_payloads_in_order(archive, messages):
+    report = validate_archive(archive, workers=2, shards=3, keep_payloads=True)
+    valid = [m for i, m in enumerate(messages) if i not in {3, 10, len(messages) - 1}]
+
+    assert report.valid == len(valid) == len(report.payloads)
+    assert [json.loads(p)["uuid"] for p in report.payloads] == [m["uuid"] for m in valid]
+
+
+# .................................................................................................
+@pytest.mark.parametrize("tail", [b"\x10\x00", b"\x10\x00\x00\x00{}"], ids=["header", "payload"])
+def test_truncated_binary_records_raise(tmp_path, messages, tail):
+    filepath = tmp_path / "messages.binary"
+    MessageGenerator.write(filepath, messages[:3], format="binary")
+    with open(filepath, "ab") as f:
+        f.write(tail)
+
+    with pytest.raises(ValueError, match="Truncated record"):
+        list(iter_payloads(filepath))
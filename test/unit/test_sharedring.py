@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import subprocess
+import sys
+
+# Third-party modules
+import pytest
+
+# Local modules
+from snews.data.mock import MessageGenerator
+from snews.models.messages import Tier, construct_message
+from snews.pipeline import SharedMessageRing
+
+
+# .................................................................................................
+def make_messages(n=20):
+    generator = MessageGenerator(seed=5, start="2024-01-01T00:00:00")
+    payloads = generator.stream(duration_sec=600, scale=5, hits_per_burst=10)[:n]
+    return [construct_message(p) for p in payloads]
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMessageRing.create(slots=8, slot_size=8192)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+# .................................................................................................
+def test_ring_round_trips_messages_with_header(ring):
+    messages = make_messages(5)
+    reader = ring.reader(start=0)
+    sequences = [ring.publish(m) for m in messages]
+
+    assert sequences == list(range(5))
+    assert len(reader) == 5
+
+    records = reader.poll()
+    assert [r.sequence for r in records] == sequences
+    for record, message in zip(records, messages):
+        assert record.tier == message.tier
+        assert record.time_ns == (message.machine_time_ns or message.sent_time_ns)
+        assert bytes(record.payload) == message.to_json()
+        assert record.message().model_dump() == message.model_dump()
+        assert record.valid
+
+    assert reader.poll() == []
+    assert ring.read(ring.next_sequence) is None
+
+
+# .................................................................................................
+def test_reader_skips_overwritten_messages(ring):
+    messages = make_messages(20)
+    reader = ring.reader(start=0)
+    first = ring.publish(messages[0])
+    record = reader.poll()[0]
+
+    for message in messages[1:]:
+        ring.publish(message)
+
+    assert not record.valid
+    with pytest.raises(LookupError):
+        record.payload_bytes()
+    with pytest.raises(LookupError):
+        ring.read(first)
+
+    records = reader.poll()
+    assert reader.lost == 20 - 1 - ring.slots
+    assert [r.sequence for r in records] == list(range(20 - ring.slots, 20))
+    assert len(ring) == ring.slots
+
+
+# .................................................................................................
+def test_ring_rejects_oversized_messages_and_foreign_segments(ring):
+    generator = MessageGenerator(seed=5, start="2024-01-01T00:00:00")
+    sent_ns = generator.start_ns + 10**9 * generator.rng.integers(1, 60, size=1)
+    burst = construct_message(generator.timing_bursts(sent_ns, hits_per_burst=1000)[0])
+
+    with pytest.raises(ValueError, match="does not fit"):
+        ring.publish(burst)
+    assert ring.next_sequence == 0
+
+    ring._buffer[:8] = b"NOTARING"
+    with pytest.raises(ValueError, match="not a message ring"):
+        SharedMessageRing.attach(ring.name)
+
+
+# .................................................................................................
+def test_reader_in_another_process(ring):
+    messages = make_messages(5)
+    for message in messages:
+        ring.publish(message)
+
+    script = (
+        "from snews.pipeline import SharedMessageRing\n"
+        f"with SharedMessageRing.attach({ring.name!r}) as ring:\n"
+        "    for record in ring.reader(start=0).poll():\n"
+        "        print(record.tier.value, record.message().uuid)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines() == [f"{m.tier.value} {m.uuid}" for m in messages]
+    assert result.stderr == ""
+    assert Tier(result.stdout.split()[0]) == messages[0].tier
+
+
+# .................................................................................................
+def assert_removed_when_writer_dies(script):
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+    assert "leaked shared_memory" in result.stderr
+    with pytest.raises(FileNotFoundError):
+        SharedMessageRing.attach(result.stdout.strip())
+
+
+# .................................................................................................
+def test_segment_is_removed_when_writer_dies_after_spawned_reader():
+    # A spawned reader shares the tracker of the writer, which must still clean up the segment
+    assert_removed_when_writer_dies(
+        "import multiprocessing, os\n"
+        "from snews.pipeline import SharedMessageRing\n"
+        "ring = SharedMessageRing.create(slots=1)\n"
+        "context = multiprocessing.get_context('spawn')\n"
+        "reader = context.Process(target=SharedMessageRing.attach, args=(ring.name, True))\n"
+        "reader.start()\n"
+        "reader.join()\n"
+        "print(ring.name, flush=True)\n"
+        "os._exit(1)\n"
+    )
+
+
+# .................................................................................................
+def test_segment_is_removed_when_writer_dies_after_forked_reader():
+    # The reader is forked with the tracker already running, before the ring exists
+    assert_removed_when_writer_dies(
+        "import multiprocessing, os\n"
+        "from multiprocessing import resource_tracker\n"
+        "from snews.pipeline import SharedMessageRing\n"
+        "resource_tracker.ensure_running()\n"
+        "context = multiprocessing.get_context('fork')\n"
+        "names = context.SimpleQueue()\n"
+        "reader = context.Process(\n"
+        "    target=lambda: SharedMessageRing.attach(names.get(), track=True).close()\n"
+        ")\n"
+        "reader.start()\n"
+        "ring = SharedMessageRing.create(slots=1)\n"
+        "names.put(ring.name)\n"
+        "reader.join()\n"
+        "print(ring.name, flush=True)\n"
+        "os._exit(1)\n"
+    )
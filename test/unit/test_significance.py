@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import math
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.analysis import (
+    SignificanceAggregator,
+    fisher_combine,
+    norm_isf,
+    norm_sf,
+    stouffer_combine,
+)
+from snews.data.mock import MessageGenerator
+from snews.models.messages import SignificanceTierMessage
+
+START = "2024-01-01T00:00:00.000000000Z"
+
+
+# .................................................................................................
+def significance(detector_name, p_values, t_bin_width_sec, machine_time_utc=START):
+    return SignificanceTierMessage(
+        detector_name=detector_name,
+        machine_time_utc=machine_time_utc,
+        p_values=p_values,
+        t_bin_width_sec=t_bin_width_sec,
+        is_test=True,
+    )
+
+
+# .................................................................................................
+def test_normal_functions():
+    assert norm_isf(0.025) == pytest.approx(1.959963985, rel=1e-8)
+    assert norm_isf(0.5) == pytest.approx(0.0, abs=1e-12)
+    assert norm_isf(2.866515719e-7) == pytest.approx(5.0, rel=1e-8)
+
+    z = np.array([-2.0, 0.0, 1.0, 5.0])
+    np.testing.assert_allclose(norm_isf(norm_sf(z)), z, atol=1e-8)
+
+    # Tails keep their relative precision
+    z = np.linspace(-10.0, 37.0, 1001)
+    expected = [0.5 * math.erfc(v / math.sqrt(2.0)) for v in z]
+    np.testing.assert_allclose(norm_sf(z), expected, rtol=1e-12)
+
+    assert np.isfinite(norm_isf([0.0, 1.0])).all()
+    assert norm_isf(1.0) < -8.0
+
+
+# .................................................................................................
+def test_combination_methods():
+    p = np.array([[0.05, 0.3, np.nan], [0.05, np.nan, np.nan]])
+
+    p_fisher, n = fisher_combine(p)
+    product = 0.05 * 0.05
+    assert p_fisher[0] == pytest.approx(product * (1 - np.log(product)))
+    assert p_fisher[1] == pytest.approx(0.3)
+    assert np.isnan(p_fisher[2])
+    assert n.tolist() == [2, 1, 0]
+
+    p_stouffer, _ = stouffer_combine(p)
+    assert p_stouffer[0] == pytest.approx(norm_sf(2 * norm_isf(0.05) / np.sqrt(2)))
+    assert p_stouffer[1] == pytest.approx(0.3)
+    assert np.isnan(p_stouffer[2])
+
+
+# .................................................................................................
+def test_combination_of_p_equal_to_one():
+    with np.errstate(all="raise"):
+        p_stouffer, _ = stouffer_combine([[1.0], [0.5]])
+        p_fisher, _ = fisher_combine([[1.0], [0.5]])
+
+        aggregator = SignificanceAggregator(bin_width_sec=0.5)
+        aggregator.add(significance("Super-K", [1.0, 0.01], 0.5))
+        aggregator.add(significance("IceCube", [0.5, 0.5], 0.5))
+        _, p_aggregated, _ = aggregator.combine("stouffer")
+
+    assert 0.5 < p_stouffer[0] <= 1.0
+    assert p_fisher[0] == pytest.approx(0.5 * (1 - np.log(0.5)))
+    assert np.isfinite(p_aggregated).all() and p_aggregated[0] > 0.5
+
+
+# .................................................................................................
+def test_aggregator_resamples_onto_common_grid():
+    aggregator = SignificanceAggregator(bin_width_sec=0.01)
+
+    # Finer bins are Šidák corrected, coarser bins cover several grid bins
+    aggregator.add(significance("Super-K", [0.5, 0.1, 0.4, 0.9], 0.005))
+    aggregator.add(significance("IceCube", [0.2], 0.02).model_dump())
+
+    assert aggregator.detectors == ["Super-K", "IceCube"]
+    np.testing.assert_allclose(aggregator.matrix, [[1 - 0.9 ** 2, 1 - 0.6 ** 2], [0.2, 0.2]])
+
+    times_ns, p_combined, n_detectors = aggregator.combine("fisher")
+    assert times_ns[1] - times_ns[0] == 10_000_000
+    assert n_detectors.tolist() == [2, 2]
+    assert p_combined[1] == pytest.approx(fisher_combine(aggregator.matrix)[0][1])
+
+
+# .................................................................................................
+def test_aggregator_updates_incrementally():
+    messages = MessageGenerator(seed=3, start="2024-01-01T00:00:00").significance_series(
+        sent_ns=np.arange(6) * 10**8, n_bins=20, t_bin_width_sec=0.01
+    )
+    for i, message in enumerate(messages):
+        message["machine_time_utc"] = message["sent_time_utc"]
+        message["detector_name"] = ["Super-K", "IceCube", "KamLAND"][i % 3]
+
+    incremental = SignificanceAggregator(bin_width_sec=0.02)
+    for message in messages[::-1]:
+        incremental.add(message)
+        incremental.combine("stouffer")
+
+    batch = SignificanceAggregator(bin_width_sec=0.02, origin=messages[0]["machine_time_utc"])
+    batch.add_many(messages[::-1])
+
+    for method in ("fisher", "stouffer"):
+        expected, actual = batch.combine(method), incremental.combine(method)
+        for a, b in zip(expected, actual):
+            np.testing.assert_allclose(a, b)
+
+    batch.drop_before(batch.times_ns[10])
+    assert len(batch) == len(incremental) - 10
+    np.testing.assert_allclose(
+        batch.combine("stouffer")[1], incremental.combine("stouffer")[1][10:]
+    )
+
+
+# .................................................................................................
+def test_aggregator_requires_machine_time():
+    with pytest.raises(ValueError):
+        SignificanceAggregator(bin_width_sec=0.01).add(
+            {"detector_name": "Super-K", "p_values": [0.5], "t_bin_width_sec": 0.01}
+        )
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import pytest
+
+# Local modules
+from snews.data import detectors
+from snews.data.spatial import DetectorIndex, EARTH_RADIUS_KM
+from snews.models.detectors import DetectorType
+
+
+# .................................................................................................
+@pytest.fixture
+def index():
+    base = detectors.all[0].model_dump()
+    sites = [
+        ("A", DetectorType.WATER_CERENKOV, 30.0, 0.0, 0.0, 0.0),
+        ("B", DetectorType.LIQUID_SCINTILLATOR, 1.0, 0.0, 1.0, 1000.0),
+        ("C", DetectorType.WATER_CERENKOV, 100.0, 0.0, 90.0, 2000.0),
+        ("D", DetectorType.LIQUID_ARGON, 40.0, 90.0, 0.0, 1500.0),
+    ]
+
+    return DetectorIndex([
+        detectors.all[0].model_validate({
+            **base, "name": name, "type": kind, "mass_kt": mass,
+            "latitude": lat, "longitude": lon, "depth_meters": depth,
+        })
+        for name, kind, mass, lat, lon, depth in sites
+    ])
+
+
+# .................................................................................................
+def test_detector_index_is_built_from_detector_data():
+    assert len(detectors.index) == len(detectors.all)
+    assert detectors.index["Super-K"] is detectors.all[0]
+
+
+# .................................................................................................
+def test_detector_index_distances(index):
+    quarter = np.pi / 2 * EARTH_RADIUS_KM
+
+    assert np.allclose(index.distances(0.0, 0.0), [0, quarter / 90, quarter, quarter])
+    assert np.allclose(index.pairwise()[2, 3], quarter)
+
+    chord = index.distances(0.0, 0.0, kind="chord")
+    assert np.isclose(chord[2], np.hypot(EARTH_RADIUS_KM, EARTH_RADIUS_KM - 2.0))
+    assert np.allclose(index.pairwise("chord"), index.pairwise("chord").T)
+
+    with pytest.raises(ValueError):
+        index.distances(0.0, 0.0, kind="manhattan")
+
+
+# .................................................................................................
+def test_detector_index_queries(index):
+    assert [name for name, _ in index.within(0.0, 0.0, radius_km=200)] == ["A", "B"]
+    assert [name for name, _ in index.nearest(0.0, 80.0, n=2)] == ["C", "B"]
+
+    assert index.nearest(0.0, 0.0, n=5, type="Water Cerenkov", min_mass_kt=50)[0][0] == "C"
+    types = [DetectorType.LIQUID_ARGON, DetectorType.LIQUID_SCINTILLATOR]
+    assert index.within(0.0, 0.0, radius_km=1e5, type=types, max_mass_kt=10) == [
+        ("B", pytest.approx(111.2, abs=0.1))
+    ]
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Standard modules
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-party modules
+import pytest
+from pydantic import ValidationError
+
+# Local modules
+from snews.data.io import encode_record
+from snews.data.mock import MessageGenerator
+from snews.pipeline import validate_stream
+
+
+# .................................................................................................
+class FakeSource:
+    """In-memory async frame source that records how many frames have been pulled."""
+
+    def __init__(self, frames, delay=0.0, pause_after=None, pause=0.0):
+        self.frames = frames
+        self.delay = delay
+        self.pause_after = pause_after
+        self.pause = pause
+        self.pulled = 0
+
+    async def __aiter__(self):
+        for i, frame in enumerate(self.frames):
+            if i == self.pause_after:
+                await asyncio.sleep(self.pause)
+            await asyncio.sleep(self.delay)
+            self.pulled += 1
+            yield frame
+
+
+def make_frames(n=50):
+    generator = MessageGenerator(seed=11, start="2024-01-01T00:00:00")
+    messages = generator.stream(duration_sec=600, scale=5, hits_per_burst=10)[:n]
+    return [encode_record(m) for m in messages]
+
+
+async def collect(stream):
+    return [message async for message in stream]
+
+
+# .................................................................................................
+def test_stream_yields_typed_messages_in_order():
+    frames = make_frames()
+    messages = asyncio.run(collect(validate_stream(FakeSource(frames), batch_size=8)))
+
+    assert [m.uuid for m in messages] == [json.loads(f)["uuid"] for f in frames]
+    assert [m.tier.value for m in messages] == [json.loads(f)["tier"] for f in frames]
+
+
+# .................................................................................................
+def test_stream_flushes_partial_batch_after_max_latency():
+    frames = make_frames(6)
+    source = FakeSource(frames, pause_after=3, pause=1.0)
+
+    async def first_three():
+        received = []
+        async for message in validate_stream(source, batch_size=100, max_latency=0.01):
+            received.append(message)
+            if len(received) == 3:
+                return received, source.pulled
+
+    received, pulled = asyncio.run(first_three())
+    assert len(received) == 3 and pulled == 3
+
+
+# .................................................................................................
+def test_stream_applies_backpressure():
+    frames = make_frames(200)
+    source = FakeSource(frames)
+
+    async def slow_consumer():
+        pulled = []
+        async for _ in validate_stream(source, batch_size=5, max_pending=2):
+            await asyncio.sleep(0.01)
+            pulled.append(source.pulled)
+            if len(pulled) == 5:
+                break
+        return pulled
+
+    pulled = asyncio.run(slow_consumer())
+    # The queue, the batch being consumed, the batch being submitted and the one being filled
+    assert max(pulled) <= (2 + 3) * 5
+
+
+# .................................................................................................
+def test_stream_invalid_frames_raise_or_are_reported():
+    frames = make_frames(10)
+    frames[4] = b'{"tier": "Heartbeat", "detector_name": "Super-K", "detector_status": "OK"}'
+
+    with pytest.raises(ValidationError):
+        asyncio.run(collect(validate_stream(FakeSource(frames), batch_size=3)))
+
+    errors = []
+    messages = asyncio.run(collect(validate_stream(
+        FakeSource(frames), batch_size=3, on_error=lambda frame, e: errors.append(frame),
+    )))
+    assert len(messages) == 9 and errors == [frames[4]]
+
+
+# .................................................................................................
+def test_stream_validates_in_worker_processes():
+    frames = make_frames(20)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        messages = asyncio.run(collect(
+            validate_stream(FakeSource(frames), batch_size=4, executor=executor)
+        ))
+
+    assert [m.uuid for m in messages] == [json.loads(f)["uuid"] for f in frames]
@@ -4,7 +4,10 @@ import numpy as np
 import pytest
 
 from snews.data.utilities import num_leap_seconds_between
-from snews.models.timing import PrecisionTimestamp
+from snews.models.timing import (PrecisionTimestamp, convert_time_scale,
+                                 format_timestamp, gps_to_utc, tai_to_utc,
+                                 tai_utc_offset, timestamp_to_ns,
+                                 timestamps_to_ns, utc_to_gps, utc_to_tai)
 
 
 def test_precision_timestamp_input_string():
@@ -48,6 +51,61 @@ def test_precision_timestamp_datetime_output():
     )
 
 
+def test_precision_timestamp_datetime_output_truncates_to_precision():
+    t = PrecisionTimestamp(timestamp="2016-12-31T23:59:59.123456789Z")
+    assert t.to_datetime() == datetime.datetime.fromisoformat("2016-12-31T23:59:59.123456+00:00")
+
+    t = PrecisionTimestamp(timestamp="2016-12-31T23:59:59.123456789Z", precision="ms")
+    assert t.to_datetime() == datetime.datetime.fromisoformat("2016-12-31T23:59:59.123+00:00")
+
+
+def test_precision_timestamp_ns():
+    t = PrecisionTimestamp(timestamp="1970-01-01T00:00:01.000000001Z")
+    assert t.to_ns() == 1_000_000_001
+
+    # Beyond the range of datetime64[ns]
+    t = PrecisionTimestamp(timestamp=np.datetime64("0001-01-01", "s"))
+    assert t.to_ns() == -62135596800 * 10**9
+
+
+def test_precision_timestamp_comparisons():
+    t1 = PrecisionTimestamp(timestamp="2017-01-01T00:00:00Z")
+    t2 = PrecisionTimestamp(timestamp="2017-01-01T00:00:00.000000001Z")
+    t3 = PrecisionTimestamp(timestamp=datetime.datetime(2017, 1, 1, tzinfo=datetime.UTC))
+
+    assert t1 < t2 and t2 > t1 and t1 <= t3 and t1 >= t3
+    assert t1 == t3 and t1 != t2
+    assert sorted([t2, t1]) == [t1, t2]
+    assert len({t1, t2, t3}) == 2
+    assert t1 != "2017-01-01T00:00:00Z"
+
+    with pytest.raises(TypeError):
+        t1 < "2017-01-01T00:00:00Z"
+
+
+def test_precision_timestamp_cache_cleared_on_assignment():
+    t = PrecisionTimestamp(timestamp="2017-01-01T00:00:00Z")
+    assert str(t) == "2017-01-01T00:00:00.000000000Z"
+
+    t.timestamp = "2018-01-01T00:00:00Z"
+    assert str(t) == "2018-01-01T00:00:00.000000000Z"
+    assert t.to_datetime().year == 2018
+
+    copy = t.model_copy()
+    copy.precision = "s"
+    assert str(copy) == "2018-01-01T00:00:00Z"
+    assert str(t) == "2018-01-01T00:00:00.000000000Z"
+
+
+def test_timestamp_to_ns():
+    assert timestamp_to_ns("1970-01-01T00:00:01Z") == 10**9
+    assert timestamp_to_ns(datetime.datetime(1970, 1, 1, 1, tzinfo=datetime.UTC)) == 3600 * 10**9
+    assert timestamp_to_ns(5) == 5
+    assert timestamps_to_ns(["1970-01-01T00:00:01Z", "1970-01-01T00:00:02"]).tolist() == [
+        10**9, 2 * 10**9
+    ]
+
+
 def test_precision_timestamp_tzinfo_conversion():
     timestamp = datetime.datetime(
         1987, 2, 24, 5, 31, 00,
@@ -67,3 +125,67 @@ def test_precision_timestamp_incompatible_subtraction():
         PrecisionTimestamp(timestamp="1987-02-24T05:31:00Z") - 1
 
     assert "Unsupported operand type(s)" in str(exc_info.value)
+
+
+def test_tai_utc_offset_steps_at_leap_seconds():
+    assert tai_utc_offset(np.datetime64("1970-01-01T00:00:00")) == 10
+    assert tai_utc_offset(np.datetime64("2016-12-31T23:59:59.999999999")) == 36
+    assert tai_utc_offset(np.datetime64("2017-01-01T00:00:00")) == 37
+
+
+def test_convert_time_scale_scalars():
+    t = np.datetime64("2017-01-01T00:00:00", "ns")
+
+    assert utc_to_tai(t) == np.datetime64("2017-01-01T00:00:37", "ns")
+    assert utc_to_gps(t) == np.datetime64("2017-01-01T00:00:18", "ns")
+    assert tai_to_utc(utc_to_tai(t)) == t
+    assert gps_to_utc(utc_to_gps(t)) == t
+    assert utc_to_gps(np.datetime64("1980-01-06T00:00:00")) == np.datetime64("1980-01-06")
+
+    ns = int(t.astype(np.int64))
+    assert utc_to_tai(ns) == ns + 37_000_000_000 and isinstance(utc_to_tai(ns), int)
+
+
+def test_convert_time_scale_arrays_roundtrip():
+    utc = np.arange(
+        np.datetime64("1970-01-01"), np.datetime64("2030-01-01"), np.timedelta64(999_999, "s")
+    ).astype("datetime64[ns]")
+
+    for scale in ("tai", "gps"):
+        converted = convert_time_scale(utc, "utc", scale)
+        assert converted.shape == utc.shape
+        assert np.array_equal(convert_time_scale(converted, scale, "utc"), utc)
+
+    assert np.array_equal(
+        convert_time_scale(utc_to_tai(utc), "tai", "gps"), utc_to_gps(utc)
+    )
+
+
+def test_convert_time_scale_across_leap_second():
+    utc = np.array(["2016-12-31T23:59:59.5", "2017-01-01T00:00:00.5"], dtype="datetime64[ns]")
+    tai = utc_to_tai(utc)
+
+    # Half a second of UTC straddling the leap second is 2 s of TAI
+    assert tai[1] - tai[0] == np.timedelta64(2, "s")
+
+
+def test_convert_time_scale_unknown_scale():
+    with pytest.raises(ValueError) as exc_info:
+        convert_time_scale(0, "utc", "tt")
+
+    assert "Unsupported time scale" in str(exc_info.value)
+
+
+def test_precision_timestamp_time_scales():
+    t = PrecisionTimestamp(timestamp="2017-01-01T00:00:00Z")
+
+    assert t.to_scale("gps") == np.datetime64("2017-01-01T00:00:18", "ns")
+    assert str(PrecisionTimestamp.from_scale(t.to_scale("tai"), "tai")) == str(t)
+
+
+def test_format_timestamp_normalized_input():
+    assert format_timestamp("2024-02-29T00:00:00.000000001Z") == "2024-02-29T00:00:00.000000001Z"
+    assert format_timestamp("2024-02-29T00:00:00.000000001Z", "s") == "2024-02-29T00:00:00Z"
+
+    with pytest.raises(ValueError):
+        format_timestamp("2023-02-29T00:00:00.000000001Z")